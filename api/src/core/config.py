@@ -25,6 +25,26 @@ class Settings(BaseSettings):
         False  # Whether to allow saving combined voices locally
     )
 
+    # Inference Executor Settings
+    inference_workers: int = 1  # Worker threads running model inference off the event loop
+    inference_queue_size: int = 4  # Audio chunks a worker may produce ahead of its consumer
+    enable_shortest_job_first: bool = False  # Run the shortest waiting chunk next once all workers are busy (reorders only, no batching)
+    stream_lookahead_chunks: int = 2  # Chunks each streaming stage may run ahead of the next
+    chunk_slots: int | None = None  # Text chunks from all requests that may be in inference at once (None = inference_workers, so the scheduler decides every chunk's turn)
+    scheduler_priority_weights: dict[str, float] = {
+        "interactive": 4.0,
+        "batch": 1.0,
+    }  # Share of inference slots per priority class under contention
+    scheduler_interactive_max_chars: int = 500  # Requests up to this long default to "interactive"
+    scheduler_underrun_margin_s: float = 2.0  # Streams with less audio buffered are served earliest-deadline-first
+    writer_pool_spares: int = 2  # Pre-opened audio writers kept ready per format (0 disables)
+    writer_pool_formats: list[str] = ["mp3", "wav"]  # Formats to open writers for at startup
+
+    # Model Backend Settings
+    model_backend: str = "kokoro_v1"  # "kokoro_v1", or "stub" for synthetic audio without model weights
+    stub_token_delay_ms: float = 0.0  # Compute time the stub backend spends per phoneme (~20 matches Kokoro on CPU)
+    stub_delay_mode: str = "sleep"  # How the stub spends it: "sleep", or "busy" to burn CPU
+
     # Container absolute paths
     model_dir: str = "/app/api/src/models"  # Absolute path in container
     voices_dir: str = "/app/api/src/voices/v1_0"  # Absolute path in container
@@ -35,14 +55,36 @@ class Settings(BaseSettings):
     # FlashSR Settings
     enable_flashsr: bool = True  # Enable audio super-resolution (24kHz -> 48kHz)
     flashsr_output_sample_rate: int = 48000  # Output sample rate after super-resolution
+    flashsr_providers: list[str] = [
+        "CPUExecutionProvider"
+    ]  # ONNX Runtime execution providers for FlashSR, in priority order
+    flashsr_intra_op_threads: int = 0  # Threads within a FlashSR op (0 = ONNX Runtime default)
+    flashsr_inter_op_threads: int = 0  # Threads across FlashSR ops (0 = ONNX Runtime default)
+    flashsr_batch_size: int = 4  # Maximum segments stacked into one FlashSR call
+    flashsr_batch_wait_ms: float = 2.0  # Time a FlashSR call waits for others to join its batch
+    flashsr_segment_seconds: float = 5.0  # Segment length fed to FlashSR
+    flashsr_overlap_ms: float = 50.0  # Crossfade between adjacent FlashSR segments
+    flashsr_workers: int = 2  # Threads running FlashSR, separate from model inference
+    flashsr_queue_size: int = 4  # FlashSR jobs that may wait for a worker
+    flashsr_fallback: str = (
+        "polyphase"  # When FlashSR is saturated: "polyphase" 48kHz upsample, or "wait"
+    )
     # Text Processing Settings
     target_min_tokens: int = 175  # Target minimum tokens per chunk
     target_max_tokens: int = 250  # Target maximum tokens per chunk
     absolute_max_tokens: int = 450  # Absolute maximum tokens per chunk
     advanced_text_normalization: bool = True  # Preproesses the text before misiki
+    smart_split_window_chars: int = 2000  # Text normalized ahead of the current chunk (0 = whole text)
+    phoneme_cache_size: int = 4096  # Phonemized sentences kept in memory (0 disables)
+    phoneme_native_generation: bool = (
+        False  # Feed smart_split phonemes straight to the model instead of re-running G2P
+    )
     voice_weight_normalization: bool = (
         True  # Normalize the voice weights so they add up to 1
     )
+    voice_blend_cache_dir: str | None = (
+        None  # If set, blended voices are persisted here by content hash
+    )
 
     gap_trim_ms: int = (
         1  # Base amount to trim from streaming chunk ends in milliseconds
@@ -55,6 +97,34 @@ class Settings(BaseSettings):
         ",": 0.8,
     }
 
+    # Response Cache Settings
+    enable_response_cache: bool = False  # Serve repeated /v1/audio/speech requests from cache
+    response_cache_memory_mb: float = 64.0  # Size of the in-memory tier
+    response_cache_dir: str | None = None  # Directory of the on-disk tier (None disables it)
+    response_cache_disk_mb: float = 1024.0  # Size cap of the on-disk tier
+
+    # Sentence Cache Settings
+    sentence_cache_mb: float = 0.0  # Trimmed chunk audio reused across requests (0 disables)
+    sentence_cache_dir: str | None = None  # Directory evicted chunk audio spills to (None disables)
+    sentence_cache_disk_mb: float = 1024.0  # Size cap of the spill directory
+
+    # Admission Control Settings
+    enable_admission_control: bool = False  # Reject /v1/audio/speech with 429 when the backlog is too long
+    admission_max_completion_s: float = 30.0  # Longest estimated time to finish a newly admitted request
+
+    # Request Coalescing Settings
+    enable_request_coalescing: bool = False  # Attach identical concurrent /v1/audio/speech requests to one generation
+
+    # Cancellation Settings
+    disconnect_poll_interval_s: float = 0.25  # How often to check whether a client is still connected
+
+    # Resumable Stream Settings
+    enable_resumable_streams: bool = False  # Give streamed /v1/audio/speech responses an X-Stream-Id to resume by
+    resumable_stream_grace_s: float = 60.0  # How long a stream keeps generating and buffering with no client
+    resumable_stream_memory_kb: float = 1024.0  # Newest encoded output kept in memory per stream
+    resumable_stream_dir: str | None = None  # Directory older output spills to (None keeps only the memory window)
+    resumable_stream_disk_mb: float = 64.0  # Size cap of one stream's spill file
+
     # Web Player Settings
     enable_web_player: bool = True  # Whether to serve the web player UI
     web_player_path: str = "web"  # Path to web player static files
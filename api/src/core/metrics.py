@@ -0,0 +1,333 @@
+"""Prometheus-style metrics with text exposition."""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Default latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Render a label set as {name="value",...}."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    """Base class for metrics with optional labels."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.family = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+
+    def labels(self, **labels: str) -> "_Metric":
+        """Get the child metric for a label set."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._new_child()
+                self._children[key] = child
+            return child
+
+    def _new_child(self) -> "_Metric":
+        return type(self)(self.name, self.documentation)
+
+    def _label_sets(self) -> Iterator[Tuple[Dict[str, str], "_Metric"]]:
+        """Iterate (labels, metric) pairs holding values."""
+        if not self.labelnames:
+            yield {}, self
+            return
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            yield dict(zip(self.labelnames, key)), child
+
+    @abstractmethod
+    def samples(self) -> List[Sample]:
+        """Get the metric's current samples.
+
+        Returns:
+            List of (sample name, labels, value) tuples
+        """
+        pass
+
+
+class Counter(_Metric):
+    """Monotonically increasing value."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.family = f"{name}_total"
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        with self._lock:
+            self._value += amount
+
+    def samples(self) -> List[Sample]:
+        return [
+            (self.family, labels, child._value)
+            for labels, child in self._label_sets()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    def samples(self) -> List[Sample]:
+        return [(self.name, labels, child._value) for labels, child in self._label_sets()]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in cumulative buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts = [0] * len(self.buckets)
+        self._sum = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets[:-1])
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        with self._lock:
+            self._sum += value
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+                    break
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of a block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self) -> List[Sample]:
+        samples = []
+        for labels, child in self._label_sets():
+            with child._lock:
+                counts = list(child._counts)
+                total = child._sum
+            cumulative = 0
+            for bound, count in zip(child.buckets, counts):
+                cumulative += count
+                samples.append(
+                    (
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            samples.append((f"{self.name}_count", labels, cumulative))
+            samples.append((f"{self.name}_sum", labels, total))
+        return samples
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric to the registry."""
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(
+        self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Sample]]]]
+    ) -> None:
+        """Add a callback producing (name, type, help, samples) at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        families = [
+            (metric.family, metric.type_name, metric.documentation, metric.samples())
+            for metric in self._metrics
+        ]
+        for collector in self._collectors:
+            try:
+                families.extend(collector())
+            except Exception:
+                # A broken collector must not take down the whole scrape
+                continue
+
+        lines = []
+        for name, type_name, documentation, samples in families:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {type_name}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def timed_iter(iterable: Iterable, histogram: Histogram) -> Iterator:
+    """Yield from an iterable, observing the time taken to produce each item."""
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        histogram.observe(time.perf_counter() - start)
+        yield item
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(
+    Histogram(
+        "kokoro_stage_seconds",
+        "Time spent per chunk in each stage of audio generation",
+        ["stage"],
+    )
+)
+TTFB_SECONDS = REGISTRY.register(
+    Histogram(
+        "kokoro_time_to_first_audio_seconds",
+        "Time from request start to the first audio chunk",
+    )
+)
+REAL_TIME_FACTOR = REGISTRY.register(
+    Histogram(
+        "kokoro_real_time_factor",
+        "Processing time divided by generated audio duration, per request",
+        buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 5.0),
+    )
+)
+ACTIVE_STREAMS = REGISTRY.register(
+    Gauge("kokoro_active_streams", "Audio streams currently being generated")
+)
+SEMAPHORE_WAIT_SECONDS = REGISTRY.register(
+    Histogram(
+        "kokoro_chunk_semaphore_wait_seconds",
+        "Time chunks wait for an inference slot",
+    )
+)
+CHUNK_TOKENS = REGISTRY.register(
+    Histogram(
+        "kokoro_chunk_tokens",
+        "Tokens per text chunk sent to the model",
+        buckets=(16, 32, 64, 128, 175, 250, 350, 450, 510),
+    )
+)
+REQUESTS = REGISTRY.register(
+    Counter("kokoro_requests", "Audio generation requests", ["status"])
+)
+CANCELLED_GENERATIONS = REGISTRY.register(
+    Counter(
+        "kokoro_cancelled_generations",
+        "Generations stopped before finishing",
+        ["reason"],
+    )
+)
+COMPUTE_SECONDS_SAVED = REGISTRY.register(
+    Counter(
+        "kokoro_cancelled_compute_seconds_saved",
+        "Estimated inference seconds not spent on cancelled generations",
+    )
+)
+CACHED_AUDIO_SECONDS = REGISTRY.register(
+    Histogram(
+        "kokoro_cached_audio_seconds",
+        "Seconds of audio per request served from the sentence cache",
+        buckets=(0, 1, 5, 15, 30, 60, 120, 300, 600),
+    )
+)
+
+
+def stage_timer(stage: str):
+    """Context manager timing one stage of audio generation."""
+    return STAGE_SECONDS.labels(stage=stage).time()
+
+
+def cache_family(caches: Dict[str, Dict]) -> List[Tuple[str, str, str, List[Sample]]]:
+    """Build hit/miss counter and hit ratio families from cache stats dicts.
+
+    Args:
+        caches: Mapping of cache name to a dict with "hits" and "misses"
+
+    Returns:
+        Metric families for a collector
+    """
+    hits, misses, ratios = [], [], []
+    for cache, info in caches.items():
+        labels = {"cache": cache}
+        total = info["hits"] + info["misses"]
+        hits.append(("kokoro_cache_hits_total", labels, info["hits"]))
+        misses.append(("kokoro_cache_misses_total", labels, info["misses"]))
+        ratios.append(("kokoro_cache_hit_ratio", labels, info["hits"] / total if total else 0.0))
+    return [
+        ("kokoro_cache_hits_total", "counter", "Cache hits", hits),
+        ("kokoro_cache_misses_total", "counter", "Cache misses", misses),
+        ("kokoro_cache_hit_ratio", "gauge", "Cache hit ratio since start", ratios),
+    ]
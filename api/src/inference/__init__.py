@@ -1,12 +1,17 @@
 """Model inference package."""
 
 from .base import BaseModelBackend
+from .cancellation import CancellationToken, GenerationCancelled
 from .kokoro_v1 import KokoroV1
 from .model_manager import ModelManager, get_manager
+from .stub_backend import StubBackend
 
 __all__ = [
     "BaseModelBackend",
+    "CancellationToken",
+    "GenerationCancelled",
     "ModelManager",
     "get_manager",
     "KokoroV1",
+    "StubBackend",
 ]
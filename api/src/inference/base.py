@@ -1,11 +1,19 @@
 """Base interface for Kokoro inference."""
 
 from abc import ABC, abstractmethod
+from array import array
 from typing import AsyncGenerator, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 
+from ..core.config import settings
+from ..core.metrics import STAGE_SECONDS, timed_iter
+from ..structures.schemas import WordTimestamp
+from .cancellation import CancellationToken, cancellable
+from .executor import get_inference_executor
+from .job_queue import get_job_queue
+
 
 class AudioChunk:
     """Class for audio chunks returned by model backends"""
@@ -22,18 +30,75 @@ class AudioChunk:
 
     @staticmethod
     def combine(audio_chunk_list: List):
-        output = AudioChunk(
-            audio_chunk_list[0].audio, audio_chunk_list[0].word_timestamps
+        accumulator = AudioAccumulator(
+            sum(len(audio_chunk.audio) for audio_chunk in audio_chunk_list)
         )
+        for audio_chunk in audio_chunk_list:
+            accumulator.append(audio_chunk)
+        return accumulator.to_chunk()
+
+
+class AudioAccumulator:
+    """Collects audio chunks into a single preallocated int16 buffer.
+
+    Chunks are copied into capacity reserved up front, which grows
+    geometrically when the estimate falls short, so total copying stays
+    linear in the output length. Word timestamps are kept as columns until
+    ``to_chunk`` builds the final list.
+    """
+
+    def __init__(self, capacity: int = 0):
+        self._audio = np.empty(max(capacity, 0), dtype=np.int16)
+        self._length = 0
+        self._words: List[str] = []
+        self._starts = array("d")
+        self._ends = array("d")
+        self._has_timestamps = False
+
+    def __len__(self) -> int:
+        return self._length
 
-        for audio_chunk in audio_chunk_list[1:]:
-            output.audio = np.concatenate(
-                (output.audio, audio_chunk.audio), dtype=np.int16
-            )
-            if output.word_timestamps is not None:
-                output.word_timestamps += audio_chunk.word_timestamps
+    @property
+    def capacity(self) -> int:
+        return len(self._audio)
+
+    def append(self, audio_chunk: AudioChunk) -> None:
+        """Copy a chunk's audio and timestamps onto the end.
+
+        Args:
+            audio_chunk: Chunk with int16 audio; its timestamps must already
+                be relative to the start of the whole output
+        """
+        samples = len(audio_chunk.audio)
+        end = self._length + samples
+        if end > len(self._audio):
+            grown = np.empty(max(end, len(self._audio) * 3 // 2), dtype=np.int16)
+            grown[: self._length] = self._audio[: self._length]
+            self._audio = grown
+        self._audio[self._length : end] = audio_chunk.audio
+        self._length = end
+
+        if audio_chunk.word_timestamps is not None:
+            self._has_timestamps = True
+            for timestamp in audio_chunk.word_timestamps:
+                self._words.append(timestamp.word)
+                self._starts.append(timestamp.start_time)
+                self._ends.append(timestamp.end_time)
+
+    def to_chunk(self) -> AudioChunk:
+        """Get everything appended so far as one chunk.
 
-        return output
+        Returns:
+            AudioChunk viewing the accumulated audio, with word timestamps if
+            any appended chunk had them
+        """
+        word_timestamps = None
+        if self._has_timestamps:
+            word_timestamps = [
+                WordTimestamp(word=word, start_time=start, end_time=end)
+                for word, start, end in zip(self._words, self._starts, self._ends)
+            ]
+        return AudioChunk(self._audio[: self._length], word_timestamps=word_timestamps)
 
 
 class ModelBackend(ABC):
@@ -125,3 +190,25 @@ class BaseModelBackend(ModelBackend):
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
                 torch.cuda.synchronize()
+
+    def _run_blocking(
+        self, factory, cost: int = 0, cancel: Optional[CancellationToken] = None
+    ):
+        """Run a blocking pipeline generator off the event loop.
+
+        Args:
+            factory: Zero-argument callable returning the pipeline generator
+            cost: Relative job size used by the shortest-job-first queue
+            cancel: Token checked in the worker thread before each result
+
+        Returns:
+            Async generator over the pipeline's results
+        """
+        forward = STAGE_SECONDS.labels(stage="forward")
+
+        def timed_factory():
+            return timed_iter(cancellable(factory(), cancel), forward)
+
+        if settings.enable_shortest_job_first:
+            return get_job_queue().iterate(timed_factory, cost=cost)
+        return get_inference_executor().iterate(timed_factory)
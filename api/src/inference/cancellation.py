@@ -0,0 +1,175 @@
+"""Cancellation of in-flight synthesis that nobody is waiting for anymore."""
+
+import threading
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from ..core.metrics import CANCELLED_GENERATIONS, COMPUTE_SECONDS_SAVED
+
+T = TypeVar("T")
+
+
+class GenerationCancelled(Exception):
+    """Raised inside a generation once its cancellation token is cancelled."""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Generation cancelled: {reason}")
+        self.reason = reason
+
+
+class CancellationToken:
+    """Flag telling every stage of one generation to stop.
+
+    The token is passed from the router down to the inference worker thread,
+    so it is backed by a ``threading.Event``. Chunks still waiting for an
+    inference slot are dropped, and a running KPipeline loop stops before its
+    next sub-segment.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the generation should stop."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Cancel the generation, keeping the first reason given.
+
+        Args:
+            reason: Why the generation was cancelled, such as "client_disconnected"
+        """
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if the generation was cancelled.
+
+        Raises:
+            GenerationCancelled: If the token was cancelled
+        """
+        if self._event.is_set():
+            raise GenerationCancelled(self.reason)
+
+
+def cancellable(
+    iterable: Iterable[T], cancel: Optional[CancellationToken]
+) -> Iterator[T]:
+    """Iterate a blocking generator, checking the token before each item.
+
+    Each item of a KPipeline loop is a forward pass, so checking before
+    asking for the next one aborts between sub-segments.
+
+    Args:
+        iterable: Generator to drive, such as a KPipeline loop
+        cancel: Token to check, or None to never cancel
+
+    Yields:
+        Items of ``iterable``
+
+    Raises:
+        GenerationCancelled: If the token is cancelled before the next item
+    """
+    if cancel is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        cancel.raise_if_cancelled()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item
+
+
+class ComputeSavings:
+    """Estimates inference time not spent on cancelled generations.
+
+    Completed generations teach the average inference seconds per second of
+    audio. A cancelled generation saves that rate times the audio it had
+    left to generate.
+    """
+
+    def __init__(self, alpha: float = 0.2):
+        """Initialize estimator.
+
+        Args:
+            alpha: Weight of each completed generation in the average rate
+        """
+        self._alpha = alpha
+        self._rate: Optional[float] = None
+        self._cancelled = 0
+        self._saved_seconds = 0.0
+
+    def completed(self, compute_seconds: float, audio_seconds: float) -> None:
+        """Record the inference time a completed generation took.
+
+        Args:
+            compute_seconds: Time its chunks held an inference slot
+            audio_seconds: Audio it generated
+        """
+        if audio_seconds <= 0:
+            return
+        rate = compute_seconds / audio_seconds
+        if self._rate is None:
+            self._rate = rate
+        else:
+            self._rate += self._alpha * (rate - self._rate)
+
+    def cancelled(
+        self,
+        reason: str,
+        compute_seconds: float,
+        audio_seconds: float,
+        remaining_audio_seconds: float,
+    ) -> float:
+        """Record a cancelled generation.
+
+        Args:
+            reason: Why it was cancelled
+            compute_seconds: Inference time it used before being cancelled
+            audio_seconds: Audio it generated before being cancelled
+            remaining_audio_seconds: Estimated audio it had left to generate
+
+        Returns:
+            Estimated inference seconds saved
+        """
+        rate = self._rate
+        if rate is None and audio_seconds > 0:
+            rate = compute_seconds / audio_seconds
+        saved = max(0.0, remaining_audio_seconds) * (rate or 0.0)
+        self._cancelled += 1
+        self._saved_seconds += saved
+        CANCELLED_GENERATIONS.labels(reason=reason).inc()
+        COMPUTE_SECONDS_SAVED.inc(saved)
+        return saved
+
+    def stats(self) -> dict:
+        """Get cancellation statistics.
+
+        Returns:
+            Dict with cancelled generations, seconds saved and the learned rate
+        """
+        return {
+            "cancelled": self._cancelled,
+            "compute_seconds_saved": self._saved_seconds,
+            "compute_seconds_per_audio_second": self._rate,
+        }
+
+
+_compute_savings: Optional[ComputeSavings] = None
+
+
+def get_compute_savings() -> ComputeSavings:
+    """Get the global compute savings estimator.
+
+    Returns:
+        ComputeSavings instance
+    """
+    global _compute_savings
+    if _compute_savings is None:
+        _compute_savings = ComputeSavings()
+    return _compute_savings
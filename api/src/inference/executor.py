@@ -0,0 +1,138 @@
+"""Dedicated executor for running blocking model inference off the event loop."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, Callable, Dict, Iterator, Optional, TypeVar
+
+from loguru import logger
+
+from ..core.config import settings
+
+T = TypeVar("T")
+
+# Marks the end of a producer's output on the hand-off queue
+_DONE = object()
+
+
+class InferenceExecutor:
+    """Runs synchronous inference generators on a worker pool.
+
+    Each call to ``iterate`` drives a blocking generator (e.g. a KPipeline loop)
+    inside a worker thread and hands every yielded item back to the caller
+    through an asyncio queue, so the event loop stays responsive while the
+    forward pass runs. Torch releases the GIL during inference, which lets
+    concurrent streams actually interleave.
+    """
+
+    def __init__(self, max_workers: int = 1, queue_size: int = 4):
+        """Initialize executor.
+
+        Args:
+            max_workers: Number of worker threads running inference
+            queue_size: Maximum items a producer may run ahead of its consumer
+        """
+        self._max_workers = max(1, max_workers)
+        self._queue_size = max(1, queue_size)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="kokoro-inference"
+        )
+        self._active_jobs = 0
+        self._total_jobs = 0
+
+    async def iterate(
+        self, factory: Callable[[], Iterator[T]]
+    ) -> AsyncGenerator[T, None]:
+        """Run a blocking generator in the pool and yield its items.
+
+        Args:
+            factory: Zero-argument callable returning the generator to drive.
+                It is invoked inside the worker thread.
+
+        Yields:
+            Items produced by the generator, in order
+
+        Raises:
+            Any exception raised by the generator
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = threading.Semaphore(self._queue_size)
+        stop = threading.Event()
+
+        def post(item, error: Optional[BaseException] = None) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+            except RuntimeError:
+                # Event loop already closed, nobody is listening anymore
+                stop.set()
+
+        def run() -> None:
+            try:
+                for item in factory():
+                    # Wait for the consumer to catch up, giving up once it has left
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    post(item)
+            except BaseException as e:
+                post(_DONE, e)
+            else:
+                post(_DONE)
+
+        self._active_jobs += 1
+        self._total_jobs += 1
+        loop.run_in_executor(self._pool, run)
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    break
+                slots.release()
+                yield item
+        finally:
+            # Stops the producer at its next yield if the consumer bailed early
+            stop.set()
+            self._active_jobs -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get executor statistics.
+
+        Returns:
+            Dict with worker and job counts
+        """
+        return {
+            "max_workers": self._max_workers,
+            "queue_size": self._queue_size,
+            "active_jobs": self._active_jobs,
+            "total_jobs": self._total_jobs,
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[InferenceExecutor] = None
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Get the global inference executor instance.
+
+    Returns:
+        InferenceExecutor instance
+    """
+    global _executor
+    if _executor is None:
+        _executor = InferenceExecutor(
+            max_workers=settings.inference_workers,
+            queue_size=settings.inference_queue_size,
+        )
+        logger.info(
+            f"Created inference executor with {settings.inference_workers} worker(s)"
+        )
+    return _executor
@@ -0,0 +1,140 @@
+"""Shortest-job-first ordering of inference jobs in front of the executor."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import (
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ..core.config import settings
+from .executor import InferenceExecutor, get_inference_executor
+
+T = TypeVar("T")
+
+
+class JobQueue:
+    """Orders inference jobs from concurrent requests shortest-first.
+
+    Each job still runs on its own executor worker, exactly as without the
+    queue, and nothing is held back while a worker is free. Only once every
+    worker is busy do new jobs wait here instead of in the executor's
+    first-in-first-out queue, and the cheapest waiting job goes next, so
+    short interactive chunks don't wait behind long ones.
+
+    Jobs are not batched: KModel's forward pass takes one utterance at a
+    time (its duration alignment and instance norms are per-utterance), so
+    running several jobs together would only serialize them on one worker.
+    """
+
+    def __init__(self, slots: int = 1, executor: Optional[InferenceExecutor] = None):
+        """Initialize queue.
+
+        Args:
+            slots: Jobs running at once, normally the executor's worker count
+            executor: Executor running the jobs (defaults to the global one)
+        """
+        self._free = max(1, slots)
+        self._slots = self._free
+        self._executor = executor
+        self._waiting: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        # Statistics
+        self._jobs = 0
+        self._queued_jobs = 0
+        self._total_wait = 0.0
+
+    async def iterate(
+        self, factory: Callable[[], Iterator[T]], cost: int = 0
+    ) -> AsyncGenerator[T, None]:
+        """Run a blocking generator once its turn comes and yield its items.
+
+        Args:
+            factory: Zero-argument callable returning the generator to drive
+            cost: Relative job size (e.g. text or token length)
+
+        Yields:
+            Items produced by the generator, in order
+
+        Raises:
+            Any exception raised by the generator
+        """
+        await self._acquire(cost)
+        try:
+            executor = self._executor or get_inference_executor()
+            async for item in executor.iterate(factory):
+                yield item
+        finally:
+            self._release()
+
+    async def _acquire(self, cost: int) -> None:
+        self._jobs += 1
+        if self._free > 0 and not self._waiting:
+            self._free -= 1
+            return
+
+        start = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        entry = (cost, next(self._sequence), future)
+        heapq.heappush(self._waiting, entry)
+        self._queued_jobs += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over as the wait was cancelled
+                self._release()
+            else:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+            raise
+        finally:
+            self._total_wait += time.perf_counter() - start
+
+    def _release(self) -> None:
+        self._free += 1
+        while self._free > 0 and self._waiting:
+            _, _, future = heapq.heappop(self._waiting)
+            self._free -= 1
+            future.set_result(None)
+
+    def stats(self) -> Dict:
+        """Get queue statistics.
+
+        Returns:
+            Dict with slot use, waiting jobs and queueing delay
+        """
+        return {
+            "slots": self._slots,
+            "busy_slots": self._slots - self._free,
+            "waiting_jobs": len(self._waiting),
+            "jobs": self._jobs,
+            "queued_jobs": self._queued_jobs,
+            "mean_wait_ms": (self._total_wait / self._queued_jobs * 1000)
+            if self._queued_jobs
+            else 0.0,
+        }
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the global job queue instance.
+
+    Returns:
+        JobQueue instance
+    """
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue(slots=settings.inference_workers)
+    return _job_queue
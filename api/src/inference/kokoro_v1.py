@@ -13,6 +13,7 @@ from ..core.config import settings
 from ..core.model_config import model_config
 from ..structures.schemas import WordTimestamp
 from .base import AudioChunk, BaseModelBackend
+from .cancellation import CancellationToken, GenerationCancelled
 
 
 class KokoroV1(BaseModelBackend):
@@ -90,6 +91,7 @@ class KokoroV1(BaseModelBackend):
         voice: Union[str, Tuple[str, Union[torch.Tensor, str]]],
         speed: float = 1.0,
         lang_code: Optional[str] = None,
+        cancel: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[np.ndarray, None]:
         """Generate audio from phoneme tokens.
 
@@ -98,6 +100,7 @@ class KokoroV1(BaseModelBackend):
             voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
             speed: Speed multiplier
             lang_code: Optional language code override
+            cancel: Token stopping the pipeline between sub-segments
 
         Yields:
             Generated audio chunks
@@ -114,38 +117,8 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(
-                voice_path, device=self._device
-            )
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(
-                temp_dir, f"temp_voice_{os.path.basename(voice_path)}"
-            )
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
+            # Resolve voice to an in-memory tensor
+            voice_name, voice_tensor = await self._resolve_voice(voice)
 
             # Use provided lang_code, settings voice code override, or first letter of voice name
             if lang_code:  # api is given priority
@@ -160,15 +133,28 @@ class KokoroV1(BaseModelBackend):
             logger.debug(
                 f"Generating audio from tokens with lang_code '{pipeline_lang_code}': '{tokens[:100]}{'...' if len(tokens) > 100 else ''}'"
             )
-            for result in pipeline.generate_from_tokens(
-                tokens=tokens, voice=voice_path, speed=speed, model=self._model
+
+            def run_pipeline():
+                for result in pipeline.generate_from_tokens(
+                    tokens=tokens,
+                    voice=self._pipeline_voice(voice_tensor),
+                    speed=speed,
+                    model=self._model,
+                ):
+                    if result.audio is not None:
+                        logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
+                        yield result.audio.numpy()
+                    else:
+                        logger.warning("No audio in chunk")
+
+            # Run the blocking pipeline loop on the inference executor
+            async for audio in self._run_blocking(
+                run_pipeline, cost=len(tokens), cancel=cancel
             ):
-                if result.audio is not None:
-                    logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
-                    yield result.audio.numpy()
-                else:
-                    logger.warning("No audio in chunk")
+                yield audio
 
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Generation failed: {e}")
             if (
@@ -178,7 +164,7 @@ class KokoroV1(BaseModelBackend):
             ):
                 self._clear_memory()
                 async for chunk in self.generate_from_tokens(
-                    tokens, voice, speed, lang_code
+                    tokens, voice, speed, lang_code, cancel
                 ):
                     yield chunk
             raise
@@ -190,6 +176,7 @@ class KokoroV1(BaseModelBackend):
         speed: float = 1.0,
         lang_code: Optional[str] = None,
         return_timestamps: Optional[bool] = False,
+        cancel: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
         """Generate audio using model.
 
@@ -198,6 +185,7 @@ class KokoroV1(BaseModelBackend):
             voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
             speed: Speed multiplier
             lang_code: Optional language code override
+            cancel: Token stopping the pipeline between sub-segments
 
         Yields:
             Generated audio chunks
@@ -213,38 +201,8 @@ class KokoroV1(BaseModelBackend):
                 if self._check_memory():
                     self._clear_memory()
 
-            # Handle voice input
-            voice_path: str
-            voice_name: str
-            if isinstance(voice, tuple):
-                voice_name, voice_data = voice
-                if isinstance(voice_data, str):
-                    voice_path = voice_data
-                else:
-                    # Save tensor to temporary file
-                    import tempfile
-
-                    temp_dir = tempfile.gettempdir()
-                    voice_path = os.path.join(temp_dir, f"{voice_name}.pt")
-                    # Save tensor with CPU mapping for portability
-                    torch.save(voice_data.cpu(), voice_path)
-            else:
-                voice_path = voice
-                voice_name = os.path.splitext(os.path.basename(voice_path))[0]
-
-            # Load voice tensor with proper device mapping
-            voice_tensor = await paths.load_voice_tensor(
-                voice_path, device=self._device
-            )
-            # Save back to a temporary file with proper device mapping
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_path = os.path.join(
-                temp_dir, f"temp_voice_{os.path.basename(voice_path)}"
-            )
-            await paths.save_voice_tensor(voice_tensor, temp_path)
-            voice_path = temp_path
+            # Resolve voice to an in-memory tensor
+            voice_name, voice_tensor = await self._resolve_voice(voice)
 
             # Use provided lang_code, settings voice code override, or first letter of voice name
             pipeline_lang_code = (
@@ -261,62 +219,75 @@ class KokoroV1(BaseModelBackend):
             logger.debug(
                 f"Generating audio for text with lang_code '{pipeline_lang_code}': '{text[:100]}{'...' if len(text) > 100 else ''}'"
             )
-            for result in pipeline(
-                text, voice=voice_path, speed=speed, model=self._model
-            ):
-                if result.audio is not None:
-                    logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
-                    word_timestamps = None
-                    if (
-                        return_timestamps
-                        and hasattr(result, "tokens")
-                        and result.tokens
-                    ):
-                        word_timestamps = []
-                        current_offset = 0.0
-                        logger.debug(
-                            f"Processing chunk timestamps with {len(result.tokens)} tokens"
-                        )
-                        if result.pred_dur is not None:
-                            try:
-                                # Add timestamps with offset
-                                for token in result.tokens:
-                                    if not all(
-                                        hasattr(token, attr)
-                                        for attr in [
-                                            "text",
-                                            "start_ts",
-                                            "end_ts",
-                                        ]
-                                    ):
-                                        continue
-                                    if not token.text or not token.text.strip():
-                                        continue
-
-                                    start_time = float(token.start_ts) + current_offset
-                                    end_time = float(token.end_ts) + current_offset
-                                    word_timestamps.append(
-                                        WordTimestamp(
-                                            word=str(token.text).strip(),
-                                            start_time=start_time,
-                                            end_time=end_time,
+
+            def run_pipeline():
+                for result in pipeline(
+                    text,
+                    voice=self._pipeline_voice(voice_tensor),
+                    speed=speed,
+                    model=self._model,
+                ):
+                    if result.audio is not None:
+                        logger.debug(f"Got audio chunk with shape: {result.audio.shape}")
+                        word_timestamps = None
+                        if (
+                            return_timestamps
+                            and hasattr(result, "tokens")
+                            and result.tokens
+                        ):
+                            word_timestamps = []
+                            current_offset = 0.0
+                            logger.debug(
+                                f"Processing chunk timestamps with {len(result.tokens)} tokens"
+                            )
+                            if result.pred_dur is not None:
+                                try:
+                                    # Add timestamps with offset
+                                    for token in result.tokens:
+                                        if not all(
+                                            hasattr(token, attr)
+                                            for attr in [
+                                                "text",
+                                                "start_ts",
+                                                "end_ts",
+                                            ]
+                                        ):
+                                            continue
+                                        if not token.text or not token.text.strip():
+                                            continue
+
+                                        start_time = float(token.start_ts) + current_offset
+                                        end_time = float(token.end_ts) + current_offset
+                                        word_timestamps.append(
+                                            WordTimestamp(
+                                                word=str(token.text).strip(),
+                                                start_time=start_time,
+                                                end_time=end_time,
+                                            )
                                         )
-                                    )
-                                    logger.debug(
-                                        f"Added timestamp for word '{token.text}': {start_time:.3f}s - {end_time:.3f}s"
+                                        logger.debug(
+                                            f"Added timestamp for word '{token.text}': {start_time:.3f}s - {end_time:.3f}s"
+                                        )
+
+                                except Exception as e:
+                                    logger.error(
+                                        f"Failed to process timestamps for chunk: {e}"
                                     )
 
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to process timestamps for chunk: {e}"
-                                )
+                        yield AudioChunk(
+                            result.audio.numpy(), word_timestamps=word_timestamps
+                        )
+                    else:
+                        logger.warning("No audio in chunk")
 
-                    yield AudioChunk(
-                        result.audio.numpy(), word_timestamps=word_timestamps
-                    )
-                else:
-                    logger.warning("No audio in chunk")
+            # Run the blocking pipeline loop on the inference executor
+            async for chunk in self._run_blocking(
+                run_pipeline, cost=len(text), cancel=cancel
+            ):
+                yield chunk
 
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Generation failed: {e}")
             if (
@@ -325,10 +296,47 @@ class KokoroV1(BaseModelBackend):
                 and "out of memory" in str(e).lower()
             ):
                 self._clear_memory()
-                async for chunk in self.generate(text, voice, speed, lang_code):
+                async for chunk in self.generate(
+                    text, voice, speed, lang_code, return_timestamps, cancel
+                ):
                     yield chunk
             raise
 
+    async def _resolve_voice(
+        self, voice: Union[str, Tuple[str, Union[torch.Tensor, str]]]
+    ) -> Tuple[str, torch.Tensor]:
+        """Resolve voice input to a name and a tensor on the model device.
+
+        Args:
+            voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
+
+        Returns:
+            Tuple of (voice name, voice tensor)
+        """
+        if isinstance(voice, tuple):
+            voice_name, voice_data = voice
+            if not isinstance(voice_data, str):
+                return voice_name, voice_data
+            voice_path = voice_data
+        else:
+            voice_path = voice
+            voice_name = os.path.splitext(os.path.basename(voice_path))[0]
+
+        # Plain paths are loaded once; callers should prefer cached tensors
+        voice_tensor = await paths.load_voice_tensor(voice_path, device=self._device)
+        return voice_name, voice_tensor
+
+    @staticmethod
+    def _pipeline_voice(voice_tensor: torch.Tensor) -> torch.Tensor:
+        """Get a voice pack in the form KPipeline accepts.
+
+        KPipeline only recognises CPU float tensors as voice packs and moves
+        them to the model device itself.
+        """
+        if voice_tensor.device.type != "cpu":
+            return voice_tensor.cpu()
+        return voice_tensor
+
     def _check_memory(self) -> bool:
         """Check if memory usage is above threshold."""
         if self._device == "cuda":
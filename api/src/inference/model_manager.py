@@ -7,8 +7,10 @@ from loguru import logger
 from ..core import paths
 from ..core.config import settings
 from ..core.model_config import ModelConfig, model_config
-from .base import BaseModelBackend
+from .base import AudioChunk, BaseModelBackend
+from .cancellation import GenerationCancelled
 from .kokoro_v1 import KokoroV1
+from .stub_backend import StubBackend
 
 
 class ModelManager:
@@ -24,7 +26,7 @@ class ModelManager:
             config: Optional model configuration override
         """
         self._config = config or model_config
-        self._backend: Optional[KokoroV1] = None  # Explicitly type as KokoroV1
+        self._backend: Optional[BaseModelBackend] = None
         self._device: Optional[str] = None
 
     def _determine_device(self) -> str:
@@ -32,14 +34,22 @@ class ModelManager:
         return "cuda" if settings.use_gpu else "cpu"
 
     async def initialize(self) -> None:
-        """Initialize Kokoro V1 backend."""
+        """Initialize the backend selected by ``settings.model_backend``."""
         try:
+            if settings.model_backend == "stub":
+                logger.info("Initializing stub backend")
+                self._backend = StubBackend()
+                self._device = self._backend.device
+                return
+
+            if settings.model_backend != "kokoro_v1":
+                raise ValueError(f"Unknown model backend: {settings.model_backend}")
             self._device = self._determine_device()
             logger.info(f"Initializing Kokoro V1 on {self._device}")
             self._backend = KokoroV1()
 
         except Exception as e:
-            raise RuntimeError(f"Failed to initialize Kokoro V1: {e}")
+            raise RuntimeError(f"Failed to initialize {settings.model_backend}: {e}")
 
     async def initialize_with_warmup(self, voice_manager) -> tuple[str, str, int]:
         """Initialize and warm up model.
@@ -68,14 +78,14 @@ class ModelManager:
             # Use paths module to get voice path
             try:
                 voices = await paths.list_voices()
-                voice_path = await paths.get_voice_path(settings.default_voice)
 
                 # Warm up with short text
                 warmup_text = "Warmup text for initialization."
-                # Use default voice name for warmup
+                # Use default voice name for warmup, which also primes the voice cache
                 voice_name = settings.default_voice
+                voice_tensor = await voice_manager.load_voice(voice_name)
                 logger.debug(f"Using default voice '{voice_name}' for warmup")
-                async for _ in self.generate(warmup_text, (voice_name, voice_path)):
+                async for _ in self.generate(warmup_text, (voice_name, voice_tensor)):
                     pass
             except Exception as e:
                 raise RuntimeError(f"Failed to get default voice: {e}")
@@ -83,7 +93,7 @@ class ModelManager:
             ms = int((time.perf_counter() - start) * 1000)
             logger.info(f"Warmup completed in {ms}ms")
 
-            return self._device, "kokoro_v1", len(voices)
+            return self._device, self.current_backend, len(voices)
         except FileNotFoundError as e:
             logger.error("""
 Model files not found! You need to download the Kokoro V1 model:
@@ -144,6 +154,28 @@ Model files not found! You need to download the Kokoro V1 model:
                 if settings.default_volume_multiplier != 1.0:
                     chunk.audio *= settings.default_volume_multiplier
                 yield chunk
+        except GenerationCancelled:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Generation failed: {e}")
+
+    async def generate_from_tokens(self, *args, **kwargs):
+        """Generate audio from phonemes using initialized backend.
+
+        Raises:
+            RuntimeError: If generation fails
+        """
+        if not self._backend:
+            raise RuntimeError("Backend not initialized")
+
+        try:
+            async for audio in self._backend.generate_from_tokens(*args, **kwargs):
+                chunk = audio if isinstance(audio, AudioChunk) else AudioChunk(audio)
+                if settings.default_volume_multiplier != 1.0:
+                    chunk.audio *= settings.default_volume_multiplier
+                yield chunk
+        except GenerationCancelled:
+            raise
         except Exception as e:
             raise RuntimeError(f"Generation failed: {e}")
 
@@ -156,7 +188,7 @@ Model files not found! You need to download the Kokoro V1 model:
     @property
     def current_backend(self) -> str:
         """Get current backend type."""
-        return "kokoro_v1"
+        return settings.model_backend
 
 
 async def get_manager(config: Optional[ModelConfig] = None) -> ModelManager:
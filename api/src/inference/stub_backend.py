@@ -0,0 +1,193 @@
+"""Synthetic model backend for load testing without model weights."""
+
+import os
+import time
+import zlib
+from typing import AsyncGenerator, List, Optional, Tuple, Union
+
+import numpy as np
+import torch
+from loguru import logger
+
+from ..core.config import settings
+from ..structures.schemas import WordTimestamp
+from .base import AudioChunk, BaseModelBackend
+from .cancellation import CancellationToken
+
+# Kokoro speaks about 15 phonemes per second at speed 1.0
+SAMPLES_PER_PHONEME = 1600
+# Quiet lead-in and tail, like Kokoro's output, for the trimming stages to find
+EDGE_SILENCE_SAMPLES = 4800
+
+
+class StubBackend(BaseModelBackend):
+    """Backend producing deterministic synthetic speech-like audio.
+
+    Output length is proportional to the phoneme count and inversely
+    proportional to speed, and each word becomes a voiced burst at a pitch
+    picked from the voice name. Generation runs on the inference executor
+    like the real model, spending ``stub_token_delay_ms`` per phoneme either
+    sleeping or burning CPU, so the scheduling, streaming and encoding layers
+    can be load-tested with realistic timing on machines without the model.
+    """
+
+    def __init__(self):
+        """Initialize backend."""
+        super().__init__()
+        self._loaded = False
+
+    async def load_model(self, path: str) -> None:
+        """Mark the backend loaded. No weights are read.
+
+        Args:
+            path: Ignored model path
+        """
+        logger.warning("Using the stub model backend, which generates synthetic audio")
+        self._loaded = True
+
+    async def generate(
+        self,
+        text: str,
+        voice: Union[str, Tuple[str, Union[torch.Tensor, str]]],
+        speed: float = 1.0,
+        lang_code: Optional[str] = None,
+        return_timestamps: Optional[bool] = False,
+        cancel: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Generate synthetic audio for text.
+
+        The phoneme count is estimated as one per letter, which is close for
+        English.
+
+        Args:
+            text: Input text to synthesize
+            voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
+            speed: Speed multiplier
+            lang_code: Ignored language code
+            return_timestamps: Whether to include word timestamps
+            cancel: Token stopping generation before it starts
+
+        Yields:
+            One audio chunk for the text
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded")
+
+        words = [
+            (word, sum(c.isalpha() for c in word) or 1) for word in text.split()
+        ]
+
+        def run_pipeline():
+            audio, spans = self._synthesize(words, self._voice_name(voice), speed)
+            word_timestamps = None
+            if return_timestamps:
+                word_timestamps = [
+                    WordTimestamp(
+                        word=word, start_time=start / 24000, end_time=end / 24000
+                    )
+                    for (word, _), (start, end) in zip(words, spans)
+                ]
+            yield AudioChunk(audio, word_timestamps=word_timestamps)
+
+        cost = sum(count for _, count in words)
+        async for chunk in self._run_blocking(run_pipeline, cost=cost, cancel=cancel):
+            yield chunk
+
+    async def generate_from_tokens(
+        self,
+        tokens: str,
+        voice: Union[str, Tuple[str, Union[torch.Tensor, str]]],
+        speed: float = 1.0,
+        lang_code: Optional[str] = None,
+        cancel: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[np.ndarray, None]:
+        """Generate synthetic audio from phonemes.
+
+        Args:
+            tokens: Input phoneme string, with spaces between words
+            voice: Either a voice path string or a tuple of (voice_name, voice_tensor/path)
+            speed: Speed multiplier
+            lang_code: Ignored language code
+            cancel: Token stopping generation before it starts
+
+        Yields:
+            One audio array for the phonemes
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model not loaded")
+
+        words = [(word, len(word)) for word in tokens.split()]
+
+        def run_pipeline():
+            audio, _ = self._synthesize(words, self._voice_name(voice), speed)
+            yield audio
+
+        async for audio in self._run_blocking(
+            run_pipeline, cost=len(tokens), cancel=cancel
+        ):
+            yield audio
+
+    @staticmethod
+    def _voice_name(voice: Union[str, Tuple[str, Union[torch.Tensor, str]]]) -> str:
+        if isinstance(voice, tuple):
+            return voice[0]
+        return os.path.splitext(os.path.basename(voice))[0]
+
+    @staticmethod
+    def _spend(phonemes: int) -> None:
+        """Spend the configured compute time for a number of phonemes."""
+        seconds = phonemes * settings.stub_token_delay_ms / 1000
+        if seconds <= 0:
+            return
+        if settings.stub_delay_mode == "busy":
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                pass
+        else:
+            time.sleep(seconds)
+
+    def _synthesize(
+        self, words: List[Tuple[str, int]], voice_name: str, speed: float
+    ) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        """Render words as voiced bursts.
+
+        Args:
+            words: (word, phoneme count) pairs
+            voice_name: Voice used to pick the pitch
+            speed: Speed multiplier
+
+        Returns:
+            Tuple of (float32 audio, (start, end) sample span of each word)
+        """
+        phonemes = sum(count for _, count in words)
+        self._spend(phonemes)
+
+        pitch = 90 + zlib.crc32(voice_name.encode()) % 160
+        per_phoneme = SAMPLES_PER_PHONEME / max(speed, 0.1)
+        total = int(phonemes * per_phoneme) + 2 * EDGE_SILENCE_SAMPLES
+        audio = np.zeros(total, dtype=np.float32)
+
+        spans = []
+        offset = EDGE_SILENCE_SAMPLES
+        for word, count in words:
+            length = int(count * per_phoneme)
+            # A short pause between words, taken from the word's own share
+            voiced = max(length - int(per_phoneme / 2), 1)
+            t = np.arange(voiced, dtype=np.float32) / 24000
+            # Seeded by the word so repeated text gives identical audio
+            rng = np.random.default_rng(zlib.crc32(word.encode()))
+            tone = np.sin(2 * np.pi * pitch * (1 + 0.2 * rng.random()) * t)
+            audio[offset : offset + voiced] = 0.3 * tone * np.hanning(voiced)
+            spans.append((offset, offset + length))
+            offset += length
+
+        return audio, spans
+
+    def unload(self) -> None:
+        """Mark the backend unloaded."""
+        self._loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the backend is loaded."""
+        return self._loaded
@@ -1,6 +1,9 @@
 """Voice management with controlled resource handling."""
 
-from typing import Dict, List, Optional
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 
 import aiofiles
 import torch
@@ -8,6 +11,7 @@ from loguru import logger
 
 from ..core import paths
 from ..core.config import settings
+from ..core.model_config import ModelConfig, model_config
 
 
 class VoiceManager:
@@ -16,11 +20,23 @@ class VoiceManager:
     # Singleton instance
     _instance = None
 
-    def __init__(self):
-        """Initialize voice manager."""
+    def __init__(self, config: Optional[ModelConfig] = None):
+        """Initialize voice manager.
+
+        Args:
+            config: Optional model configuration override
+        """
+        self._config = config or model_config
         # Strictly respect settings.use_gpu
         self._device = settings.get_device()
-        self._voices: Dict[str, torch.Tensor] = {}
+        # LRU cache of loaded tensors keyed by (voice path, device)
+        self._voices: "OrderedDict[Tuple[str, str], torch.Tensor]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        # LRU cache of blended voices keyed by canonical blend expression
+        self._blends: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self._blend_hits = 0
+        self._blend_misses = 0
 
     async def get_voice_path(self, voice_name: str) -> str:
         """Get path to voice file.
@@ -53,13 +69,141 @@ class VoiceManager:
         """
         try:
             voice_path = await self.get_voice_path(voice_name)
-            target_device = device or self._device
-            voice = await paths.load_voice_tensor(voice_path, target_device)
-            self._voices[voice_name] = voice
-            return voice
+            return await self.load_voice_from_path(voice_path, device)
         except Exception as e:
             raise RuntimeError(f"Failed to load voice {voice_name}: {e}")
 
+    async def load_voice_from_path(
+        self, voice_path: str, device: Optional[str] = None
+    ) -> torch.Tensor:
+        """Load voice tensor from a file, serving repeat loads from memory.
+
+        Args:
+            voice_path: Path to voice file
+            device: Optional override for target device
+
+        Returns:
+            Voice tensor resident on the target device
+
+        Raises:
+            RuntimeError: If file cannot be read
+        """
+        target_device = device or self._device
+        key = (voice_path, target_device)
+
+        voice = self._voices.get(key)
+        if voice is not None:
+            self._hits += 1
+            self._voices.move_to_end(key)
+            return voice
+
+        self._misses += 1
+        voice = await paths.load_voice_tensor(voice_path, target_device)
+        if self._config.cache_voices and self._config.voice_cache_size > 0:
+            self._voices[key] = voice
+            while len(self._voices) > self._config.voice_cache_size:
+                evicted, _ = self._voices.popitem(last=False)
+                logger.debug(f"Evicted voice from cache: {evicted[0]}")
+        return voice
+
+    @staticmethod
+    def canonical_blend_key(
+        components: List[Tuple[str, float]], normalize: bool = True
+    ) -> str:
+        """Build the canonical cache key for a voice blend.
+
+        Weights are resolved to their final coefficients (after optional
+        normalization) and components are sorted, so equivalent expressions
+        such as ``a(2)+b(1)`` and ``b(2)+a(4)`` share a key.
+
+        Args:
+            components: List of (voice name, signed weight)
+            normalize: Whether weights are normalized to sum to 1
+
+        Returns:
+            Canonical blend key
+        """
+        total = sum(abs(weight) for _, weight in components) if normalize else 1.0
+        terms = sorted(
+            f"{name}:{weight / total:.6g}" for name, weight in components
+        )
+        return ",".join(terms)
+
+    async def blend_voices(
+        self,
+        components: List[Tuple[str, float]],
+        normalize: bool = True,
+        device: Optional[str] = None,
+    ) -> torch.Tensor:
+        """Get a weighted blend of voices, computing it only on first use.
+
+        Blends are held in memory with LRU eviction and, when
+        ``settings.voice_blend_cache_dir`` is set, persisted to a
+        content-addressed store so they survive restarts.
+
+        Args:
+            components: List of (voice name, signed weight); negative weights subtract
+            normalize: Whether to normalize weights so they sum to 1
+            device: Optional override for target device
+
+        Returns:
+            Blended voice tensor
+
+        Raises:
+            RuntimeError: If any voice not found
+        """
+        target_device = device or self._device
+        canonical = self.canonical_blend_key(components, normalize)
+        key = f"{canonical}@{target_device}"
+
+        blended = self._blends.get(key)
+        if blended is not None:
+            self._blend_hits += 1
+            self._blends.move_to_end(key)
+            return blended
+
+        self._blend_misses += 1
+        store_path = self._blend_store_path(canonical)
+        if store_path and os.path.exists(store_path):
+            logger.debug(f"Loading blended voice from store: {store_path}")
+            blended = await paths.load_voice_tensor(store_path, target_device)
+        else:
+            total = (
+                sum(abs(weight) for _, weight in components) if normalize else 1.0
+            )
+            blended = None
+            for name, weight in components:
+                # Cached component tensors are shared, so never modify them in place
+                term = await self.load_voice(name, target_device) * (weight / total)
+                blended = term if blended is None else blended + term
+            if store_path:
+                await self._save_blend(blended, store_path)
+
+        if self._config.voice_blend_cache_size > 0:
+            self._blends[key] = blended
+            while len(self._blends) > self._config.voice_blend_cache_size:
+                self._blends.popitem(last=False)
+        return blended
+
+    @staticmethod
+    def _blend_store_path(key: str) -> Optional[str]:
+        """Get the content-addressed store path for a blend, if persistence is on."""
+        if not settings.voice_blend_cache_dir:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(settings.voice_blend_cache_dir, f"{digest}.pt")
+
+    @staticmethod
+    async def _save_blend(tensor: torch.Tensor, store_path: str) -> None:
+        """Atomically persist a blend so concurrent writers never interleave."""
+        try:
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+            temp_path = f"{store_path}.{os.getpid()}.{id(tensor)}.tmp"
+            await paths.save_voice_tensor(tensor.cpu(), temp_path)
+            os.replace(temp_path, store_path)
+        except Exception as e:
+            logger.warning(f"Failed to persist blended voice: {e}")
+
     async def combine_voices(
         self, voices: List[str], device: Optional[str] = None
     ) -> torch.Tensor:
@@ -95,13 +239,22 @@ class VoiceManager:
         """
         return await paths.list_voices()
 
-    def cache_info(self) -> Dict[str, int]:
+    def cache_info(self) -> Dict[str, Union[int, str]]:
         """Get cache statistics.
 
         Returns:
             Dict with cache statistics
         """
-        return {"loaded_voices": len(self._voices), "device": self._device}
+        return {
+            "loaded_voices": len(self._voices),
+            "max_voices": self._config.voice_cache_size,
+            "device": self._device,
+            "hits": self._hits,
+            "misses": self._misses,
+            "blended_voices": len(self._blends),
+            "blend_hits": self._blend_hits,
+            "blend_misses": self._blend_misses,
+        }
 
 
 async def get_manager() -> VoiceManager:
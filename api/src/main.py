@@ -16,6 +16,7 @@ from loguru import logger
 from .core.config import settings
 from .routers.debug import router as debug_router
 from .routers.development import router as dev_router
+from .routers.metrics import router as metrics_router
 from .routers.openai_compatible import router as openai_router
 from .routers.web_player import router as web_router
 
@@ -92,6 +93,16 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize model: {e}")
         raise
 
+    # Open audio writers for common formats before the first request needs them
+    from .services.writer_pool import get_writer_pool
+
+    get_writer_pool().warm(
+        settings.writer_pool_formats,
+        settings.flashsr_output_sample_rate
+        if settings.enable_flashsr
+        else settings.sample_rate,
+    )
+
     boundary = "░" * 2 * 12
     startup_msg = f"""
 
@@ -130,6 +141,19 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Stop inference workers on shutdown
+    from .inference.executor import get_inference_executor
+
+    get_inference_executor().shutdown()
+
+    from .services.flashsr_service import get_flashsr_pool
+
+    get_flashsr_pool().shutdown()
+
+    from .services.writer_pool import get_writer_pool
+
+    get_writer_pool().shutdown()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -154,6 +178,7 @@ if settings.cors_enabled:
 app.include_router(openai_router, prefix="/v1")
 app.include_router(dev_router)  # Development endpoints
 app.include_router(debug_router)  # Debug endpoints
+app.include_router(metrics_router)  # Prometheus metrics
 if settings.enable_web_player:
     app.include_router(web_router, prefix="/web")  # Web player static files
 
@@ -1,5 +1,4 @@
 import threading
-import time
 from datetime import datetime
 
 import psutil
@@ -151,59 +150,120 @@ async def get_system_info():
     }
 
 
+@router.get("/debug/inference")
+async def get_inference_info():
+    """Get inference executor and job queue statistics."""
+    from ..core.config import settings
+    from ..inference.executor import get_inference_executor
+    from ..inference.job_queue import get_job_queue
+
+    return {
+        "executor": get_inference_executor().stats(),
+        "job_queue": get_job_queue().stats()
+        if settings.enable_shortest_job_first
+        else None,
+    }
+
+
+@router.get("/debug/flashsr")
+async def get_flashsr_info():
+    """Get FlashSR worker pool and batching statistics."""
+    from ..services.flashsr_service import _flashsr_service, get_flashsr_pool
+
+    return {
+        "pool": get_flashsr_pool().stats(),
+        "service": _flashsr_service.stats() if _flashsr_service else None,
+    }
+
+
+@router.get("/debug/writers")
+async def get_writer_pool_info():
+    """Get pre-opened audio writer pool statistics."""
+    from ..services.writer_pool import get_writer_pool
+
+    return get_writer_pool().stats()
+
+
+@router.get("/debug/scheduler")
+async def get_scheduler_info():
+    """Get chunk scheduler slot use and per-class counts."""
+    from ..services.chunk_scheduler import get_chunk_scheduler
+
+    return get_chunk_scheduler().stats()
+
+
+@router.get("/debug/admission")
+async def get_admission_info():
+    """Get admission control queue state."""
+    from ..services.admission import get_admission_controller
+
+    return get_admission_controller().state()
+
+
+@router.get("/debug/coalescing")
+async def get_coalescing_info():
+    """Get in-flight generations shared by identical requests."""
+    from ..services.coalescer import get_coalescer
+
+    return get_coalescer().stats()
+
+
+@router.get("/debug/cancellation")
+async def get_cancellation_info():
+    """Get cancelled generations and the inference time they saved."""
+    from ..inference.cancellation import get_compute_savings
+
+    return get_compute_savings().stats()
+
+
+@router.get("/debug/resumable_streams")
+async def get_resumable_stream_info():
+    """Get buffered resumable streams and resumption counts."""
+    from ..services.resumable_streams import get_resumable_streams
+
+    return get_resumable_streams().stats()
+
+
+@router.get("/debug/phonemes")
+async def get_phoneme_cache_info():
+    """Get phoneme cache statistics."""
+    from ..services.text_processing.phonemizer import phoneme_cache_info
+
+    return phoneme_cache_info()
+
+
 @router.get("/debug/session_pools")
 async def get_session_pool_info():
-    """Get information about ONNX session pools."""
+    """Get information about the model backend and ONNX sessions."""
     from ..inference.model_manager import get_manager
+    from ..services.flashsr_service import _flashsr_service
 
     manager = await get_manager()
-    pools = manager._session_pools
-    current_time = time.time()
-
-    pool_info = {}
-
-    # Get CPU pool info
-    if "onnx_cpu" in pools:
-        cpu_pool = pools["onnx_cpu"]
-        pool_info["cpu"] = {
-            "active_sessions": len(cpu_pool._sessions),
-            "max_sessions": cpu_pool._max_size,
-            "sessions": [
-                {"model": path, "age_seconds": current_time - info.last_used}
-                for path, info in cpu_pool._sessions.items()
-            ],
-        }
+    backend = manager.get_backend()
 
-    # Get GPU pool info
-    if "onnx_gpu" in pools:
-        gpu_pool = pools["onnx_gpu"]
-        pool_info["gpu"] = {
-            "active_sessions": len(gpu_pool._sessions),
-            "max_streams": gpu_pool._max_size,
-            "available_streams": len(gpu_pool._available_streams),
-            "sessions": [
-                {
-                    "model": path,
-                    "age_seconds": current_time - info.last_used,
-                    "stream_id": info.stream_id,
-                }
-                for path, info in gpu_pool._sessions.items()
-            ],
-        }
+    pool_info = {
+        "model": {
+            "backend": type(backend).__name__,
+            "device": backend.device,
+            "loaded": backend.is_loaded,
+        },
+        # FlashSR is the only ONNX session the service still holds
+        "flashsr": _flashsr_service.stats() if _flashsr_service else None,
+    }
 
-        # Add GPU memory info if available
-        if GPU_AVAILABLE:
-            try:
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    gpu = gpus[0]  # Assume first GPU
-                    pool_info["gpu"]["memory"] = {
-                        "total_mb": gpu.memoryTotal,
-                        "used_mb": gpu.memoryUsed,
-                        "free_mb": gpu.memoryFree,
-                        "percent_used": (gpu.memoryUsed / gpu.memoryTotal) * 100,
-                    }
-            except Exception:
-                pass
+    # Add GPU memory info if available
+    if GPU_AVAILABLE:
+        try:
+            gpus = GPUtil.getGPUs()
+            if gpus:
+                gpu = gpus[0]  # Assume first GPU
+                pool_info["gpu_memory"] = {
+                    "total_mb": gpu.memoryTotal,
+                    "used_mb": gpu.memoryUsed,
+                    "free_mb": gpu.memoryFree,
+                    "percent_used": (gpu.memoryUsed / gpu.memoryTotal) * 100,
+                }
+        except Exception:
+            pass
 
     return pool_info
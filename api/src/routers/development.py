@@ -15,10 +15,10 @@ from loguru import logger
 from ..core.config import settings
 from ..inference.base import AudioChunk
 from ..services.audio import AudioNormalizer, AudioService
-from ..services.streaming_audio_writer import StreamingAudioWriter
 from ..services.temp_manager import TempFileWriter
 from ..services.text_processing import smart_split
 from ..services.tts_service import TTSService
+from ..services.writer_pool import get_writer_pool
 from ..structures import CaptionedSpeechRequest, CaptionedSpeechResponse, WordTimestamp
 from ..structures.custom_responses import JSONStreamingResponse
 from ..structures.text_schemas import (
@@ -93,7 +93,7 @@ async def generate_from_phonemes(
         output_sample_rate = (
             settings.flashsr_output_sample_rate if settings.enable_flashsr else settings.sample_rate
         )
-        writer = StreamingAudioWriter(format="wav", sample_rate=output_sample_rate, channels=1)
+        writer = get_writer_pool().acquire("wav", sample_rate=output_sample_rate, channels=1)
         normalizer = AudioNormalizer()
 
         async def generate_chunks():
@@ -189,7 +189,7 @@ async def create_captioned_speech(
         output_sample_rate = (
             settings.flashsr_output_sample_rate if settings.enable_flashsr else settings.sample_rate
         )
-        writer = StreamingAudioWriter(request.response_format, sample_rate=output_sample_rate)
+        writer = get_writer_pool().acquire(request.response_format, sample_rate=output_sample_rate)
         # Check if streaming is requested (default for OpenAI client)
         if request.stream:
             # Create generator but don't start it yet
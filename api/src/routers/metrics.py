@@ -0,0 +1,189 @@
+"""Prometheus metrics exposition."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..core.metrics import REGISTRY, cache_family
+
+router = APIRouter(tags=["metrics"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _collect_caches():
+    """Hit/miss counts for the phoneme, voice, blend, sentence and response caches."""
+    from ..inference.voice_manager import VoiceManager
+    from ..services import coalescer, response_cache, sentence_cache, writer_pool
+    from ..services.text_processing.phonemizer import phoneme_cache_info
+
+    caches = {"phoneme": phoneme_cache_info()}
+    # Only report the voice caches once the manager exists
+    if VoiceManager._instance is not None:
+        info = VoiceManager._instance.cache_info()
+        caches["voice"] = {"hits": info["hits"], "misses": info["misses"]}
+        caches["voice_blend"] = {
+            "hits": info["blend_hits"],
+            "misses": info["blend_misses"],
+        }
+    if sentence_cache._sentence_cache is not None:
+        caches["sentence"] = sentence_cache._sentence_cache.cache_info()
+    if response_cache._response_cache is not None:
+        caches["response"] = response_cache._response_cache.cache_info()
+    if writer_pool._writer_pool is not None:
+        caches["writer_pool"] = writer_pool._writer_pool.stats()
+    if coalescer._coalescer is not None:
+        # Requests attached to a running generation count as hits
+        stats = coalescer._coalescer.stats()
+        caches["coalescing"] = {"hits": stats["joins"], "misses": stats["leaders"]}
+    return cache_family(caches)
+
+
+def _collect_workers():
+    """Inference executor, chunk scheduler and FlashSR pool occupancy."""
+    from ..inference import executor
+    from ..services import chunk_scheduler, flashsr_service
+
+    families = []
+    if chunk_scheduler._chunk_scheduler is not None:
+        stats = chunk_scheduler._chunk_scheduler.stats()
+        families.append(
+            (
+                "kokoro_scheduler_busy_slots",
+                "gauge",
+                "Inference slots held by text chunks",
+                [("kokoro_scheduler_busy_slots", {}, stats["busy_slots"])],
+            )
+        )
+        families.append(
+            (
+                "kokoro_scheduler_waiting_chunks",
+                "gauge",
+                "Text chunks waiting for an inference slot",
+                [
+                    ("kokoro_scheduler_waiting_chunks", {"priority": priority}, count)
+                    for priority, count in stats["waiting"].items()
+                ],
+            )
+        )
+        families.append(
+            (
+                "kokoro_scheduler_served_chunks_total",
+                "counter",
+                "Text chunks given an inference slot",
+                [
+                    ("kokoro_scheduler_served_chunks_total", {"priority": priority}, count)
+                    for priority, count in stats["served"].items()
+                ],
+            )
+        )
+    if executor._executor is not None:
+        stats = executor._executor.stats()
+        families.append(
+            (
+                "kokoro_inference_active_jobs",
+                "gauge",
+                "Inference jobs currently running or queued",
+                [("kokoro_inference_active_jobs", {}, stats["active_jobs"])],
+            )
+        )
+        families.append(
+            (
+                "kokoro_inference_jobs_total",
+                "counter",
+                "Inference jobs submitted",
+                [("kokoro_inference_jobs_total", {}, stats["total_jobs"])],
+            )
+        )
+
+    if flashsr_service._flashsr_pool is not None:
+        stats = flashsr_service._flashsr_pool.stats()
+        families.append(
+            (
+                "kokoro_flashsr_chunks",
+                "gauge",
+                "FlashSR chunks by state",
+                [
+                    ("kokoro_flashsr_chunks", {"state": "active"}, stats["active"]),
+                    ("kokoro_flashsr_chunks", {"state": "queued"}, stats["queued"]),
+                ],
+            )
+        )
+        families.append(
+            (
+                "kokoro_flashsr_results_total",
+                "counter",
+                "FlashSR chunks by outcome",
+                [
+                    (
+                        "kokoro_flashsr_results_total",
+                        {"result": result},
+                        stats[key],
+                    )
+                    for result, key in (
+                        ("completed", "completed"),
+                        ("fallback", "fallbacks"),
+                        ("failure", "failures"),
+                    )
+                ],
+            )
+        )
+    return families
+
+
+def _collect_admission():
+    """Admission controller backlog and rejections."""
+    from ..services import admission
+
+    if admission._admission_controller is None:
+        return []
+    state = admission._admission_controller.state()
+    gauges = [
+        (
+            "kokoro_admission_in_flight_requests",
+            "Admitted requests still generating",
+            "in_flight_requests",
+        ),
+        (
+            "kokoro_admission_in_flight_audio_seconds",
+            "Estimated audio seconds left to generate",
+            "in_flight_audio_seconds",
+        ),
+        (
+            "kokoro_admission_estimated_drain_seconds",
+            "Estimated time to generate the in-flight audio",
+            "estimated_drain_seconds",
+        ),
+        (
+            "kokoro_admission_queue_wait_seconds",
+            "Recent average wait from admission to first audio",
+            "queue_wait_seconds",
+        ),
+    ]
+    families = [
+        (name, "gauge", documentation, [(name, {}, state[key])])
+        for name, documentation, key in gauges
+        if state[key] is not None
+    ]
+    families.append(
+        (
+            "kokoro_admission_rejections_total",
+            "counter",
+            "Requests rejected by admission control",
+            [
+                ("kokoro_admission_rejections_total", {"reason": reason}, count)
+                for reason, count in state["rejected"].items()
+            ],
+        )
+    )
+    return families
+
+
+REGISTRY.register_collector(_collect_caches)
+REGISTRY.register_collector(_collect_workers)
+REGISTRY.register_collector(_collect_admission)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Get service metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -1,15 +1,17 @@
 """OpenAI-compatible router for text-to-speech"""
 
+import asyncio
 import io
 import json
 import os
 import re
 import tempfile
-from typing import AsyncGenerator, Dict, List, Tuple, Union
+import unicodedata
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Dict, List, Optional, Tuple, Union
 from urllib import response
 
 import aiofiles
-import numpy as np
 import torch
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from fastapi.responses import FileResponse, StreamingResponse
@@ -17,9 +19,18 @@ from loguru import logger
 
 from ..core.config import settings
 from ..inference.base import AudioChunk
-from ..services.audio import AudioService
+from ..inference.cancellation import CancellationToken, GenerationCancelled
+from ..services.admission import (
+    AdmissionRejected,
+    AdmissionTicket,
+    get_admission_controller,
+)
+from ..services.coalescer import Flight, get_coalescer
+from ..services.response_cache import ResponseCache, get_response_cache
+from ..services.resumable_streams import StreamExpired, get_resumable_streams
 from ..services.streaming_audio_writer import StreamingAudioWriter
-from ..services.tts_service import TTSService
+from ..services.tts_service import GenerationReport, TTSService
+from ..services.writer_pool import get_writer_pool
 from ..structures import OpenAISpeechRequest
 from ..structures.schemas import CaptionedSpeechRequest
 
@@ -132,11 +143,45 @@ async def process_and_validate_voices(
     return "".join(voices)
 
 
+async def client_disconnected(client_request: Request) -> bool:
+    """Check whether the client has gone away"""
+    is_disconnected = client_request.is_disconnected
+    if callable(is_disconnected):
+        is_disconnected = await is_disconnected()
+    return bool(is_disconnected)
+
+
+@asynccontextmanager
+async def watch_disconnect(client_request: Request, cancel: CancellationToken):
+    """Cancel a generation as soon as its client disconnects
+
+    Polls in the background, so a disconnect is noticed while a chunk is
+    still being synthesized rather than only when it is sent.
+    """
+
+    async def watch():
+        try:
+            while not cancel.cancelled:
+                if await client_disconnected(client_request):
+                    cancel.cancel("client_disconnected")
+                    return
+                await asyncio.sleep(settings.disconnect_poll_interval_s)
+        except Exception as e:
+            logger.debug(f"Stopped watching for client disconnect: {e}")
+
+    task = asyncio.create_task(watch())
+    try:
+        yield cancel
+    finally:
+        task.cancel()
+
+
 async def stream_audio_chunks(
     tts_service: TTSService,
     request: Union[OpenAISpeechRequest, CaptionedSpeechRequest],
     client_request: Request,
     writer: StreamingAudioWriter,
+    report: Optional[GenerationReport] = None,
 ) -> AsyncGenerator[AudioChunk, None]:
     """Stream audio chunks as they're generated with client disconnect handling"""
     voice_name = await process_and_validate_voices(request.voice, tts_service)
@@ -144,38 +189,255 @@ async def stream_audio_chunks(
     if hasattr(request, "return_timestamps"):
         unique_properties["return_timestamps"] = request.return_timestamps
 
+    cancel = CancellationToken()
     try:
-        async for chunk_data in tts_service.generate_audio_stream(
-            text=request.input,
-            voice=voice_name,
-            writer=writer,
-            speed=request.speed,
-            output_format=request.response_format,
-            lang_code=request.lang_code,
-            volume_multiplier=request.volume_multiplier,
-            normalization_options=request.normalization_options,
-            return_timestamps=unique_properties["return_timestamps"],
-        ):
-            # Check if client is still connected
-            is_disconnected = client_request.is_disconnected
-            if callable(is_disconnected):
-                is_disconnected = await is_disconnected()
-            if is_disconnected:
-                logger.info("Client disconnected, stopping audio generation")
-                break
-
-            yield chunk_data
+        async with watch_disconnect(client_request, cancel):
+            async for chunk_data in tts_service.generate_audio_stream(
+                text=request.input,
+                voice=voice_name,
+                writer=writer,
+                speed=request.speed,
+                output_format=request.response_format,
+                lang_code=request.lang_code,
+                volume_multiplier=request.volume_multiplier,
+                normalization_options=request.normalization_options,
+                return_timestamps=unique_properties["return_timestamps"],
+                priority=getattr(request, "priority", None),
+                cancel=cancel,
+                report=report,
+            ):
+                # Check if client is still connected
+                if cancel.cancelled or await client_disconnected(client_request):
+                    logger.info("Client disconnected, stopping audio generation")
+                    cancel.cancel("client_disconnected")
+                    break
+
+                yield chunk_data
+    except GenerationCancelled:
+        logger.info("Client disconnected, stopped audio generation")
     except Exception as e:
         logger.error(f"Error in audio streaming: {str(e)}")
         # Let the exception propagate to trigger cleanup
         raise
 
 
+async def start_generation(
+    chunks: AsyncGenerator[AudioChunk, None],
+    ticket: Optional[AdmissionTicket],
+    sample_rate: int,
+    deadline_s: Optional[float],
+) -> AsyncGenerator[AudioChunk, None]:
+    """Report generated audio to the admission ticket and enforce the deadline
+
+    With a deadline, the first chunk is awaited here so a request that misses
+    it can still be rejected before any response is sent.
+
+    Raises:
+        AdmissionRejected: If no audio was generated within the deadline
+    """
+
+    async def tracked():
+        try:
+            async for chunk_data in chunks:
+                if ticket is not None and chunk_data.audio is not None:
+                    ticket.progress(len(chunk_data.audio) / sample_rate)
+                yield chunk_data
+        finally:
+            if ticket is not None:
+                ticket.release()
+
+    return await await_first(tracked(), deadline_s)
+
+
+async def await_first(
+    generator: AsyncGenerator, deadline_s: Optional[float]
+) -> AsyncGenerator:
+    """Wait for a generator's first item within the deadline
+
+    The item is kept and yielded first by the returned generator, which
+    closes ``generator`` as soon as it is closed itself.
+
+    Raises:
+        AdmissionRejected: If nothing was produced within the deadline
+    """
+    if deadline_s is None:
+        return generator
+
+    try:
+        first = await asyncio.wait_for(generator.__anext__(), deadline_s)
+    except StopAsyncIteration:
+        return generator
+    except asyncio.TimeoutError:
+        raise AdmissionRejected(
+            "deadline", f"No audio within the {deadline_s:.1f}s deadline", 1
+        )
+
+    async def resumed():
+        try:
+            yield first
+            async for item in generator:
+                yield item
+        finally:
+            # Stop the generation running behind the first item right away
+            await generator.aclose()
+
+    return resumed()
+
+
+def detached_generation(
+    tts_service: TTSService,
+    request: OpenAISpeechRequest,
+    voice_name: str,
+    writer: StreamingAudioWriter,
+    cancel: Optional[CancellationToken] = None,
+    report: Optional[GenerationReport] = None,
+) -> AsyncGenerator[AudioChunk, None]:
+    """Generate speech for a request, independently of the client connection"""
+    return tts_service.generate_audio_stream(
+        text=request.input,
+        voice=voice_name,
+        writer=writer,
+        speed=request.speed,
+        output_format=request.response_format,
+        lang_code=request.lang_code,
+        volume_multiplier=request.volume_multiplier,
+        normalization_options=request.normalization_options,
+        priority=request.priority,
+        playback=request.stream,
+        cancel=cancel,
+        report=report,
+    )
+
+
+async def encoded_output(
+    chunks: AsyncGenerator[AudioChunk, None],
+    writer: StreamingAudioWriter,
+    cache: Optional[ResponseCache],
+    cache_key: Optional[str],
+    report: GenerationReport,
+) -> AsyncGenerator[bytes, None]:
+    """Encoded output of a detached generation, cached once it completes"""
+    parts = []
+    try:
+        async for chunk_data in chunks:
+            if chunk_data.output:  # Skip empty chunks
+                parts.append(chunk_data.output)
+                yield chunk_data.output
+
+        # Don't cache output missing chunks that failed to generate
+        if cache is not None and report.complete:
+            await cache.put(cache_key, b"".join(parts))
+    finally:
+        writer.close()
+
+
+async def join_flight(
+    flight: Flight, client_request: Request, deadline_s: Optional[float] = None
+) -> bytes:
+    """Collect the whole output of a shared generation for one client
+
+    The subscription is closed as soon as the client disconnects, so a
+    generation nobody is waiting for anymore gets cancelled.
+
+    Raises:
+        GenerationCancelled: If the client disconnected first
+        AdmissionRejected: If no audio was generated within the deadline
+    """
+
+    async def join():
+        subscription = await await_first(flight.subscribe(), deadline_s)
+        return b"".join([chunk async for chunk in subscription])
+
+    joined = asyncio.create_task(join())
+    disconnected = CancellationToken()
+    try:
+        async with watch_disconnect(client_request, disconnected):
+            while not joined.done():
+                if disconnected.cancelled:
+                    raise GenerationCancelled(disconnected.reason)
+                await asyncio.wait(
+                    {joined}, timeout=settings.disconnect_poll_interval_s
+                )
+        return joined.result()
+    finally:
+        joined.cancel()
+
+
+async def coalesced_response(
+    flight: Flight,
+    request: OpenAISpeechRequest,
+    client_request: Request,
+    content_type: str,
+    role: str,
+    deadline_s: Optional[float] = None,
+) -> Response:
+    """Respond from a generation shared with identical requests
+
+    Each request applies its own deadline to the shared generation's first
+    audio, leaving it if the deadline is missed.
+
+    With resumable streams enabled, each streaming request buffers its own
+    subscription, so it gets an X-Stream-Id while the generation is shared.
+    A stream nobody resumes closes its subscription once it expires.
+
+    Raises:
+        AdmissionRejected: If no audio was generated within the deadline
+    """
+    headers = {
+        "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+        "Cache-Control": "no-cache",
+        "X-Coalesced": role,
+    }
+    if request.stream:
+        headers.update({"X-Accel-Buffering": "no", "Transfer-Encoding": "chunked"})
+        subscription = await await_first(flight.subscribe(), deadline_s)
+        if settings.enable_resumable_streams:
+            # The flight cancels the shared generation once every stream is gone
+            stream = get_resumable_streams().start(subscription, None, content_type)
+            headers["X-Stream-Id"] = stream.id
+            return StreamingResponse(
+                stream.read(), media_type=content_type, headers=headers
+            )
+        return StreamingResponse(
+            subscription, media_type=content_type, headers=headers
+        )
+
+    output = await join_flight(flight, client_request, deadline_s)
+    return Response(content=output, media_type=content_type, headers=headers)
+
+
+def request_deadline(
+    request: OpenAISpeechRequest, header_ms: Optional[float]
+) -> Optional[float]:
+    """Get the stricter of the request's deadline field and header, in seconds"""
+    deadlines = [
+        ms for ms in (request.deadline_ms, header_ms) if ms is not None and ms > 0
+    ]
+    return min(deadlines) / 1000 if deadlines else None
+
+
+def response_cache_key(request: OpenAISpeechRequest, voice_name: str) -> str:
+    """Build the response cache key for a speech request"""
+    return ResponseCache.make_key(
+        input=unicodedata.normalize("NFC", request.input).strip(),
+        voice=voice_name,
+        speed=request.speed,
+        lang_code=request.lang_code,
+        volume_multiplier=request.volume_multiplier,
+        normalization_options=request.normalization_options.model_dump()
+        if request.normalization_options
+        else None,
+        response_format=request.response_format,
+        flashsr=settings.enable_flashsr,
+    )
+
+
 @router.post("/audio/speech")
 async def create_speech(
     request: OpenAISpeechRequest,
     client_request: Request,
     x_raw_response: str = Header(None, alias="x-raw-response"),
+    x_deadline_ms: Optional[float] = Header(None, alias="x-deadline-ms"),
 ):
     """OpenAI-compatible endpoint for text-to-speech"""
     # Validate model before processing request
@@ -204,166 +466,352 @@ async def create_speech(
             "pcm": "audio/pcm",
         }.get(request.response_format, f"audio/{request.response_format}")
 
-        # Determine sample rate based on FlashSR setting
-        output_sample_rate = (
-            settings.flashsr_output_sample_rate if settings.enable_flashsr else settings.sample_rate
-        )
-        writer = StreamingAudioWriter(request.response_format, sample_rate=output_sample_rate)
+        # Serve repeated requests from the response cache if enabled
+        cache = None
+        cache_key = None
+        if settings.enable_response_cache and not request.return_download_link:
+            cache = get_response_cache()
+            cache_key = response_cache_key(request, voice_name)
+            cached, tier = await cache.get(cache_key)
+            if cached is not None:
+                headers = {
+                    "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+                    "X-Cache": "HIT",
+                    "X-Cache-Tier": tier,
+                }
+                if request.stream:
+
+                    async def replay_output():
+                        for start in range(0, len(cached), 65536):
+                            yield cached[start : start + 65536]
+
+                    headers.update(
+                        {
+                            "X-Accel-Buffering": "no",
+                            "Cache-Control": "no-cache",
+                            "Transfer-Encoding": "chunked",
+                        }
+                    )
+                    return StreamingResponse(
+                        replay_output(), media_type=content_type, headers=headers
+                    )
+                headers["Cache-Control"] = "no-cache"
+                return Response(content=cached, media_type=content_type, headers=headers)
+
+        deadline_s = request_deadline(request, x_deadline_ms)
+
+        # Attach to an identical request that is already being generated
+        coalescer = None
+        flight_key = None
+        if settings.enable_request_coalescing and not request.return_download_link:
+            coalescer = get_coalescer()
+            flight_key = cache_key or response_cache_key(request, voice_name)
+            flight = coalescer.get(flight_key)
+            if flight is not None:
+                return await coalesced_response(
+                    flight, request, client_request, content_type, "joined", deadline_s
+                )
 
-        # Check if streaming is requested (default for OpenAI client)
-        if request.stream:
-            # Create generator but don't start it yet
-            generator = stream_audio_chunks(
-                tts_service, request, client_request, writer
+        # Shed load before any work is done for the request
+        ticket = None
+        if settings.enable_admission_control:
+            ticket = get_admission_controller().admit(
+                request.input, request.speed, deadline_s
             )
 
-            # If download link requested, wrap generator with temp file writer
-            if request.return_download_link:
-                from ..services.temp_manager import TempFileWriter
-
-                # Use download_format if specified, otherwise use response_format
-                output_format = request.download_format or request.response_format
-                temp_writer = TempFileWriter(output_format)
-                await temp_writer.__aenter__()  # Initialize temp file
-
-                # Get download path immediately after temp file creation
-                download_path = temp_writer.download_path
+        try:
+            # Determine sample rate based on FlashSR setting
+            output_sample_rate = (
+                settings.flashsr_output_sample_rate if settings.enable_flashsr else settings.sample_rate
+            )
+            writer = get_writer_pool().acquire(request.response_format, sample_rate=output_sample_rate)
+
+            if coalescer is not None:
+                # Generate independently of any one client; the generation is
+                # cancelled once every request attached to it has gone. The flight
+                # is registered before any audio is awaited, so identical requests
+                # arriving meanwhile join it, and the deadline is applied to this
+                # request's subscription rather than to the shared generation.
+                cancel = CancellationToken()
+                report = GenerationReport()
+                chunks = await start_generation(
+                    detached_generation(
+                        tts_service, request, voice_name, writer, cancel, report
+                    ),
+                    ticket,
+                    output_sample_rate,
+                    None,
+                )
+                flight, created = coalescer.start(
+                    flight_key,
+                    encoded_output(chunks, writer, cache, cache_key, report),
+                    cancel,
+                )
+                if not created:
+                    # An identical request started first; nothing ran for this one
+                    cancel.cancel("coalesced")
+                    await chunks.aclose()
+                    if ticket is not None:
+                        ticket.release()
+                    writer.close()
+                    return await coalesced_response(
+                        flight, request, client_request, content_type, "joined", deadline_s
+                    )
+                return await coalesced_response(
+                    flight, request, client_request, content_type, "leader", deadline_s
+                )
 
-                # Create response headers with download path
+            if (
+                settings.enable_resumable_streams
+                and request.stream
+                and not request.return_download_link
+            ):
+                # Keep generating and buffering through a dropped connection, so
+                # the client can resume instead of starting over
+                cancel = CancellationToken()
+                report = GenerationReport()
+                chunks = await start_generation(
+                    detached_generation(
+                        tts_service, request, voice_name, writer, cancel, report
+                    ),
+                    ticket,
+                    output_sample_rate,
+                    deadline_s,
+                )
+                stream = get_resumable_streams().start(
+                    encoded_output(chunks, writer, cache, cache_key, report),
+                    cancel,
+                    content_type,
+                )
                 headers = {
-                    "Content-Disposition": f"attachment; filename=speech.{output_format}",
+                    "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
                     "X-Accel-Buffering": "no",
                     "Cache-Control": "no-cache",
                     "Transfer-Encoding": "chunked",
-                    "X-Download-Path": download_path,
+                    "X-Stream-Id": stream.id,
                 }
+                if cache is not None:
+                    headers["X-Cache"] = "MISS"
+                return StreamingResponse(
+                    stream.read(), media_type=content_type, headers=headers
+                )
 
-                # Add header to indicate if temp file writing is available
-                if temp_writer._write_error:
-                    headers["X-Download-Status"] = "unavailable"
+            # Check if streaming is requested (default for OpenAI client)
+            if request.stream:
+                # Create generator, only starting it now if a deadline must be met
+                report = GenerationReport()
+                generator = await start_generation(
+                    stream_audio_chunks(
+                        tts_service, request, client_request, writer, report
+                    ),
+                    ticket,
+                    output_sample_rate,
+                    deadline_s,
+                )
 
-                # Create async generator for streaming
-                async def dual_output():
+                # If download link requested, wrap generator with temp file writer
+                if request.return_download_link:
+                    from ..services.temp_manager import TempFileWriter
+
+                    # Use download_format if specified, otherwise use response_format
+                    output_format = request.download_format or request.response_format
+                    temp_writer = TempFileWriter(output_format)
+                    await temp_writer.__aenter__()  # Initialize temp file
+
+                    # Get download path immediately after temp file creation
+                    download_path = temp_writer.download_path
+
+                    # Create response headers with download path
+                    headers = {
+                        "Content-Disposition": f"attachment; filename=speech.{output_format}",
+                        "X-Accel-Buffering": "no",
+                        "Cache-Control": "no-cache",
+                        "Transfer-Encoding": "chunked",
+                        "X-Download-Path": download_path,
+                    }
+
+                    # Add header to indicate if temp file writing is available
+                    if temp_writer._write_error:
+                        headers["X-Download-Status"] = "unavailable"
+
+                    # Create async generator for streaming
+                    async def dual_output():
+                        try:
+                            # Write chunks to temp file and stream
+                            async for chunk_data in generator:
+                                if chunk_data.output:  # Skip empty chunks
+                                    await temp_writer.write(chunk_data.output)
+                                    # if return_json:
+                                    #    yield chunk, chunk_data
+                                    # else:
+                                    yield chunk_data.output
+
+                            # Finalize the temp file
+                            await temp_writer.finalize()
+                        except Exception as e:
+                            logger.error(f"Error in dual output streaming: {e}")
+                            await temp_writer.__aexit__(type(e), e, e.__traceback__)
+                            raise
+                        finally:
+                            # Ensure temp writer is closed
+                            if not temp_writer._finalized:
+                                await temp_writer.__aexit__(None, None, None)
+                            writer.close()
+
+                    # Stream with temp file writing
+                    return StreamingResponse(
+                        dual_output(), media_type=content_type, headers=headers
+                    )
+
+                async def single_output():
+                    parts = []
                     try:
-                        # Write chunks to temp file and stream
+                        # Stream chunks
                         async for chunk_data in generator:
                             if chunk_data.output:  # Skip empty chunks
-                                await temp_writer.write(chunk_data.output)
-                                # if return_json:
-                                #    yield chunk, chunk_data
-                                # else:
+                                if cache is not None:
+                                    parts.append(chunk_data.output)
                                 yield chunk_data.output
 
-                        # Finalize the temp file
-                        await temp_writer.finalize()
+                        # Only cache complete responses the client received in full
+                        if (
+                            cache is not None
+                            and report.complete
+                            and not await client_request.is_disconnected()
+                        ):
+                            await cache.put(cache_key, b"".join(parts))
                     except Exception as e:
-                        logger.error(f"Error in dual output streaming: {e}")
-                        await temp_writer.__aexit__(type(e), e, e.__traceback__)
-                        raise
-                    finally:
-                        # Ensure temp writer is closed
-                        if not temp_writer._finalized:
-                            await temp_writer.__aexit__(None, None, None)
+                        logger.error(f"Error in single output streaming: {e}")
                         writer.close()
+                        raise
 
-                # Stream with temp file writing
-                return StreamingResponse(
-                    dual_output(), media_type=content_type, headers=headers
-                )
-
-            async def single_output():
-                try:
-                    # Stream chunks
-                    async for chunk_data in generator:
-                        if chunk_data.output:  # Skip empty chunks
-                            yield chunk_data.output
-                except Exception as e:
-                    logger.error(f"Error in single output streaming: {e}")
-                    writer.close()
-                    raise
-
-            # Standard streaming without download link
-            return StreamingResponse(
-                single_output(),
-                media_type=content_type,
-                headers={
+                # Standard streaming without download link
+                headers = {
                     "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
                     "X-Accel-Buffering": "no",
                     "Cache-Control": "no-cache",
                     "Transfer-Encoding": "chunked",
-                },
-            )
-        else:
-            headers = {
-                "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
-                "Cache-Control": "no-cache",  # Prevent caching
-            }
-
-            # Generate complete audio using public interface
-            audio_data = await tts_service.generate_audio(
-                text=request.input,
-                voice=voice_name,
-                writer=writer,
-                speed=request.speed,
-                volume_multiplier=request.volume_multiplier,
-                normalization_options=request.normalization_options,
-                lang_code=request.lang_code,
-            )
-
-            audio_data = await AudioService.convert_audio(
-                audio_data,
-                request.response_format,
-                writer,
-                is_last_chunk=False,
-                trim_audio=False,
-                apply_flashsr=settings.enable_flashsr,
-            )
-
-            # Convert to requested format with proper finalization
-            final = await AudioService.convert_audio(
-                AudioChunk(np.array([], dtype=np.int16)),
-                request.response_format,
-                writer,
-                is_last_chunk=True,
-                apply_flashsr=settings.enable_flashsr,
-            )
-            output = audio_data.output + final.output
-
-            if request.return_download_link:
-                from ..services.temp_manager import TempFileWriter
-
-                # Use download_format if specified, otherwise use response_format
-                output_format = request.download_format or request.response_format
-                temp_writer = TempFileWriter(output_format)
-                await temp_writer.__aenter__()  # Initialize temp file
-
-                # Get download path immediately after temp file creation
-                download_path = temp_writer.download_path
-                headers["X-Download-Path"] = download_path
-
+                }
+                if cache is not None:
+                    headers["X-Cache"] = "MISS"
+                return StreamingResponse(
+                    single_output(),
+                    media_type=content_type,
+                    headers=headers,
+                )
+            else:
                 try:
-                    # Write chunks to temp file
-                    logger.info("Writing chunks to tempory file for download")
-                    await temp_writer.write(output)
-                    # Finalize the temp file
-                    await temp_writer.finalize()
-
-                except Exception as e:
-                    logger.error(f"Error in dual output: {e}")
-                    await temp_writer.__aexit__(type(e), e, e.__traceback__)
-                    raise
+                    headers = {
+                        "Content-Disposition": f"attachment; filename=speech.{request.response_format}",
+                        "Cache-Control": "no-cache",  # Prevent caching
+                    }
+
+                    # Encode chunks as they are generated so encoding overlaps
+                    # synthesis, holding only the encoded bytes until the end
+                    parts = []
+                    cancel = CancellationToken()
+                    report = GenerationReport()
+                    async with watch_disconnect(client_request, cancel):
+                        chunks = await start_generation(
+                            tts_service.generate_audio_stream(
+                                text=request.input,
+                                voice=voice_name,
+                                writer=writer,
+                                speed=request.speed,
+                                output_format=request.response_format,
+                                lang_code=request.lang_code,
+                                volume_multiplier=request.volume_multiplier,
+                                normalization_options=request.normalization_options,
+                                priority=request.priority,
+                                playback=False,
+                                cancel=cancel,
+                                report=report,
+                            ),
+                            ticket,
+                            output_sample_rate,
+                            deadline_s,
+                        )
+                        async for chunk_data in chunks:
+                            if chunk_data.output:
+                                parts.append(chunk_data.output)
+                    output = b"".join(parts)
+
+                    if cache is not None:
+                        # Don't cache output missing chunks that failed to generate
+                        if report.complete:
+                            await cache.put(cache_key, output)
+                        headers["X-Cache"] = "MISS"
+
+                    if request.return_download_link:
+                        from ..services.temp_manager import TempFileWriter
+
+                        # Use download_format if specified, otherwise use response_format
+                        output_format = request.download_format or request.response_format
+                        temp_writer = TempFileWriter(output_format)
+                        await temp_writer.__aenter__()  # Initialize temp file
+
+                        # Get download path immediately after temp file creation
+                        download_path = temp_writer.download_path
+                        headers["X-Download-Path"] = download_path
+
+                        try:
+                            # Write chunks to temp file
+                            logger.info("Writing chunks to tempory file for download")
+                            await temp_writer.write(output)
+                            # Finalize the temp file
+                            await temp_writer.finalize()
+
+                        except Exception as e:
+                            logger.error(f"Error in dual output: {e}")
+                            await temp_writer.__aexit__(type(e), e, e.__traceback__)
+                            raise
+                        finally:
+                            # Ensure temp writer is closed
+                            if not temp_writer._finalized:
+                                await temp_writer.__aexit__(None, None, None)
+
+                    return Response(
+                        content=output,
+                        media_type=content_type,
+                        headers=headers,
+                    )
                 finally:
-                    # Ensure temp writer is closed
-                    if not temp_writer._finalized:
-                        await temp_writer.__aexit__(None, None, None)
+                    # Close the writer on every path, not only with a download link
                     writer.close()
+        except BaseException:
+            # Return the admitted work now, not when the ticket is collected
+            if ticket is not None:
+                ticket.release()
+            raise
 
-            return Response(
-                content=output,
-                media_type=content_type,
-                headers=headers,
-            )
+    except GenerationCancelled as e:
+        # Nobody is left to receive a response
+        logger.info(f"Stopped generation: {str(e)}")
+
+        try:
+            writer.close()
+        except:
+            pass
+
+        return Response(status_code=499)
+    except AdmissionRejected as e:
+        # Shed load, telling the client when to come back
+        logger.warning(f"Rejected request: {str(e)}")
 
+        try:
+            writer.close()
+        except:
+            pass
+
+        raise HTTPException(
+            status_code=429,
+            detail={
+                "error": e.reason,
+                "message": str(e),
+                "type": "rate_limit_error",
+            },
+            headers={"Retry-After": str(e.retry_after)},
+        )
     except ValueError as e:
         # Handle validation errors
         logger.warning(f"Invalid request: {str(e)}")
@@ -417,6 +865,68 @@ async def create_speech(
         )
 
 
+@router.get("/audio/speech/streams/{stream_id}")
+async def resume_speech(
+    stream_id: str,
+    offset: Optional[int] = None,
+    range_header: Optional[str] = Header(None, alias="range"),
+):
+    """Resume a streamed speech response by its X-Stream-Id
+
+    The response starts at the ``offset`` query parameter or the start of a
+    ``Range: bytes=N-`` header. Buffered output is sent first, then the
+    response follows the generation live.
+    """
+    stream = None
+    if settings.enable_resumable_streams:
+        stream = get_resumable_streams().get(stream_id)
+    if stream is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "stream_not_found",
+                "message": f"Unknown or expired stream: {stream_id}",
+                "type": "invalid_request_error",
+            },
+        )
+
+    if range_header is not None:
+        match = re.fullmatch(r"bytes=(\d+)-", range_header.strip())
+        offset = int(match.group(1)) if match else -1
+    offset = offset or 0
+
+    try:
+        if stream.done and 0 < stream.end <= offset:
+            raise StreamExpired(f"Offset {offset} is past the end of the output")
+        body = stream.read(offset)
+    except StreamExpired as e:
+        raise HTTPException(
+            status_code=416,
+            detail={
+                "error": "range_not_satisfiable",
+                "message": str(e),
+                "type": "invalid_request_error",
+            },
+            headers={"Content-Range": f"bytes */{stream.end}"} if stream.done else None,
+        )
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "X-Accel-Buffering": "no",
+        "Cache-Control": "no-cache",
+        "X-Stream-Id": stream.id,
+        "X-Stream-Offset": str(offset),
+    }
+    status_code = 200
+    if stream.done and offset > 0:
+        # The total length is only known once generation has finished
+        status_code = 206
+        headers["Content-Range"] = f"bytes {offset}-{stream.end - 1}/{stream.end}"
+    return StreamingResponse(
+        body, status_code=status_code, media_type=stream.media_type, headers=headers
+    )
+
+
 @router.get("/download/{filename}")
 async def download_audio_file(filename: str):
     """Download a generated audio file from temp storage"""
@@ -0,0 +1,237 @@
+"""Admission control and load shedding for speech requests"""
+
+import math
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+from loguru import logger
+
+from ..core.config import settings
+from .tts_service import SAMPLES_PER_TOKEN
+
+# Half-life of the throughput estimate, in seconds of wall time
+THROUGHPUT_HALFLIFE_S = 30.0
+# Busy time observed before throughput is trusted; until then everything is admitted
+MIN_BUSY_S = 1.0
+# Weight of the newest observation in the queue wait average
+QUEUE_WAIT_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """A request was shed instead of queued.
+
+    Attributes:
+        reason: "overloaded" or "deadline"
+        retry_after: Seconds after which a retry is likely to be admitted
+    """
+
+    def __init__(self, reason: str, message: str, retry_after: int):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """An admitted request's share of the in-flight work."""
+
+    def __init__(self, controller: "AdmissionController", audio_seconds: float):
+        self._controller = controller
+        self.admitted_at = time.monotonic()
+        self.remaining = audio_seconds
+        self.started = False
+        self.released = False
+
+    def progress(self, audio_seconds: float) -> None:
+        """Record audio generated for this request.
+
+        Args:
+            audio_seconds: Duration of the audio just produced
+        """
+        self._controller._progress(self, audio_seconds)
+
+    def release(self) -> None:
+        """Return the request's remaining work. Safe to call more than once."""
+        self._controller._release(self)
+
+    def __del__(self):
+        # Safety net only: requests release their tickets explicitly, but a
+        # streaming response that never started iterating is never closed
+        if not self.released:
+            logger.warning("Admission ticket collected without being released")
+            self._controller._release(self)
+
+
+class AdmissionController:
+    """Admits requests while the queued audio can be synthesized in time.
+
+    Each admitted request adds its estimated audio duration to the in-flight
+    backlog, which shrinks as audio is produced. Throughput is the audio
+    produced per second while any request was in flight, decayed over
+    ``THROUGHPUT_HALFLIFE_S``, so ``backlog / throughput`` estimates when a
+    new request would finish. Requests that would finish later than
+    ``max_completion_s`` are rejected, as are requests whose deadline is
+    shorter than the recent wait for first audio. An idle server admits
+    everything.
+    """
+
+    def __init__(self, max_completion_s: float):
+        self._max_completion_s = max_completion_s
+        # Reentrant, since a ticket collected while the lock is held releases itself
+        self._lock = threading.RLock()
+        self._tickets: "weakref.WeakSet[AdmissionTicket]" = weakref.WeakSet()
+        self._backlog = 0.0
+        self._audio_sum = 0.0
+        self._busy_sum = 0.0
+        self._last = time.monotonic()
+        self._queue_wait: Optional[float] = None
+        self._admitted = 0
+        self._rejected: Dict[str, int] = {"overloaded": 0, "deadline": 0}
+
+    @staticmethod
+    def estimate_seconds(text: str, speed: float = 1.0) -> float:
+        """Estimate the audio duration of a request's text.
+
+        Args:
+            text: Input text
+            speed: Speed multiplier
+
+        Returns:
+            Estimated audio seconds
+        """
+        return len(text) * SAMPLES_PER_TOKEN / 24000 / max(speed, 0.1)
+
+    def admit(
+        self, text: str, speed: float = 1.0, deadline_s: Optional[float] = None
+    ) -> AdmissionTicket:
+        """Admit a request or shed it.
+
+        Args:
+            text: Input text
+            speed: Speed multiplier
+            deadline_s: Seconds the caller is willing to wait for first audio
+
+        Returns:
+            Ticket to report progress on and release when done
+
+        Raises:
+            AdmissionRejected: If the request should be retried later
+        """
+        audio_seconds = self.estimate_seconds(text, speed)
+        with self._lock:
+            self._advance()
+            if self._tickets:
+                drain = self._drain_time(self._backlog + audio_seconds)
+                if drain is not None and drain > self._max_completion_s:
+                    self._reject(
+                        "overloaded",
+                        f"Estimated completion in {drain:.1f}s exceeds {self._max_completion_s:.1f}s",
+                        drain - self._max_completion_s,
+                    )
+                if (
+                    deadline_s is not None
+                    and self._queue_wait is not None
+                    and self._queue_wait > deadline_s
+                ):
+                    self._reject(
+                        "deadline",
+                        f"Expected wait of {self._queue_wait:.1f}s exceeds the {deadline_s:.1f}s deadline",
+                        self._queue_wait - deadline_s,
+                    )
+
+            ticket = AdmissionTicket(self, audio_seconds)
+            self._tickets.add(ticket)
+            self._backlog += audio_seconds
+            self._admitted += 1
+            return ticket
+
+    def _reject(self, reason: str, message: str, excess: float) -> None:
+        self._rejected[reason] += 1
+        raise AdmissionRejected(reason, message, max(1, math.ceil(excess)))
+
+    def _advance(self) -> None:
+        """Decay the throughput sums and count busy time up to now."""
+        now = time.monotonic()
+        elapsed = now - self._last
+        decay = 0.5 ** (elapsed / THROUGHPUT_HALFLIFE_S)
+        self._audio_sum *= decay
+        self._busy_sum *= decay
+        if self._tickets:
+            self._busy_sum += elapsed
+        self._last = now
+
+    def _throughput(self) -> Optional[float]:
+        """Audio seconds produced per busy second, once enough was observed."""
+        if self._busy_sum < MIN_BUSY_S or self._audio_sum <= 0:
+            return None
+        return self._audio_sum / self._busy_sum
+
+    def _drain_time(self, audio_seconds: float) -> Optional[float]:
+        """Wall time to synthesize audio at the current throughput, if known."""
+        throughput = self._throughput()
+        return audio_seconds / throughput if throughput else None
+
+    def _progress(self, ticket: AdmissionTicket, audio_seconds: float) -> None:
+        with self._lock:
+            if ticket.released:
+                return
+            self._advance()
+            self._audio_sum += audio_seconds
+            done = min(audio_seconds, ticket.remaining)
+            ticket.remaining -= done
+            self._backlog -= done
+            if not ticket.started:
+                ticket.started = True
+                wait = time.monotonic() - ticket.admitted_at
+                self._queue_wait = (
+                    wait
+                    if self._queue_wait is None
+                    else QUEUE_WAIT_ALPHA * wait + (1 - QUEUE_WAIT_ALPHA) * self._queue_wait
+                )
+
+    def _release(self, ticket: AdmissionTicket) -> None:
+        with self._lock:
+            if ticket.released:
+                return
+            self._advance()
+            ticket.released = True
+            self._tickets.discard(ticket)
+            self._backlog = max(0.0, self._backlog - ticket.remaining)
+
+    def state(self) -> dict:
+        """Get queue state, for autoscaling.
+
+        Returns:
+            Dict with in-flight work, throughput, estimates and counts
+        """
+        with self._lock:
+            self._advance()
+            drain = self._drain_time(self._backlog)
+            return {
+                "in_flight_requests": len(self._tickets),
+                "in_flight_audio_seconds": self._backlog,
+                "throughput": self._throughput(),
+                "estimated_drain_seconds": drain,
+                "queue_wait_seconds": self._queue_wait,
+                "max_completion_seconds": self._max_completion_s,
+                "admitted": self._admitted,
+                "rejected": dict(self._rejected),
+            }
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the global admission controller.
+
+    Returns:
+        AdmissionController instance
+    """
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController(
+            max_completion_s=settings.admission_max_completion_s
+        )
+    return _admission_controller
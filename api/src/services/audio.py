@@ -1,5 +1,6 @@
 """Audio conversion service"""
 
+import asyncio
 import math
 import struct
 import time
@@ -14,6 +15,7 @@ from pydub import AudioSegment
 from torch import norm
 
 from ..core.config import settings
+from ..core.metrics import stage_timer
 from ..inference.base import AudioChunk
 from .streaming_audio_writer import StreamingAudioWriter
 
@@ -77,22 +79,15 @@ class AudioNormalizer:
             10 ** (silence_threshold_db / 20)
         )
         # Find the first samples above the silence threshold at the start and end of the audio
-        non_silent_index_start, non_silent_index_end = None, None
-
-        for X in range(0, len(audio_data)):
-            if abs(audio_data[X]) > amplitude_threshold:
-                non_silent_index_start = X
-                break
-
-        for X in range(len(audio_data) - 1, -1, -1):
-            if abs(audio_data[X]) > amplitude_threshold:
-                non_silent_index_end = X
-                break
+        non_silent = np.abs(audio_data) > amplitude_threshold
 
         # Handle the case where the entire audio is silent
-        if non_silent_index_start == None or non_silent_index_end == None:
+        if not non_silent.any():
             return 0, len(audio_data)
 
+        non_silent_index_start = int(np.argmax(non_silent))
+        non_silent_index_end = len(audio_data) - 1 - int(np.argmax(non_silent[::-1]))
+
         return max(non_silent_index_start - self.samples_to_pad_start, 0), min(
             non_silent_index_end + math.ceil(samples_to_pad_end / speed),
             len(audio_data),
@@ -169,60 +164,111 @@ class AudioService:
             if output_format not in AudioService.SUPPORTED_FORMATS:
                 raise ValueError(f"Format {output_format} not supported")
 
-            # Always normalize audio to ensure proper amplitude scaling
-            if normalizer is None:
-                normalizer = AudioNormalizer()
+            audio_chunk = await AudioService.postprocess_audio(
+                audio_chunk,
+                speed,
+                chunk_text,
+                is_last_chunk=is_last_chunk,
+                trim_audio=trim_audio,
+                normalizer=normalizer,
+                apply_flashsr=apply_flashsr,
+            )
+            return AudioService.encode_audio(audio_chunk, writer, is_last_chunk)
 
-            audio_chunk.audio = normalizer.normalize(audio_chunk.audio)
+        except Exception as e:
+            logger.error(f"Error converting audio stream to {output_format}: {str(e)}")
+            raise ValueError(
+                f"Failed to convert audio stream to {output_format}: {str(e)}"
+            )
 
-            if trim_audio == True:
+    @staticmethod
+    async def postprocess_audio(
+        audio_chunk: AudioChunk,
+        speed: float = 1,
+        chunk_text: str = "",
+        is_last_chunk: bool = False,
+        trim_audio: bool = True,
+        normalizer: AudioNormalizer = None,
+        apply_flashsr: bool = False,
+    ) -> AudioChunk:
+        """Normalize, trim and optionally super-resolve an audio chunk
+
+        Args:
+            audio_chunk: Audio chunk to process
+            speed: The speaking speed of the voice
+            chunk_text: The text sent to the model to generate the resulting speech
+            is_last_chunk: Whether this is the last chunk
+            trim_audio: Whether audio should be trimmed
+            normalizer: Optional AudioNormalizer instance for consistent normalization
+            apply_flashsr: Whether to apply FlashSR super-resolution
+
+        Returns:
+            Processed audio chunk (int16)
+        """
+        # Always normalize audio to ensure proper amplitude scaling
+        if normalizer is None:
+            normalizer = AudioNormalizer()
+
+        audio_chunk.audio = normalizer.normalize(audio_chunk.audio)
+
+        if trim_audio == True:
+            with stage_timer("trim"):
                 audio_chunk = AudioService.trim_audio(
                     audio_chunk, chunk_text, speed, is_last_chunk, normalizer
                 )
 
-            # Apply FlashSR super-resolution if enabled
-            if apply_flashsr and len(audio_chunk.audio) > 0:
-                try:
-                    from .flashsr_service import get_flashsr_service
-
-                    flashsr_service = await get_flashsr_service()
-                    if flashsr_service and flashsr_service.is_available():
-                        # Convert int16 to float32 for FlashSR
-                        audio_float = audio_chunk.audio.astype(np.float32) / 32767.0
-                        # Upsample using FlashSR
-                        upsampled = flashsr_service.upsample_audio(
-                            audio_float, input_sample_rate=settings.sample_rate
-                        )
-                        # Convert back to int16 with proper clamping
-                        upsampled_clamped = np.clip(upsampled, -1.0, 1.0)
-                        audio_chunk.audio = (upsampled_clamped * 32767.0).astype(np.int16)
-                        logger.debug(
-                            f"Applied FlashSR super-resolution: {settings.sample_rate}Hz -> 48kHz"
-                        )
-                except Exception as e:
-                    logger.warning(f"FlashSR processing failed, using original audio: {e}")
+        # Apply FlashSR super-resolution if enabled
+        if apply_flashsr and len(audio_chunk.audio) > 0:
+            try:
+                from .flashsr_service import get_flashsr_pool, get_flashsr_service
+
+                flashsr_service = await get_flashsr_service()
+                # Runs on FlashSR's own workers, or a polyphase upsample under load
+                with stage_timer("flashsr"):
+                    audio_chunk.audio = await get_flashsr_pool().upsample(
+                        flashsr_service, audio_chunk.audio, settings.sample_rate
+                    )
+                logger.debug(
+                    f"Applied super-resolution: {settings.sample_rate}Hz -> 48kHz"
+                )
+            except Exception as e:
+                logger.warning(f"FlashSR processing failed, using original audio: {e}")
+
+        return audio_chunk
+
+    @staticmethod
+    def encode_audio(
+        audio_chunk: AudioChunk,
+        writer: StreamingAudioWriter,
+        is_last_chunk: bool = False,
+    ) -> AudioChunk:
+        """Encode processed audio with the stream's writer
+
+        Args:
+            audio_chunk: Processed int16 audio chunk
+            writer: The StreamingAudioWriter to use
+            is_last_chunk: Whether to finalize the stream after this chunk
 
+        Returns:
+            The audio chunk with its encoded bytes in ``output``
+        """
+        chunk_data = b""
+        with stage_timer("encode"):
             # Write audio data first
             if len(audio_chunk.audio) > 0:
                 chunk_data = writer.write_chunk(audio_chunk.audio)
 
             # Then finalize if this is the last chunk
-            if is_last_chunk:
-                final_data = writer.write_chunk(finalize=True)
+            final_data = writer.write_chunk(finalize=True) if is_last_chunk else None
 
-                if final_data:
-                    audio_chunk.output = final_data
-                return audio_chunk
-
-            if chunk_data:
-                audio_chunk.output = chunk_data
+        if is_last_chunk:
+            if final_data:
+                audio_chunk.output = final_data
             return audio_chunk
 
-        except Exception as e:
-            logger.error(f"Error converting audio stream to {output_format}: {str(e)}")
-            raise ValueError(
-                f"Failed to convert audio stream to {output_format}: {str(e)}"
-            )
+        if chunk_data:
+            audio_chunk.output = chunk_data
+        return audio_chunk
 
     @staticmethod
     def trim_audio(
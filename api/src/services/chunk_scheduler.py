@@ -0,0 +1,210 @@
+"""Fair scheduling of text chunks onto inference slots across requests."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+from ..core.config import settings
+
+
+class ScheduledStream:
+    """One request's scheduling state.
+
+    A stream played back as it is generated has a playback deadline: the time
+    its listener runs out of audio, ``first_audio_at + audio_seconds``. Before
+    its first audio arrives the listener is already waiting, so the deadline
+    is the time the request arrived.
+    """
+
+    def __init__(self, priority: str, weight: float, playback: bool):
+        self.priority = priority
+        self.weight = weight
+        self.playback = playback
+        self.created_at = time.monotonic()
+        self.first_audio_at: Optional[float] = None
+        self.audio_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.last_finish = 0.0
+
+    def delivered(self, audio_seconds: float) -> None:
+        """Record audio handed to the listener.
+
+        Args:
+            audio_seconds: Duration of the audio just delivered
+        """
+        if self.first_audio_at is None:
+            self.first_audio_at = time.monotonic()
+        self.audio_seconds += audio_seconds
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Monotonic time the listener would stall, or None if not played back."""
+        if not self.playback:
+            return None
+        if self.first_audio_at is None:
+            return self.created_at
+        return self.first_audio_at + self.audio_seconds
+
+
+class _Waiter:
+    """A chunk waiting for an inference slot."""
+
+    def __init__(self, stream: ScheduledStream, start: float, finish: float):
+        self.stream = stream
+        self.start = start
+        self.finish = finish
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class ChunkScheduler:
+    """Hands out a fixed number of inference slots to chunks from all requests.
+
+    Replaces a plain semaphore, which serves chunks in arrival order and so
+    lets a long-form request compete chunk for chunk with short prompts.
+    When a slot frees up:
+
+    * chunks of played-back streams with less than ``underrun_margin_s`` of
+      audio buffered are served earliest deadline first, so a stream about to
+      stall goes before one with 20s buffered;
+    * otherwise chunks are served in weighted fair queueing order. Each chunk
+      gets a virtual finish tag of ``start + cost / weight``, where ``start``
+      is the later of its stream's previous finish tag and the virtual time,
+      and the smallest tag goes first. Streams in a class with a higher
+      weight receive proportionally more of the slots.
+    """
+
+    def __init__(self, slots: int, weights: Dict[str, float], underrun_margin_s: float):
+        self._free = slots
+        self._slots = slots
+        self._weights = weights
+        self._margin = underrun_margin_s
+        self._waiters: List[_Waiter] = []
+        self._virtual_time = 0.0
+        self._served: Dict[str, int] = {name: 0 for name in weights}
+        self._urgent_served = 0
+
+    def open_stream(
+        self, priority: Optional[str] = None, text_length: int = 0, playback: bool = True
+    ) -> ScheduledStream:
+        """Register a request.
+
+        Args:
+            priority: Priority class, or None to pick one from the text length
+            text_length: Characters of input text
+            playback: Whether the output is played back as it streams
+
+        Returns:
+            Stream to pass to ``slot``
+        """
+        if priority is None:
+            priority = (
+                "interactive"
+                if text_length <= settings.scheduler_interactive_max_chars
+                else "batch"
+            )
+        if priority not in self._weights:
+            raise ValueError(f"Unknown priority class: {priority}")
+        return ScheduledStream(priority, self._weights[priority], playback)
+
+    @asynccontextmanager
+    async def slot(self, stream: ScheduledStream, cost: float = 1.0):
+        """Hold an inference slot for one chunk.
+
+        The slot stays held while the chunk's audio is handed downstream. Its
+        executor worker keeps synthesizing into a bounded queue meanwhile and
+        is only blocked once that queue is full, so freeing the slot early
+        would just admit another chunk to wait behind the busy worker.
+
+        Args:
+            stream: Stream the chunk belongs to
+            cost: Relative size of the chunk, such as its token count
+        """
+        await self._acquire(stream, max(cost, 1.0))
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            stream.compute_seconds += time.monotonic() - start
+            self._release()
+
+    async def _acquire(self, stream: ScheduledStream, cost: float) -> None:
+        start = max(stream.last_finish, self._virtual_time)
+        stream.last_finish = start + cost / stream.weight
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            self._virtual_time = start
+            self._served[stream.priority] += 1
+            return
+
+        waiter = _Waiter(stream, start, stream.last_finish)
+        self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was handed over as the wait was cancelled
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._free += 1
+        while self._free > 0 and self._waiters:
+            waiter = self._next()
+            self._waiters.remove(waiter)
+            self._free -= 1
+            self._virtual_time = max(self._virtual_time, waiter.start)
+            self._served[waiter.stream.priority] += 1
+            waiter.future.set_result(None)
+
+    def _next(self) -> _Waiter:
+        """Pick the chunk to serve next."""
+        now = time.monotonic()
+        urgent = [
+            waiter
+            for waiter in self._waiters
+            if waiter.stream.deadline is not None
+            and waiter.stream.deadline - now <= self._margin
+        ]
+        if urgent:
+            self._urgent_served += 1
+            return min(urgent, key=lambda waiter: waiter.stream.deadline)
+        return min(self._waiters, key=lambda waiter: waiter.finish)
+
+    def stats(self) -> dict:
+        """Get scheduler statistics.
+
+        Returns:
+            Dict with slot use, waiting chunks per class and served counts
+        """
+        waiting = {name: 0 for name in self._weights}
+        for waiter in self._waiters:
+            waiting[waiter.stream.priority] += 1
+        return {
+            "slots": self._slots,
+            "busy_slots": self._slots - self._free,
+            "waiting": waiting,
+            "served": dict(self._served),
+            "served_urgent": self._urgent_served,
+        }
+
+
+_chunk_scheduler: Optional[ChunkScheduler] = None
+
+
+def get_chunk_scheduler() -> ChunkScheduler:
+    """Get the global chunk scheduler.
+
+    Returns:
+        ChunkScheduler instance
+    """
+    global _chunk_scheduler
+    if _chunk_scheduler is None:
+        _chunk_scheduler = ChunkScheduler(
+            slots=settings.chunk_slots or settings.inference_workers,
+            weights=settings.scheduler_priority_weights,
+            underrun_margin_s=settings.scheduler_underrun_margin_s,
+        )
+    return _chunk_scheduler
@@ -0,0 +1,189 @@
+"""Coalescing of identical concurrent speech requests onto one generation"""
+
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from ..inference.cancellation import CancellationToken
+
+
+class Flight:
+    """One running generation shared by every identical request.
+
+    The encoded output is kept in a broadcast buffer, so a subscriber that
+    joins late first replays what was already sent and then follows live.
+    The generation is cancelled once its last subscriber leaves, through
+    ``cancel`` as well so the inference worker stops between sub-segments.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        source: AsyncIterator[bytes],
+        cancel: Optional[CancellationToken],
+        on_done: Callable[["Flight"], None],
+    ):
+        self.key = key
+        self.chunks: List[bytes] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.cancelled = False
+        self.subscribers = 0
+        self._cancel = cancel
+        self._on_done = on_done
+        self._finished = False
+        self._event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(source))
+
+    async def _run(self, source: AsyncIterator[bytes]) -> None:
+        try:
+            async for chunk in source:
+                self.chunks.append(chunk)
+                self._publish()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            self.error = RuntimeError("Generation was cancelled")
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._publish()
+            self._finish()
+
+    def _finish(self) -> None:
+        """Report the flight as over, once."""
+        if not self._finished:
+            self._finished = True
+            self._on_done(self)
+
+    def _publish(self) -> None:
+        """Wake every subscriber waiting for more output."""
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def subscribe(self) -> AsyncGenerator[bytes, None]:
+        """Follow the generation from its first byte.
+
+        The subscriber counts from this call, so a response that is created
+        but not yet iterated still keeps the generation alive.
+
+        Returns:
+            Async generator over the encoded output
+        """
+        self.subscribers += 1
+        return self._follow()
+
+    async def _follow(self) -> AsyncGenerator[bytes, None]:
+        index = 0
+        try:
+            while True:
+                if index < len(self.chunks):
+                    index += 1
+                    yield self.chunks[index - 1]
+                elif self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                else:
+                    await self._event.wait()
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.done:
+                # Unregister right away, so an identical request arriving
+                # before the task has stopped starts afresh instead of joining
+                self.cancelled = True
+                self._finish()
+                if self._cancel is not None:
+                    self._cancel.cancel("abandoned")
+                self._task.cancel()
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Size of the broadcast buffer."""
+        return sum(len(chunk) for chunk in self.chunks)
+
+
+class Coalescer:
+    """Tracks in-flight generations by request key."""
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self._leaders = 0
+        self._joins = 0
+        self._cancelled = 0
+
+    def get(self, key: str) -> Optional[Flight]:
+        """Get the running generation for a key, counting a join if found.
+
+        Args:
+            key: Canonical request key
+
+        Returns:
+            Flight to subscribe to, or None
+        """
+        flight = self._flights.get(key)
+        if flight is not None:
+            self._joins += 1
+        return flight
+
+    def start(
+        self,
+        key: str,
+        source: AsyncIterator[bytes],
+        cancel: Optional[CancellationToken] = None,
+    ) -> Tuple[Flight, bool]:
+        """Start a generation, unless an identical one started meanwhile.
+
+        Args:
+            key: Canonical request key
+            source: Async iterator producing the encoded output
+            cancel: Token cancelled once every subscriber has left
+
+        Returns:
+            Tuple of (flight, whether ``source`` was used). If it was not, the
+            caller should close it and subscribe to the existing flight.
+        """
+        flight = self.get(key)
+        if flight is not None:
+            return flight, False
+        flight = Flight(key, source, cancel, self._finished)
+        self._flights[key] = flight
+        self._leaders += 1
+        return flight, True
+
+    def _finished(self, flight: Flight) -> None:
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+        if flight.cancelled:
+            self._cancelled += 1
+
+    def stats(self) -> dict:
+        """Get coalescing statistics.
+
+        Returns:
+            Dict with in-flight generations and counts
+        """
+        return {
+            "in_flight": len(self._flights),
+            "subscribers": sum(flight.subscribers for flight in self._flights.values()),
+            "buffered_bytes": sum(
+                flight.buffered_bytes for flight in self._flights.values()
+            ),
+            "leaders": self._leaders,
+            "joins": self._joins,
+            "cancelled": self._cancelled,
+        }
+
+
+_coalescer: Optional[Coalescer] = None
+
+
+def get_coalescer() -> Coalescer:
+    """Get the global request coalescer.
+
+    Returns:
+        Coalescer instance
+    """
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = Coalescer()
+    return _coalescer
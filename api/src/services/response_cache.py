@@ -0,0 +1,194 @@
+"""Content-addressed cache of finished speech responses"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import aiofiles
+import aiofiles.os
+from loguru import logger
+
+from ..core.config import settings
+
+
+class ResponseCache:
+    """Two-tier cache of encoded audio keyed by a hash of the request.
+
+    The memory tier is an LRU bounded by total bytes. The optional disk tier
+    keeps one file per key under ``disk_dir`` and evicts the least recently
+    used files once it grows past ``disk_bytes``. Disk hits are promoted to
+    memory.
+    """
+
+    def __init__(
+        self,
+        memory_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_bytes: int = 0,
+    ):
+        self._memory_bytes = memory_bytes
+        self._disk_dir = disk_dir
+        self._disk_bytes = disk_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        # key -> file size, least recently used first
+        self._disk_index: Optional["OrderedDict[str, int]"] = None
+        self._disk_size = 0
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(**fields: Any) -> str:
+        """Hash the fields that determine a response's audio.
+
+        Args:
+            **fields: JSON-serializable request properties
+
+        Returns:
+            Hex sha256 digest
+        """
+        payload = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self._disk_dir, f"{key}.bin")
+
+    def _load_disk_index(self) -> None:
+        """Index existing cache files, oldest first."""
+        if self._disk_index is not None:
+            return
+        os.makedirs(self._disk_dir, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self._disk_dir):
+            if entry.is_file() and entry.name.endswith(".bin"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        self._disk_index = OrderedDict(
+            (key, size) for _, key, size in sorted(entries)
+        )
+        self._disk_size = sum(self._disk_index.values())
+
+    def _store_memory(self, key: str, data: bytes) -> None:
+        if len(data) > self._memory_bytes:
+            return
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= len(self._memory.pop(key))
+            self._memory[key] = data
+            self._memory_size += len(data)
+            while self._memory_size > self._memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= len(evicted)
+
+    async def get(self, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Look up a response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Tuple of (cached bytes, tier name) or (None, None) on a miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return data, "memory"
+
+        if self._disk_dir:
+            self._load_disk_index()
+            if key in self._disk_index:
+                path = self._disk_path(key)
+                try:
+                    async with aiofiles.open(path, "rb") as f:
+                        data = await f.read()
+                    os.utime(path)
+                except OSError as e:
+                    logger.warning(f"Dropping unreadable response cache file {path}: {e}")
+                    self._disk_size -= self._disk_index.pop(key, 0)
+                else:
+                    self._disk_index.move_to_end(key)
+                    self._store_memory(key, data)
+                    self._disk_hits += 1
+                    return data, "disk"
+
+        self._misses += 1
+        return None, None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """Store a finished response in both tiers.
+
+        Args:
+            key: Cache key from make_key
+            data: Complete encoded response body
+        """
+        if not data:
+            return
+        self._store_memory(key, data)
+
+        if not self._disk_dir or len(data) > self._disk_bytes:
+            return
+        self._load_disk_index()
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            # Readers never see a partially written file
+            await aiofiles.os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write response cache file {path}: {e}")
+            return
+
+        self._disk_size -= self._disk_index.pop(key, 0)
+        self._disk_index[key] = len(data)
+        self._disk_size += len(data)
+        while self._disk_size > self._disk_bytes:
+            evicted, size = self._disk_index.popitem(last=False)
+            self._disk_size -= size
+            try:
+                await aiofiles.os.remove(self._disk_path(evicted))
+            except OSError:
+                pass
+
+    def cache_info(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with entry counts, sizes and hit counts per tier
+        """
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "disk_entries": len(self._disk_index or ()),
+            "disk_bytes": self._disk_size,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "hits": self._memory_hits + self._disk_hits,
+            "misses": self._misses,
+        }
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the global response cache.
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(
+            memory_bytes=int(settings.response_cache_memory_mb * 1024 * 1024),
+            disk_dir=settings.response_cache_dir,
+            disk_bytes=int(settings.response_cache_disk_mb * 1024 * 1024),
+        )
+    return _response_cache
@@ -0,0 +1,353 @@
+"""Streamed speech that a reconnecting client can resume by ID and offset."""
+
+import asyncio
+import os
+import uuid
+from collections import deque
+from typing import AsyncGenerator, AsyncIterator, Callable, Deque, Dict, Optional
+
+from loguru import logger
+
+from ..core.config import settings
+from ..inference.cancellation import CancellationToken
+
+# Largest read handed to a resuming client at once
+READ_SIZE = 65536
+
+
+class StreamExpired(Exception):
+    """Raised when output a reader asked for is no longer buffered."""
+
+
+class ResumableStream:
+    """One streamed generation, kept for readers that reconnect.
+
+    The encoded output is addressed by byte offset. The newest
+    ``memory_bytes`` stay in memory and older output is appended to a spill
+    file. Once the spill file would outgrow ``disk_bytes``, or without one,
+    output older than the memory window is dropped.
+
+    The generation runs independently of its readers. Once the last reader
+    leaves, it keeps going for ``grace_s`` so a client can resume; if nobody
+    comes back by then it is cancelled. Finished output is kept for another
+    ``grace_s`` after the last reader leaves.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[bytes],
+        cancel: Optional[CancellationToken],
+        media_type: str,
+        grace_s: float,
+        memory_bytes: int,
+        disk_dir: Optional[str],
+        disk_bytes: int,
+        on_expired: Callable[["ResumableStream"], None],
+    ):
+        self.id = uuid.uuid4().hex
+        self.media_type = media_type
+        self.end = 0
+        self.available_from = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.readers = 0
+        self.expired = False
+        self._cancel = cancel
+        self._grace = grace_s
+        self._memory: Deque[bytes] = deque()
+        self._memory_start = 0
+        self._memory_limit = memory_bytes
+        self._disk_path = (
+            os.path.join(disk_dir, f"{self.id}.stream") if disk_dir else None
+        )
+        self._disk_limit = disk_bytes
+        self._spilled_end = 0
+        self._on_expired = on_expired
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(source))
+
+    async def _run(self, source: AsyncIterator[bytes]) -> None:
+        try:
+            async for chunk in source:
+                await self._append(chunk)
+        except asyncio.CancelledError:
+            self.error = RuntimeError("Generation was cancelled")
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+            self._publish()
+            if self.readers == 0:
+                self._arm()
+
+    async def _append(self, chunk: bytes) -> None:
+        self._memory.append(chunk)
+        self.end += len(chunk)
+        self._publish()
+
+        # Move the oldest output out of memory once over the limit
+        memory_bytes = self.end - self._memory_start
+        evicted = []
+        # Always keep the newest chunk
+        while memory_bytes > self._memory_limit and len(evicted) < len(self._memory) - 1:
+            evicted.append(self._memory[len(evicted)])
+            memory_bytes -= len(evicted[-1])
+        if not evicted:
+            return
+        data = b"".join(evicted)
+        spilled = False
+        if (
+            self._disk_path is not None
+            and self._spilled_end + len(data) <= self._disk_limit
+            and self._spilled_end == self._memory_start
+        ):
+            try:
+                await asyncio.to_thread(self._spill, data)
+                self._spilled_end += len(data)
+                spilled = True
+            except OSError as e:
+                logger.warning(f"Failed to spill stream {self.id} to disk: {e}")
+        for _ in evicted:
+            self._memory.popleft()
+        self._memory_start += len(data)
+        if not spilled:
+            # Output before the memory window is gone; keep what is left contiguous
+            self.available_from = self._memory_start
+            self._remove_file()
+
+    def _spill(self, data: bytes) -> None:
+        with open(self._disk_path, "ab") as f:
+            f.write(data)
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        with open(self._disk_path, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    def _remove_file(self) -> None:
+        if self._disk_path is not None and self._spilled_end:
+            try:
+                os.remove(self._disk_path)
+            except OSError:
+                pass
+            self._spilled_end = 0
+
+    def _publish(self) -> None:
+        """Wake every reader waiting for more output."""
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def read(self, offset: int = 0) -> AsyncGenerator[bytes, None]:
+        """Read the output from a byte offset, then follow it live.
+
+        The reader counts from this call, so a response that is created but
+        not yet iterated keeps the stream from expiring.
+
+        Args:
+            offset: First byte to return
+
+        Returns:
+            Async generator over the output
+
+        Raises:
+            StreamExpired: If ``offset`` is outside the buffered output
+        """
+        if offset < self.available_from or offset > self.end:
+            raise StreamExpired(
+                f"Offset {offset} is outside the buffered output "
+                f"({self.available_from}-{self.end})"
+            )
+        self.readers += 1
+        self._disarm()
+        return self._follow(offset)
+
+    async def _follow(self, offset: int) -> AsyncGenerator[bytes, None]:
+        try:
+            while True:
+                if offset < self.available_from:
+                    raise StreamExpired(f"Output at offset {offset} was dropped")
+                if offset < self._spilled_end:
+                    try:
+                        data = await asyncio.to_thread(
+                            self._read_file,
+                            offset,
+                            min(READ_SIZE, self._spilled_end - offset),
+                        )
+                    except OSError:
+                        data = b""
+                    if not data:
+                        # The spill file was dropped while reading
+                        continue
+                elif offset < self.end:
+                    data = self._read_memory(offset)
+                elif self.done:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                else:
+                    await self._event.wait()
+                    continue
+                offset += len(data)
+                yield data
+        finally:
+            self.readers -= 1
+            if self.readers == 0:
+                self._arm()
+
+    def _read_memory(self, offset: int) -> bytes:
+        """Get buffered output from ``offset`` to the end of its chunk."""
+        start = self._memory_start
+        for chunk in self._memory:
+            if offset < start + len(chunk):
+                return chunk[offset - start :]
+            start += len(chunk)
+        return b""
+
+    def _arm(self) -> None:
+        """Expire the stream unless a reader comes back within the grace period."""
+        self._disarm()
+        if self.expired:
+            return
+        self._timer = asyncio.get_running_loop().call_later(self._grace, self._expire)
+
+    def _disarm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _expire(self) -> None:
+        self._timer = None
+        if self.readers:
+            return
+        self.expired = True
+        if not self.done:
+            logger.info(f"Nobody resumed stream {self.id}, cancelling its generation")
+            if self._cancel is not None:
+                self._cancel.cancel("abandoned")
+            self._task.cancel()
+        self._remove_file()
+        self._on_expired(self)
+
+
+class ResumableStreams:
+    """Registry of resumable streams by ID."""
+
+    def __init__(
+        self,
+        grace_s: float = 60.0,
+        memory_bytes: int = 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        disk_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Initialize registry.
+
+        Args:
+            grace_s: How long a stream without readers is kept
+            memory_bytes: Output kept in memory per stream
+            disk_dir: Directory older output spills to, or None to keep only
+                the memory window
+            disk_bytes: Size cap of one stream's spill file
+        """
+        self._grace = grace_s
+        self._memory_bytes = memory_bytes
+        self._disk_dir = disk_dir
+        self._disk_bytes = disk_bytes
+        self._streams: Dict[str, ResumableStream] = {}
+        self._started = 0
+        self._resumed = 0
+        self._expired = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            # Streams of a previous run can't be resumed anymore
+            for entry in os.scandir(disk_dir):
+                if entry.name.endswith(".stream"):
+                    os.remove(entry.path)
+
+    def start(
+        self,
+        source: AsyncIterator[bytes],
+        cancel: Optional[CancellationToken],
+        media_type: str,
+    ) -> ResumableStream:
+        """Start buffering a generation.
+
+        Args:
+            source: Async iterator producing the encoded output
+            cancel: Token cancelled if nobody resumes the stream in time
+            media_type: Content type of the output
+
+        Returns:
+            The stream, which the caller should start reading
+        """
+        stream = ResumableStream(
+            source,
+            cancel,
+            media_type,
+            grace_s=self._grace,
+            memory_bytes=self._memory_bytes,
+            disk_dir=self._disk_dir,
+            disk_bytes=self._disk_bytes,
+            on_expired=self._expired_stream,
+        )
+        self._streams[stream.id] = stream
+        self._started += 1
+        return stream
+
+    def get(self, stream_id: str) -> Optional[ResumableStream]:
+        """Get a stream to resume, counting a resumption if found.
+
+        Args:
+            stream_id: ID from the X-Stream-Id header
+
+        Returns:
+            Stream, or None if unknown or expired
+        """
+        stream = self._streams.get(stream_id)
+        if stream is not None:
+            self._resumed += 1
+        return stream
+
+    def _expired_stream(self, stream: ResumableStream) -> None:
+        self._streams.pop(stream.id, None)
+        self._expired += 1
+
+    def stats(self) -> dict:
+        """Get resumable stream statistics.
+
+        Returns:
+            Dict with live streams, buffered bytes and counts
+        """
+        return {
+            "streams": len(self._streams),
+            "generating": sum(not stream.done for stream in self._streams.values()),
+            "readers": sum(stream.readers for stream in self._streams.values()),
+            "memory_bytes": sum(
+                stream.end - stream._memory_start for stream in self._streams.values()
+            ),
+            "disk_bytes": sum(stream._spilled_end for stream in self._streams.values()),
+            "started": self._started,
+            "resumed": self._resumed,
+            "expired": self._expired,
+        }
+
+
+_resumable_streams: Optional[ResumableStreams] = None
+
+
+def get_resumable_streams() -> ResumableStreams:
+    """Get the global resumable stream registry.
+
+    Returns:
+        ResumableStreams instance
+    """
+    global _resumable_streams
+    if _resumable_streams is None:
+        _resumable_streams = ResumableStreams(
+            grace_s=settings.resumable_stream_grace_s,
+            memory_bytes=int(settings.resumable_stream_memory_kb * 1024),
+            disk_dir=settings.resumable_stream_dir,
+            disk_bytes=int(settings.resumable_stream_disk_mb * 1024 * 1024),
+        )
+    return _resumable_streams
@@ -0,0 +1,238 @@
+"""Cache of synthesized chunk audio shared across requests"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import torch
+from loguru import logger
+
+from ..core.config import settings
+
+
+def voice_digest(voice_tensor: torch.Tensor) -> str:
+    """Hash a voice tensor's contents.
+
+    Args:
+        voice_tensor: Voice (or blended voice) tensor
+
+    Returns:
+        Hex sha256 digest
+    """
+    data = voice_tensor.detach().to("cpu").contiguous().numpy()
+    return hashlib.sha256(data.tobytes()).hexdigest()
+
+
+class SentenceCache:
+    """LRU cache of trimmed int16 audio for text chunks.
+
+    Entries are keyed on what determines a chunk's audio, so documents that
+    share sentences reuse each other's synthesis. The memory tier is bounded
+    by total bytes. With ``disk_dir`` set, entries evicted from memory spill
+    to disk (bounded by ``disk_bytes``) and are promoted back on a hit.
+    """
+
+    def __init__(
+        self,
+        memory_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_bytes: int = 0,
+    ):
+        self._memory_bytes = memory_bytes
+        self._disk_dir = disk_dir
+        self._disk_bytes = disk_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, ...]]" = OrderedDict()
+        self._memory_size = 0
+        # key -> file size, least recently used first
+        self._disk_index: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_size = 0
+        self._hits = 0
+        self._misses = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            # Reuse audio spilled by a previous run, oldest first
+            entries = sorted(
+                (entry.stat().st_mtime, entry.name[:-4], entry.stat().st_size)
+                for entry in os.scandir(disk_dir)
+                if entry.is_file() and entry.name.endswith(".npz")
+            )
+            for _, key, size in entries:
+                self._disk_index[key] = size
+                self._disk_size += size
+
+    @staticmethod
+    def make_key(
+        tokens: Sequence[int],
+        voice: str,
+        speed: float,
+        lang_code: str,
+        volume_multiplier: float,
+        chunk_text: str,
+    ) -> str:
+        """Hash the inputs that determine a chunk's trimmed audio.
+
+        Args:
+            tokens: Phoneme tokens of the chunk
+            voice: Digest of the voice tensor
+            speed: Speaking speed
+            lang_code: Pipeline language code
+            volume_multiplier: Volume multiplier applied to the audio
+            chunk_text: Chunk text; only its final character (which sets the
+                trim padding) is part of the key
+
+        Returns:
+            Hex sha256 digest
+        """
+        payload = json.dumps(
+            [list(tokens), voice, speed, lang_code, volume_multiplier, chunk_text.strip()[-1:]]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _size(pieces: Sequence[np.ndarray]) -> int:
+        return sum(piece.nbytes for piece in pieces)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self._disk_dir, f"{key}.npz")
+
+    def _store_memory(self, key: str, pieces: Tuple[np.ndarray, ...]) -> List:
+        """Insert into memory, returning the entries evicted to make room."""
+        evicted = []
+        size = self._size(pieces)
+        if size > self._memory_bytes:
+            return [(key, pieces)]
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= self._size(self._memory.pop(key))
+            self._memory[key] = pieces
+            self._memory_size += size
+            while self._memory_size > self._memory_bytes:
+                old_key, old_pieces = self._memory.popitem(last=False)
+                self._memory_size -= self._size(old_pieces)
+                evicted.append((old_key, old_pieces))
+        return evicted
+
+    def _spill(self, entries: List) -> None:
+        """Write entries evicted from memory to disk."""
+        for key, pieces in entries:
+            size = self._size(pieces)
+            if key in self._disk_index or size > self._disk_bytes:
+                continue
+            path = self._disk_path(key)
+            try:
+                with open(path, "wb") as f:
+                    np.savez(f, *pieces)
+                size = os.path.getsize(path)
+            except OSError as e:
+                logger.warning(f"Failed to spill sentence audio to {path}: {e}")
+                continue
+            with self._lock:
+                self._disk_index[key] = size
+                self._disk_size += size
+                while self._disk_size > self._disk_bytes:
+                    old_key, old_size = self._disk_index.popitem(last=False)
+                    self._disk_size -= old_size
+                    try:
+                        os.remove(self._disk_path(old_key))
+                    except OSError:
+                        pass
+
+    def _load(self, key: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """Read a spilled entry back from disk."""
+        with self._lock:
+            size = self._disk_index.pop(key, None)
+            if size is None:
+                return None
+            self._disk_size -= size
+        path = self._disk_path(key)
+        try:
+            with np.load(path) as data:
+                pieces = tuple(data[f"arr_{i}"] for i in range(len(data.files)))
+            os.remove(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable sentence audio {path}: {e}")
+            return None
+        self._spill(self._store_memory(key, pieces))
+        return pieces
+
+    async def get(self, key: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """Look up a chunk's trimmed audio.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Tuple of int16 audio pieces, or None on a miss
+        """
+        with self._lock:
+            pieces = self._memory.get(key)
+            if pieces is not None:
+                self._memory.move_to_end(key)
+            on_disk = pieces is None and key in self._disk_index
+
+        if on_disk:
+            pieces = await asyncio.to_thread(self._load, key)
+
+        if pieces is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return pieces
+
+    async def put(self, key: str, pieces: Sequence[np.ndarray]) -> None:
+        """Store a chunk's trimmed audio.
+
+        Args:
+            key: Cache key from make_key
+            pieces: Trimmed int16 audio for each piece the model produced
+        """
+        stored = []
+        for piece in pieces:
+            # Copy so a trimmed view doesn't pin its untrimmed buffer, and
+            # freeze it since every hit shares the same array
+            piece = piece.copy()
+            piece.setflags(write=False)
+            stored.append(piece)
+        evicted = self._store_memory(key, tuple(stored))
+        if evicted and self._disk_dir:
+            await asyncio.to_thread(self._spill, evicted)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with entry counts, sizes and hit counts
+        """
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "disk_entries": len(self._disk_index),
+            "disk_bytes": self._disk_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+_sentence_cache: Optional[SentenceCache] = None
+
+
+def get_sentence_cache() -> Optional[SentenceCache]:
+    """Get the global sentence cache.
+
+    Returns:
+        SentenceCache instance, or None if disabled
+    """
+    global _sentence_cache
+    if _sentence_cache is None and settings.sentence_cache_mb > 0:
+        _sentence_cache = SentenceCache(
+            memory_bytes=int(settings.sentence_cache_mb * 1024 * 1024),
+            disk_dir=settings.sentence_cache_dir,
+            disk_bytes=int(settings.sentence_cache_disk_mb * 1024 * 1024),
+        )
+    return _sentence_cache
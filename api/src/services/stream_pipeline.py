@@ -0,0 +1,59 @@
+"""Bounded lookahead between stages of the streaming pipeline."""
+
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+# Marks the end of a stage's output on its queue
+_END = object()
+
+
+async def lookahead(source: AsyncIterator[T], depth: int) -> AsyncGenerator[T, None]:
+    """Run an async iterator in its own task, up to ``depth`` items ahead.
+
+    Chaining stages through ``lookahead`` lets each one work on the next item
+    while the stage after it is still busy with the previous one. Items are
+    delivered in order, and a stage that falls ``depth`` items ahead of its
+    consumer blocks until the consumer catches up.
+
+    Args:
+        source: Async iterator producing the stage's output
+        depth: Maximum items buffered ahead of the consumer (at least 1)
+
+    Yields:
+        Items from ``source``, in order
+
+    Raises:
+        Any exception raised by ``source``
+    """
+    queue: asyncio.Queue = asyncio.Queue(max(1, depth))
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((_END, e))
+        else:
+            await queue.put((_END, None))
+        finally:
+            # Close the source now rather than when it is garbage collected, so
+            # an inference slot it holds across a yield is released right away
+            if hasattr(source, "aclose"):
+                await source.aclose()
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        # Stop the producer if the consumer goes away early, and wait for it to
+        # close its source
+        task.cancel()
+        await asyncio.wait({task})
@@ -1,8 +1,8 @@
 """Audio conversion service with proper streaming support"""
 
+import io
 import struct
-from io import BytesIO
-from typing import Optional
+from typing import List, Optional
 
 import av
 import numpy as np
@@ -11,6 +11,93 @@ from loguru import logger
 from pydub import AudioSegment
 
 
+class PacketSink(io.RawIOBase):
+    """Write-only raw IO that keeps muxer output as a list of buffers.
+
+    PyAV hands each write a fresh bytes object, which the sink stores as is;
+    ``drain`` returns the buffers written since the last drain without
+    joining or copying them. Seeking is emulated over the whole logical
+    stream so muxers can patch headers when they close: a patch landing in
+    data not drained yet is applied, one landing in data already sent is
+    dropped, since a live stream can't be rewritten.
+    """
+
+    def __init__(self):
+        self._buffers: List[bytes] = []
+        self._drained = 0  # Logical offset of the first pending byte
+        self._size = 0
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+        self._pos = pos
+        return pos
+
+    def write(self, data) -> int:
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        length = len(data)
+        if self._pos > self._size:
+            # Writing past the end leaves a zero-filled gap, as a file would
+            self._append(bytes(self._pos - self._size))
+        if self._pos < self._size:
+            overlap = min(length, self._size - self._pos)
+            self._patch(self._pos, data[:overlap])
+            self._pos += overlap
+            data = data[overlap:]
+        if data:
+            self._append(data)
+        return length
+
+    def _append(self, data: bytes) -> None:
+        self._buffers.append(data)
+        self._size += len(data)
+        self._pos = self._size
+
+    def _patch(self, pos: int, data: bytes) -> None:
+        """Overwrite already written bytes that are still pending."""
+        if pos < self._drained:
+            skip = min(len(data), self._drained - pos)
+            logger.debug(f"Dropping {skip} bytes rewriting already sent output")
+            data = data[skip:]
+            pos += skip
+        if not data:
+            return
+        # Rare (header updates on close), so merging the pending buffers is fine
+        pending = bytearray().join(self._buffers)
+        start = pos - self._drained
+        pending[start : start + len(data)] = data
+        self._buffers = [bytes(pending)]
+
+    def drain(self) -> List[bytes]:
+        """Take the buffers written since the last drain.
+
+        Returns:
+            Muxed output buffers, in stream order
+        """
+        buffers, self._buffers = self._buffers, []
+        self._drained = self._size
+        return buffers
+
+
 class StreamingAudioWriter:
     """Handles streaming audio format conversions"""
 
@@ -31,7 +118,7 @@ class StreamingAudioWriter:
         # Format-specific setup
         if self.format in ["wav", "flac", "mp3", "pcm", "aac", "opus"]:
             if self.format != "pcm":
-                self.output_buffer = BytesIO()
+                self.output_buffer = PacketSink()
                 container_options = {}
                 # Try disabling Xing VBR header for MP3 to fix iOS timeline reading issues
                 if self.format == 'mp3':
@@ -63,10 +150,13 @@ class StreamingAudioWriter:
         if hasattr(self, "output_buffer"):
             self.output_buffer.close()
 
-    def write_chunk(
+    def write_packets(
         self, audio_data: Optional[np.ndarray] = None, finalize: bool = False
-    ) -> bytes:
-        """Write a chunk of audio data and return bytes in the target format.
+    ) -> List[bytes]:
+        """Write a chunk of audio data and return the muxed output buffers.
+
+        The buffers are the ones the muxer wrote, handed out without copying,
+        so they can go straight to the response.
 
         Args:
             audio_data: Audio data to write, or None if finalizing
@@ -79,22 +169,19 @@ class StreamingAudioWriter:
                 packets = self.stream.encode(None)
                 for packet in packets:
                     self.container.mux(packet)
-
-                # Closing the container handles writing the trailer and finalizing the file.
-                # No explicit flush method is available or needed here.
                 logger.debug("Muxed final packets.")
 
-                # Get the final bytes from the buffer *before* closing it
-                data = self.output_buffer.getvalue()
-                self.close() # Close container and buffer
-                return data
+                # Closing the container writes the trailer into the sink, so
+                # drain after closing to include it
+                self.close()
+                return self.output_buffer.drain()
 
         if audio_data is None or len(audio_data) == 0:
-            return b""
+            return []
 
         if self.format == "pcm":
             # Write raw bytes
-            return audio_data.tobytes()
+            return [audio_data.tobytes()]
         else:
             frame = av.AudioFrame.from_ndarray(
                 audio_data.reshape(1, -1),
@@ -110,7 +197,16 @@ class StreamingAudioWriter:
             for packet in packets:
                 self.container.mux(packet)
 
-            data = self.output_buffer.getvalue()
-            self.output_buffer.seek(0)
-            self.output_buffer.truncate(0)
-            return data
+            return self.output_buffer.drain()
+
+    def write_chunk(
+        self, audio_data: Optional[np.ndarray] = None, finalize: bool = False
+    ) -> bytes:
+        """Write a chunk of audio data and return bytes in the target format.
+
+        Args:
+            audio_data: Audio data to write, or None if finalizing
+            finalize: Whether this is the final write to close the stream
+        """
+        # Joining a single buffer returns it as is, without a copy
+        return b"".join(self.write_packets(audio_data, finalize))
@@ -1,13 +1,28 @@
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Tuple
 
 import phonemizer
 
 from .normalizer import normalize_text
+from ...core.config import settings
+from ...core.metrics import stage_timer
 from ...structures.schemas import NormalizationOptions
 
 phonemizers = {}
 
+# LRU cache of phonemized text keyed by (language, text)
+_phoneme_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+_phoneme_cache_lock = threading.Lock()
+_phoneme_cache_hits = 0
+_phoneme_cache_misses = 0
+
+# espeak is a shared C library and isn't safe to call from several threads
+# at once, now that smart_split phonemizes in worker threads
+_espeak_lock = threading.Lock()
+
 
 class PhonemizerBackend(ABC):
     """Abstract base class for phonemization backends"""
@@ -87,6 +102,9 @@ def create_phonemizer(language: str = "a") -> PhonemizerBackend:
 def phonemize(text: str, language: str = "a") -> str:
     """Convert text to phonemes
 
+    Results are memoized in a bounded LRU cache keyed on (language, text), so
+    repeated sentences skip espeak entirely.
+
     Args:
         text: Text to convert to phonemes
         language: Language code ('a' for US English, 'b' for British English)
@@ -94,14 +112,58 @@ def phonemize(text: str, language: str = "a") -> str:
     Returns:
         Phonemized text
     """
-    global phonemizers
-    
+    global phonemizers, _phoneme_cache_hits, _phoneme_cache_misses
+
     # Strip input text first to remove problematic leading/trailing spaces
     text = text.strip()
-    
-    if language not in phonemizers:
-        phonemizers[language] = create_phonemizer(language)
-    
-    result = phonemizers[language].phonemize(text)
+
+    key = (language, text)
+    with _phoneme_cache_lock:
+        cached = _phoneme_cache.get(key)
+        if cached is not None:
+            _phoneme_cache.move_to_end(key)
+            _phoneme_cache_hits += 1
+            return cached
+        _phoneme_cache_misses += 1
+
+    with _espeak_lock:
+        if language not in phonemizers:
+            phonemizers[language] = create_phonemizer(language)
+
+        with stage_timer("g2p"):
+            result = phonemizers[language].phonemize(text)
     # Final strip to ensure no leading/trailing spaces in phonemes
-    return result.strip()
+    result = result.strip()
+
+    if settings.phoneme_cache_size > 0:
+        with _phoneme_cache_lock:
+            _phoneme_cache[key] = result
+            _phoneme_cache.move_to_end(key)
+            while len(_phoneme_cache) > settings.phoneme_cache_size:
+                _phoneme_cache.popitem(last=False)
+
+    return result
+
+
+def phoneme_cache_info() -> Dict:
+    """Get phoneme cache statistics.
+
+    Returns:
+        Dict with cache size, capacity, hits and misses
+    """
+    with _phoneme_cache_lock:
+        return {
+            "size": len(_phoneme_cache),
+            "max_size": settings.phoneme_cache_size,
+            "hits": _phoneme_cache_hits,
+            "misses": _phoneme_cache_misses,
+        }
+
+
+def clear_phoneme_cache() -> None:
+    """Clear the phoneme cache and reset its statistics."""
+    global _phoneme_cache_hits, _phoneme_cache_misses
+    with _phoneme_cache_lock:
+        _phoneme_cache.clear()
+        _phoneme_cache_hits = 0
+        _phoneme_cache_misses = 0
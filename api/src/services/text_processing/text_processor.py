@@ -1,16 +1,18 @@
 """Unified text processing for TTS with smart chunking."""
 
+import asyncio
 import re
 import time
-from typing import AsyncGenerator, Dict, List, Tuple, Optional
+from typing import AsyncGenerator, Dict, Iterator, List, Tuple, Optional
 
 from loguru import logger
 
 from ...core.config import settings
+from ...core.metrics import stage_timer
 from ...structures.schemas import NormalizationOptions
 from .normalizer import normalize_text
 from .phonemizer import phonemize
-from .vocabulary import tokenize
+from .vocabulary import VOCAB, tokenize
 
 # Pre-compiled regex patterns for performance
 # Updated regex to be more strict and avoid matching isolated brackets
@@ -18,6 +20,12 @@ from .vocabulary import tokenize
 CUSTOM_PHONEMES = re.compile(r"(\[[^\[\]]*?\]\(\/[^\/\(\)]*?\/\))")
 # Pattern to find pause tags like [pause:0.5s]
 PAUSE_TAG_PATTERN = re.compile(r"\[pause:(\d+(?:\.\d+)?)s\]", re.IGNORECASE)
+# Token separating sentences/clauses joined into one chunk
+SPACE_TOKEN = VOCAB[" "]
+# Candidate places to cut text into normalization windows
+WINDOW_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[\"'(A-Z0-9])")
+# Words whose trailing period the normalizer treats as part of the word
+ABBREVIATIONS = {"dr", "mr", "ms", "mrs", "etc"}
 
 
 def process_text_chunk(
@@ -99,10 +107,10 @@ def process_text(text: str, language: str = "a") -> List[int]:
     return process_text_chunk(text, language)
 
 
-def get_sentence_info(
+def iter_sentence_info(
     text: str, lang_code: str = "a"
-) -> List[Tuple[str, List[int], int]]:
-    """Process all sentences and return info"""
+) -> Iterator[Tuple[str, List[int], int]]:
+    """Split text into sentences and phonemize them one at a time"""
     # Detect Chinese text
     is_chinese = lang_code.startswith("z") or re.search(r"[\u4e00-\u9fff]", text)
     if is_chinese:
@@ -111,7 +119,6 @@ def get_sentence_info(
     else:
         sentences = re.split(r"([.!?;:])(?=\s|$)", text)
 
-    results = []
     for i in range(0, len(sentences), 2):
         sentence = sentences[i].strip()
         punct = sentences[i + 1] if i + 1 < len(sentences) else ""
@@ -123,8 +130,107 @@ def get_sentence_info(
         if not full:  # Skip if empty after stripping
             continue
         tokens = process_text_chunk(full)
-        results.append((full, tokens, len(tokens)))
-    return results
+        yield full, tokens, len(tokens)
+
+
+def get_sentence_info(
+    text: str, lang_code: str = "a"
+) -> List[Tuple[str, List[int], int]]:
+    """Process all sentences and return info"""
+    return list(iter_sentence_info(text, lang_code=lang_code))
+
+
+def iter_text_windows(text: str, window_chars: int) -> Iterator[str]:
+    """Cut text into windows of roughly ``window_chars`` at safe sentence ends.
+
+    A window only ends after sentence-final punctuation followed by whitespace
+    and a capital, digit or quote, and never after an abbreviation, initial or
+    inside custom phoneme markup. Normalization rules that look across that
+    boundary (titles, "etc.", dotted acronyms) therefore see the same context
+    as they would on the whole text.
+
+    Args:
+        text: Raw text to cut
+        window_chars: Target window length (<= 0 yields the whole text)
+
+    Yields:
+        Consecutive windows covering the text
+    """
+    if window_chars <= 0 or len(text) <= window_chars:
+        yield text
+        return
+
+    markup = [m.span() for m in CUSTOM_PHONEMES.finditer(text)]
+    start = 0
+    while len(text) - start > window_chars:
+        cut = None
+        for match in WINDOW_BOUNDARY.finditer(text, start + 1):
+            if not _is_safe_boundary(text, match.start(), markup):
+                continue
+            cut = match.end()
+            if cut - start >= window_chars:
+                break
+        if cut is None:
+            break
+        yield text[start:cut]
+        start = cut
+    if start < len(text):
+        yield text[start:]
+
+
+def _is_safe_boundary(text: str, pos: int, markup: List[Tuple[int, int]]) -> bool:
+    """Check the sentence end just before ``pos`` can start a new window."""
+    if any(begin < pos < end for begin, end in markup):
+        return False
+    words = text[max(0, pos - 40) : pos].split()
+    word = words[-1].lstrip("\"'([").rstrip(".!?") if words else ""
+    # Initials, dotted acronyms and titles continue into the next sentence
+    return len(word) > 1 and "." not in word and word.lower() not in ABBREVIATIONS
+
+
+def append_tokens(chunk_tokens: List[int], tokens: List[int]) -> None:
+    """Append a sentence's tokens to a chunk, keeping a word boundary between them."""
+    if chunk_tokens and tokens:
+        chunk_tokens.append(SPACE_TOKEN)
+    chunk_tokens.extend(tokens)
+
+
+def _normalize_window(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> str:
+    """Normalize one window of text, leaving custom phoneme markup untouched."""
+    if not (settings.advanced_text_normalization and normalization_options.normalize):
+        return text
+    if lang_code not in ["a", "b", "en-us", "en-gb"]:
+        logger.debug("Skipping text normalization as it is only supported for english")
+        return text
+
+    with stage_timer("normalize"):
+        parts = CUSTOM_PHONEMES.split(text)
+        for index in range(0, len(parts), 2):
+            parts[index] = normalize_text(parts[index], normalization_options)
+        return "".join(parts).strip()
+
+
+async def _iter_window_sentences(
+    text: str, lang_code: str, normalization_options: NormalizationOptions
+) -> AsyncGenerator[Tuple[str, List[int], int], None]:
+    """Normalize and phonemize text lazily, one window at a time.
+
+    Normalization of each window and G2P of each sentence run in a worker
+    thread, so other requests keep streaming while espeak works, and the
+    first chunk only waits on the sentences it needs.
+    """
+    for window in iter_text_windows(text, settings.smart_split_window_chars):
+        normalized = await asyncio.to_thread(
+            _normalize_window, window, lang_code, normalization_options
+        )
+        sentences = iter_sentence_info(normalized, lang_code=lang_code)
+        while True:
+            info = await asyncio.to_thread(next, sentences, None)
+            if info is None:
+                break
+            yield info
 
 
 def handle_custom_phonemes(s: re.Match[str], phenomes_list: Dict[str, str]) -> str:
@@ -165,29 +271,17 @@ async def smart_split(
             # Strip leading and trailing spaces to prevent pause tag splitting artifacts
             text_part_raw = text_part_raw.strip()
 
-            # Normalize text (original logic)
-            processed_text = text_part_raw
-            if settings.advanced_text_normalization and normalization_options.normalize:
-                if lang_code in ["a", "b", "en-us", "en-gb"]:
-                    processed_text = CUSTOM_PHONEMES.split(processed_text)
-                    for index in range(0, len(processed_text), 2):
-                        processed_text[index] = normalize_text(processed_text[index], normalization_options)
-
-
-                    processed_text = "".join(processed_text).strip()
-                else:
-                    logger.info(
-                        "Skipping text normalization as it is only supported for english"
-                    )
-
-            # Process all sentences (original logic)
-            sentences = get_sentence_info(processed_text, lang_code=lang_code)
+            # Normalize and phonemize lazily, one window of sentences at a time,
+            # so the first chunk doesn't wait on the whole document
+            sentences = _iter_window_sentences(
+                text_part_raw, lang_code, normalization_options
+            )
 
             current_chunk = []
             current_tokens = []
             current_count = 0
 
-            for sentence, tokens, count in sentences:
+            async for sentence, tokens, count in sentences:
                 # Handle sentences that exceed max tokens (original logic)
                 if count > max_tokens:
                     # Yield current chunk if any
@@ -195,7 +289,7 @@ async def smart_split(
                         chunk_text = " ".join(current_chunk).strip()
                         chunk_count += 1
                         logger.debug(
-                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                         )
                         yield chunk_text, current_tokens, None
                         current_chunk = []
@@ -217,7 +311,7 @@ async def smart_split(
 
                         full_clause = clause + comma
 
-                        tokens = process_text_chunk(full_clause)
+                        tokens = await asyncio.to_thread(process_text_chunk, full_clause)
                         count = len(tokens)
 
                         # If adding clause keeps us under max and not optimal yet
@@ -226,7 +320,7 @@ async def smart_split(
                             and clause_count + count <= settings.target_max_tokens
                         ):
                             clause_chunk.append(full_clause)
-                            clause_tokens.extend(tokens)
+                            append_tokens(clause_tokens, tokens)
                             clause_count += count
                         else:
                             # Yield clause chunk if we have one
@@ -234,7 +328,7 @@ async def smart_split(
                                 chunk_text = " ".join(clause_chunk).strip()
                                 chunk_count += 1
                                 logger.debug(
-                                    f"Yielding clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({clause_count} tokens)"
+                                    f"Yielding clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({clause_count} tokens)"
                                 )
                                 yield chunk_text, clause_tokens, None
                             clause_chunk = [full_clause]
@@ -246,7 +340,7 @@ async def smart_split(
                         chunk_text = " ".join(clause_chunk).strip()
                         chunk_count += 1
                         logger.debug(
-                            f"Yielding final clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({clause_count} tokens)"
+                            f"Yielding final clause chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({clause_count} tokens)"
                         )
                         yield chunk_text, clause_tokens, None
 
@@ -260,7 +354,7 @@ async def smart_split(
                     chunk_text = " ".join(current_chunk).strip()
                     chunk_count += 1
                     logger.info(
-                        f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                        f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                     )
                     yield chunk_text, current_tokens, None
                     current_chunk = [sentence]
@@ -269,7 +363,7 @@ async def smart_split(
                 elif current_count + count <= settings.target_max_tokens:
                     # Keep building chunk while under target max
                     current_chunk.append(sentence)
-                    current_tokens.extend(tokens)
+                    append_tokens(current_tokens, tokens)
                     current_count += count
                 elif (
                     current_count + count <= max_tokens
@@ -277,7 +371,7 @@ async def smart_split(
                 ):
                     # Only exceed target max if we haven't reached minimum size yet
                     current_chunk.append(sentence)
-                    current_tokens.extend(tokens)
+                    append_tokens(current_tokens, tokens)
                     current_count += count
                 else:
                     # Yield current chunk and start new one
@@ -285,7 +379,7 @@ async def smart_split(
                         chunk_text = " ".join(current_chunk).strip()
                         chunk_count += 1
                         logger.info(
-                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                            f"Yielding chunk {chunk_count}: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                         )
                         yield chunk_text, current_tokens, None
                     current_chunk = [sentence]
@@ -297,7 +391,7 @@ async def smart_split(
                 chunk_text = " ".join(current_chunk).strip()
                 chunk_count += 1
                 logger.info(
-                    f"Yielding final chunk {chunk_count} for part: '{chunk_text[:50]}{'...' if len(processed_text) > 50 else ''}' ({current_count} tokens)"
+                    f"Yielding final chunk {chunk_count} for part: '{chunk_text[:50]}{'...' if len(chunk_text) > 50 else ''}' ({current_count} tokens)"
                 )
                 yield chunk_text, current_tokens, None
 
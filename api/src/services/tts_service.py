@@ -1,11 +1,10 @@
 """TTS service using model and voice managers."""
 
 import asyncio
-import os
 import re
-import tempfile
 import time
-from typing import AsyncGenerator, List, Optional, Tuple, Union
+from contextlib import aclosing
+from typing import AsyncGenerator, AsyncIterator, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
@@ -13,23 +12,70 @@ from kokoro import KPipeline
 from loguru import logger
 
 from ..core.config import settings
-from ..inference.base import AudioChunk
+from ..core.metrics import (
+    ACTIVE_STREAMS,
+    CACHED_AUDIO_SECONDS,
+    CHUNK_TOKENS,
+    REAL_TIME_FACTOR,
+    REQUESTS,
+    SEMAPHORE_WAIT_SECONDS,
+    TTFB_SECONDS,
+)
+from ..inference.base import AudioAccumulator, AudioChunk
+from ..inference.cancellation import (
+    CancellationToken,
+    GenerationCancelled,
+    get_compute_savings,
+)
 from ..inference.kokoro_v1 import KokoroV1
 from ..inference.model_manager import get_manager as get_model_manager
+from ..inference.stub_backend import StubBackend
 from ..inference.voice_manager import get_manager as get_voice_manager
 from ..structures.schemas import NormalizationOptions
 from .audio import AudioNormalizer, AudioService
+from .chunk_scheduler import ScheduledStream, get_chunk_scheduler
+from .sentence_cache import SentenceCache, get_sentence_cache, voice_digest
+from .stream_pipeline import lookahead
 from .streaming_audio_writer import StreamingAudioWriter
 from .text_processing import tokenize
-from .text_processing.text_processor import process_text_chunk, smart_split
+from .text_processing.text_processor import (
+    CUSTOM_PHONEMES,
+    process_text_chunk,
+    smart_split,
+)
+from .text_processing.vocabulary import decode_tokens
+
+# Marks audio replayed from the sentence cache, which is already trimmed
+_CACHED = object()
+
+# About 65ms of 24kHz audio per phoneme token at speed 1.0, with a character
+# of text standing in for a token before G2P has run
+SAMPLES_PER_TOKEN = 1600
+
+# Backends taking text or phonemes with a (name, tensor) voice
+_PIPELINE_BACKENDS = (KokoroV1, StubBackend)
+
+
+class GenerationReport:
+    """What went wrong during one generation, filled in as it runs.
+
+    A chunk that fails to synthesize, post-process or encode is logged and
+    skipped so the rest of the text still plays, which leaves the output
+    incomplete. Callers storing the output check ``complete`` first.
+    """
+
+    def __init__(self):
+        self.dropped_chunks = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every chunk made it into the output."""
+        return self.dropped_chunks == 0
 
 
 class TTSService:
     """Text-to-speech service."""
 
-    # Limit concurrent chunk processing
-    _chunk_semaphore = asyncio.Semaphore(4)
-
     def __init__(self, output_dir: str = None):
         """Initialize service."""
         self.output_dir = output_dir
@@ -44,98 +90,70 @@ class TTSService:
         service._voice_manager = await get_voice_manager()
         return service
 
-    async def _process_chunk(
+    async def _generate_chunk_audio(
         self,
         chunk_text: str,
         tokens: List[int],
         voice_name: str,
-        voice_path: str,
+        voice_tensor: torch.Tensor,
         speed: float,
-        writer: StreamingAudioWriter,
-        output_format: Optional[str] = None,
-        is_first: bool = False,
-        is_last: bool = False,
         volume_multiplier: Optional[float] = 1.0,
-        normalizer: Optional[AudioNormalizer] = None,
         lang_code: Optional[str] = None,
         return_timestamps: Optional[bool] = False,
+        stream: Optional[ScheduledStream] = None,
+        cancel: Optional[CancellationToken] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Process tokens into audio."""
-        async with self._chunk_semaphore:
-            try:
-                # Handle stream finalization
-                if is_last:
-                    # Skip format conversion for raw audio mode
-                    if not output_format:
-                        yield AudioChunk(np.array([], dtype=np.int16), output=b"")
-                        return
-                    chunk_data = await AudioService.convert_audio(
-                        AudioChunk(
-                            np.array([], dtype=np.float32)
-                        ),  # Dummy data for type checking
-                        output_format,
-                        writer,
-                        speed,
-                        "",
-                        normalizer=normalizer,
-                        is_last_chunk=True,
-                    )
-                    yield chunk_data
-                    return
-
-                # Skip empty chunks
-                if not tokens and not chunk_text:
-                    return
+        """Run model inference for one text chunk and yield raw audio.
 
-                # Get backend
-                backend = self.model_manager.get_backend()
+        The chunk waits for an inference slot from the chunk scheduler, which
+        orders chunks from all requests by ``stream``'s priority and playback.
+        A chunk cancelled while waiting gives its slot straight back.
+        """
+        scheduler = get_chunk_scheduler()
+        if stream is None:
+            stream = scheduler.open_stream(text_length=len(chunk_text), playback=False)
+        wait_start = time.perf_counter()
+        async with scheduler.slot(stream, cost=len(tokens)):
+            SEMAPHORE_WAIT_SECONDS.observe(time.perf_counter() - wait_start)
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            CHUNK_TOKENS.observe(len(tokens))
+            # Get backend
+            backend = self.model_manager.get_backend()
 
-                # Generate audio using pre-warmed model
-                if isinstance(backend, KokoroV1):
-                    chunk_index = 0
-                    # For Kokoro V1, pass text and voice info with lang_code
-                    async for chunk_data in self.model_manager.generate(
-                        chunk_text,
-                        (voice_name, voice_path),
+            # Generate audio using pre-warmed model
+            if isinstance(backend, _PIPELINE_BACKENDS):
+                if self._use_phoneme_path(
+                    chunk_text, tokens, lang_code, return_timestamps
+                ):
+                    # Run the phonemes smart_split already produced
+                    audio_source = self.model_manager.generate_from_tokens(
+                        decode_tokens(tokens),
+                        (voice_name, voice_tensor),
                         speed=speed,
                         lang_code=lang_code,
-                        return_timestamps=return_timestamps,
-                    ):
-                        chunk_data.audio*=volume_multiplier
-                        # For streaming, convert to bytes
-                        if output_format:
-                            try:
-                                chunk_data = await AudioService.convert_audio(
-                                    chunk_data,
-                                    output_format,
-                                    writer,
-                                    speed,
-                                    chunk_text,
-                                    is_last_chunk=is_last,
-                                    normalizer=normalizer,
-                                    apply_flashsr=settings.enable_flashsr,
-                                )
-                                yield chunk_data
-                            except Exception as e:
-                                logger.error(f"Failed to convert audio: {str(e)}")
-                        else:
-                            chunk_data = AudioService.trim_audio(
-                                chunk_data, chunk_text, speed, is_last, normalizer
-                            )
-                            yield chunk_data
-                        chunk_index += 1
-                else:
-                    # For legacy backends, load voice tensor
-                    voice_tensor = await self._voice_manager.load_voice(
-                        voice_name, device=backend.device
+                        cancel=cancel,
                     )
-                    chunk_data = await self.model_manager.generate(
-                        tokens,
-                        voice_tensor,
+                else:
+                    # For Kokoro V1, pass text and voice info with lang_code
+                    audio_source = self.model_manager.generate(
+                        chunk_text,
+                        (voice_name, voice_tensor),
                         speed=speed,
+                        lang_code=lang_code,
                         return_timestamps=return_timestamps,
+                        cancel=cancel,
                     )
-                    
+                async for chunk_data in audio_source:
+                    chunk_data.audio *= volume_multiplier
+                    yield chunk_data
+            else:
+                async for chunk_data in self.model_manager.generate(
+                    tokens,
+                    voice_tensor,
+                    speed=speed,
+                    return_timestamps=return_timestamps,
+                ):
                     if chunk_data.audio is None:
                         logger.error("Model generated None for audio chunk")
                         return
@@ -144,117 +162,249 @@ class TTSService:
                         logger.error("Model generated empty audio chunk")
                         return
 
-                    chunk_data.audio*=volume_multiplier
+                    chunk_data.audio *= volume_multiplier
+                    yield chunk_data
 
-                    # For streaming, convert to bytes
+    async def _inference_stage(
+        self,
+        chunks: AsyncIterator[Tuple[str, List[int], Optional[float]]],
+        voice_name: str,
+        voice_tensor: torch.Tensor,
+        speed: float,
+        volume_multiplier: Optional[float],
+        lang_code: Optional[str],
+        return_timestamps: Optional[bool],
+        voice_key: Optional[str] = None,
+        stream: Optional[ScheduledStream] = None,
+        cancel: Optional[CancellationToken] = None,
+        report: Optional[GenerationReport] = None,
+    ) -> AsyncGenerator[Tuple[str, AudioChunk, bool, object], None]:
+        """Pipeline stage turning smart_split chunks into raw audio.
+
+        With the sentence cache enabled (``voice_key`` set), chunks synthesized
+        before are replayed from the cache instead of running the model.
+
+        Yields:
+            Tuples of (chunk text, audio chunk, whether the chunk is a pause,
+            cache tag). The cache tag is ``_CACHED`` for replayed audio,
+            ``(key, pieces)`` for audio to cache once trimmed, or None.
+        """
+        cache = get_sentence_cache() if voice_key and not return_timestamps else None
+        cached_samples = 0
+        async for chunk_text, tokens, pause_duration_s in chunks:
+            if cancel is not None:
+                cancel.raise_if_cancelled()
+            if pause_duration_s is not None and pause_duration_s > 0:
+                # --- Handle Pause Chunk ---
+                logger.debug(f"Generating {pause_duration_s}s silence chunk")
+                silence_samples = int(pause_duration_s * 24000)  # 24kHz sample rate
+                # Create proper silence as int16 zeros to avoid normalization artifacts
+                silence_audio = np.zeros(silence_samples, dtype=np.int16)
+                # Empty timestamps for silence
+                yield "", AudioChunk(audio=silence_audio, word_timestamps=[]), True, None
+
+            elif tokens or chunk_text.strip():  # Process if there are tokens OR non-whitespace text
+                # --- Handle Text Chunk ---
+                key = None
+                if cache is not None and tokens:
+                    key = SentenceCache.make_key(
+                        tokens, voice_key, speed, lang_code, volume_multiplier, chunk_text
+                    )
+                    pieces = await cache.get(key)
+                    if pieces is not None:
+                        for piece in pieces:
+                            cached_samples += len(piece)
+                            yield chunk_text, AudioChunk(piece, word_timestamps=[]), False, _CACHED
+                        continue
+
+                try:
+                    # Closed as soon as this stage is, giving back its slot
+                    async with aclosing(
+                        self._generate_chunk_audio(
+                            chunk_text,
+                            tokens,
+                            voice_name,
+                            voice_tensor,
+                            speed,
+                            volume_multiplier=volume_multiplier,
+                            lang_code=lang_code,
+                            return_timestamps=return_timestamps,
+                            stream=stream,
+                            cancel=cancel,
+                        )
+                    ) as audio_source:
+                        if key is None:
+                            async for chunk_data in audio_source:
+                                yield chunk_text, chunk_data, False, None
+                        else:
+                            # Collect the whole chunk so only complete chunks get cached
+                            generated = [chunk_data async for chunk_data in audio_source]
+                            for chunk_data in generated:
+                                yield chunk_text, chunk_data, False, (key, len(generated))
+                except GenerationCancelled:
+                    raise
+                except Exception as e:
+                    logger.error(
+                        f"Failed to process audio for chunk: '{chunk_text[:100]}...'. Error: {str(e)}"
+                    )
+                    if report is not None:
+                        report.dropped_chunks += 1
+
+        if cache is not None:
+            CACHED_AUDIO_SECONDS.observe(cached_samples / 24000)
+            if cached_samples:
+                logger.info(
+                    f"Served {cached_samples / 24000:.2f}s of audio from the sentence cache"
+                )
+
+    async def _postprocess_stage(
+        self,
+        audio: AsyncIterator[Tuple[str, AudioChunk, bool, object]],
+        speed: float,
+        output_format: Optional[str],
+        normalizer: AudioNormalizer,
+        report: Optional[GenerationReport] = None,
+    ) -> AsyncGenerator[Tuple[str, AudioChunk, bool], None]:
+        """Pipeline stage trimming (and optionally super-resolving) raw audio.
+
+        Trimmed audio tagged by the inference stage is stored in the sentence
+        cache before super-resolution, once every piece of its chunk arrived.
+        """
+        pending_key = None
+        pending = []
+        async for chunk_text, chunk_data, is_pause, cache_tag in audio:
+            try:
+                if is_pause:
+                    # Silence is already int16, skip trimming to keep its length
+                    if output_format:
+                        chunk_data = await AudioService.postprocess_audio(
+                            chunk_data, speed, trim_audio=False, normalizer=normalizer
+                        )
+                    yield chunk_text, chunk_data, is_pause
+                    continue
+
+                if cache_tag is not _CACHED:
                     if output_format:
-                        try:
-                            chunk_data = await AudioService.convert_audio(
-                                chunk_data,
-                                output_format,
-                                writer,
-                                speed,
-                                chunk_text,
-                                normalizer=normalizer,
-                                is_last_chunk=is_last,
-                                apply_flashsr=settings.enable_flashsr,
-                            )
-                            yield chunk_data
-                        except Exception as e:
-                            logger.error(f"Failed to convert audio: {str(e)}")
+                        chunk_data = await AudioService.postprocess_audio(
+                            chunk_data, speed, chunk_text, normalizer=normalizer
+                        )
                     else:
-                        trimmed = AudioService.trim_audio(
-                            chunk_data, chunk_text, speed, is_last, normalizer
+                        chunk_data = AudioService.trim_audio(
+                            chunk_data, chunk_text, speed, False, normalizer
                         )
-                        yield trimmed
+
+                if cache_tag is not None and cache_tag is not _CACHED:
+                    key, pieces = cache_tag
+                    if key != pending_key:
+                        pending_key, pending = key, []
+                    pending.append(chunk_data.audio)
+                    if len(pending) == pieces:
+                        await get_sentence_cache().put(key, pending)
+                        pending_key, pending = None, []
+
+                if output_format and settings.enable_flashsr:
+                    chunk_data = await AudioService.postprocess_audio(
+                        chunk_data,
+                        speed,
+                        chunk_text,
+                        trim_audio=False,
+                        normalizer=normalizer,
+                        apply_flashsr=True,
+                    )
+                yield chunk_text, chunk_data, is_pause
             except Exception as e:
-                logger.error(f"Failed to process tokens: {str(e)}")
+                logger.error(f"Failed to convert audio: {str(e)}")
+                if report is not None:
+                    report.dropped_chunks += 1
+
+    @staticmethod
+    def _use_phoneme_path(
+        chunk_text: str,
+        tokens: List[int],
+        lang_code: Optional[str],
+        return_timestamps: Optional[bool],
+    ) -> bool:
+        """Decide whether a chunk can be generated from its smart_split tokens.
+
+        smart_split phonemizes with US English espeak, so only those chunks can
+        skip KPipeline's G2P. Word timestamps and custom phoneme markup need
+        KPipeline's own text processing, as do chunks over its phoneme limit.
+        """
+        return (
+            settings.phoneme_native_generation
+            and not return_timestamps
+            and lang_code == "a"
+            and 0 < len(tokens) <= 510
+            and not CUSTOM_PHONEMES.search(chunk_text)
+        )
+
+    @staticmethod
+    def _parse_voice_expression(voice: str) -> List[Tuple[str, float]]:
+        """Parse a voice expression into weighted components.
+
+        Args:
+            voice: Voice name or combined voice names (e.g., 'af_bella(2)+af_sky(1)-am_adam')
+
+        Returns:
+            List of (voice name, signed weight)
+        """
+        # Split the voice on + and - and ensure that they get added to the list eg: hi+bob = ["hi","+","bob"]
+        split_voice = re.split(r"([-+])", voice)
+
+        components = []
+        for voice_index in range(0, len(split_voice), 2):
+            voice_object = split_voice[voice_index]
+
+            if "(" in voice_object and ")" in voice_object:
+                voice_name = voice_object.split("(")[0].strip()
+                voice_weight = float(voice_object.split("(")[1].split(")")[0])
+            else:
+                voice_name = voice_object.strip()
+                voice_weight = 1.0
 
-    async def _load_voice_from_path(self, path: str, weight: float):
-        # Check if the path is None and raise a ValueError if it is not
-        if not path:
-            raise ValueError(f"Voice not found at path: {path}")
+            # The operator before each voice decides whether it is added or subtracted
+            if voice_index > 0 and split_voice[voice_index - 1] == "-":
+                voice_weight = -voice_weight
+            components.append((voice_name, voice_weight))
+        return components
 
-        logger.debug(f"Loading voice tensor from path: {path}")
-        return torch.load(path, map_location="cpu") * weight
+    async def _get_voice(self, voice: str) -> Tuple[str, torch.Tensor]:
+        """Get voice tensor, handling combined voices.
 
-    async def _get_voices_path(self, voice: str) -> Tuple[str, str]:
-        """Get voice path, handling combined voices.
+        Single voices come straight from the voice cache. Combined voices are
+        blended once and then served from the voice manager's blend cache.
 
         Args:
             voice: Voice name or combined voice names (e.g., 'af_jadzia+af_jessica')
 
         Returns:
-            Tuple of (voice name to use, voice path to use)
+            Tuple of (voice name to use, voice tensor to use)
 
         Raises:
             RuntimeError: If voice not found
         """
         try:
-            # Split the voice on + and - and ensure that they get added to the list eg: hi+bob = ["hi","+","bob"]
-            split_voice = re.split(r"([-+])", voice)
-
-            # If it is only once voice there is no point in loading it up, doing nothing with it, then saving it
-            if len(split_voice) == 1:
-                # Since its a single voice the only time that the weight would matter is if voice_weight_normalization is off
-                if (
-                    "(" not in voice and ")" not in voice
-                ) or settings.voice_weight_normalization == True:
-                    path = await self._voice_manager.get_voice_path(voice)
-                    if not path:
-                        raise RuntimeError(f"Voice not found: {voice}")
-                    logger.debug(f"Using single voice path: {path}")
-                    return voice, path
-
-            total_weight = 0
-
-            for voice_index in range(0, len(split_voice), 2):
-                voice_object = split_voice[voice_index]
-
-                if "(" in voice_object and ")" in voice_object:
-                    voice_name = voice_object.split("(")[0].strip()
-                    voice_weight = float(voice_object.split("(")[1].split(")")[0])
-                else:
-                    voice_name = voice_object
-                    voice_weight = 1
-
-                total_weight += voice_weight
-                split_voice[voice_index] = (voice_name, voice_weight)
-
-            # If voice_weight_normalization is false prevent normalizing the weights by setting the total_weight to 1 so it divides each weight by 1
-            if settings.voice_weight_normalization == False:
-                total_weight = 1
-
-            # Load the first voice as the starting point for voices to be combined onto
-            path = await self._voice_manager.get_voice_path(split_voice[0][0])
-            combined_tensor = await self._load_voice_from_path(
-                path, split_voice[0][1] / total_weight
-            )
+            backend = self.model_manager.get_backend()
+            components = self._parse_voice_expression(voice)
 
-            # Loop through each + or - in split_voice so they can be applied to combined voice
-            for operation_index in range(1, len(split_voice) - 1, 2):
-                # Get the voice path of the voice 1 index ahead of the operator
-                path = await self._voice_manager.get_voice_path(
-                    split_voice[operation_index + 1][0]
-                )
-                voice_tensor = await self._load_voice_from_path(
-                    path, split_voice[operation_index + 1][1] / total_weight
+            # Since its a single voice the only time that the weight would matter is if voice_weight_normalization is off
+            if len(components) == 1 and (
+                components[0][1] == 1.0 or settings.voice_weight_normalization
+            ):
+                logger.debug(f"Using single voice: {components[0][0]}")
+                voice_tensor = await self._voice_manager.load_voice(
+                    components[0][0], device=backend.device
                 )
+                return voice, voice_tensor
 
-                # Either add or subtract the voice from the current combined voice
-                if split_voice[operation_index] == "+":
-                    combined_tensor += voice_tensor
-                else:
-                    combined_tensor -= voice_tensor
-
-            # Save the new combined voice so it can be loaded latter
-            temp_dir = tempfile.gettempdir()
-            combined_path = os.path.join(temp_dir, f"{voice}.pt")
-            logger.debug(f"Saving combined voice to: {combined_path}")
-            torch.save(combined_tensor, combined_path)
-            return voice, combined_path
+            voice_tensor = await self._voice_manager.blend_voices(
+                components,
+                normalize=settings.voice_weight_normalization,
+                device=backend.device,
+            )
+            return voice, voice_tensor
         except Exception as e:
-            logger.error(f"Failed to get voice path: {e}")
+            logger.error(f"Failed to get voice: {e}")
             raise
 
     async def generate_audio_stream(
@@ -268,138 +418,227 @@ class TTSService:
         volume_multiplier: Optional[float] = 1.0,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         return_timestamps: Optional[bool] = False,
+        priority: Optional[str] = None,
+        playback: bool = True,
+        cancel: Optional[CancellationToken] = None,
+        report: Optional[GenerationReport] = None,
     ) -> AsyncGenerator[AudioChunk, None]:
-        """Generate and stream audio chunks."""
+        """Generate and stream audio chunks, recording request metrics.
+
+        Args:
+            priority: Scheduling class, or None to pick one from the text length
+            playback: Whether the audio is played as it streams, so chunks are
+                scheduled before the listener would run out of audio
+            cancel: Token that stops the generation, dropping queued chunks
+                and aborting the running one between sub-segments
+            report: Records chunks skipped after an error, so callers can
+                tell incomplete output apart
+
+        Raises:
+            GenerationCancelled: If ``cancel`` was cancelled
+        """
+        stream = get_chunk_scheduler().open_stream(priority, len(text), playback)
+        start = time.perf_counter()
+        sample_rate = 48000 if settings.enable_flashsr and output_format else 24000
+        audio_seconds = 0.0
+        first_chunk = True
+        status = "cancelled"
+        ACTIVE_STREAMS.inc()
+        try:
+            async for chunk in self._stream_audio(
+                text,
+                voice,
+                writer,
+                speed=speed,
+                output_format=output_format,
+                lang_code=lang_code,
+                volume_multiplier=volume_multiplier,
+                normalization_options=normalization_options,
+                return_timestamps=return_timestamps,
+                stream=stream,
+                cancel=cancel,
+                report=report,
+            ):
+                if first_chunk:
+                    TTFB_SECONDS.observe(time.perf_counter() - start)
+                    first_chunk = False
+                if chunk.audio is not None:
+                    audio_seconds += len(chunk.audio) / sample_rate
+                    stream.delivered(len(chunk.audio) / sample_rate)
+                yield chunk
+            status = "ok"
+            if audio_seconds > 0:
+                REAL_TIME_FACTOR.observe((time.perf_counter() - start) / audio_seconds)
+        except GenerationCancelled:
+            # Stopped on purpose, so it counts as cancelled rather than failed
+            raise
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            ACTIVE_STREAMS.dec()
+            REQUESTS.labels(status=status).inc()
+            savings = get_compute_savings()
+            if status == "ok":
+                savings.completed(stream.compute_seconds, audio_seconds)
+            elif status == "cancelled":
+                # Cancelled by the token, or closed early by the consumer
+                reason = "closed"
+                if cancel is not None and cancel.cancelled:
+                    reason = cancel.reason
+                expected = len(text) * SAMPLES_PER_TOKEN / speed / 24000
+                saved = savings.cancelled(
+                    reason, stream.compute_seconds, audio_seconds, expected - audio_seconds
+                )
+                logger.info(
+                    f"Generation cancelled ({reason}), saving about {saved:.2f}s "
+                    "of inference"
+                )
+
+    async def _stream_audio(
+        self,
+        text: str,
+        voice: str,
+        writer: StreamingAudioWriter,
+        speed: float = 1.0,
+        output_format: str = "wav",
+        lang_code: Optional[str] = None,
+        volume_multiplier: Optional[float] = 1.0,
+        normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
+        return_timestamps: Optional[bool] = False,
+        stream: Optional[ScheduledStream] = None,
+        cancel: Optional[CancellationToken] = None,
+        report: Optional[GenerationReport] = None,
+    ) -> AsyncGenerator[AudioChunk, None]:
+        """Generate and stream audio chunks.
+
+        Text splitting (G2P), inference and post-processing each run as their
+        own pipeline stage, up to ``settings.stream_lookahead_chunks`` chunks
+        ahead of the next, while this generator encodes. Chunk N+1 is being
+        phonemized and chunk N-1 encoded while chunk N is synthesizing.
+        """
         stream_normalizer = AudioNormalizer()
         chunk_index = 0
         current_offset = 0.0
+        chunks = audio = processed = None
         try:
-            # Get backend
-            backend = self.model_manager.get_backend()
-
-            # Get voice path, handling combined voices
-            voice_name, voice_path = await self._get_voices_path(voice)
-            logger.debug(f"Using voice path: {voice_path}")
+            # Get voice tensor once per request, handling combined voices
+            voice_name, voice_tensor = await self._get_voice(voice)
 
             # Use provided lang_code or determine from voice name
             pipeline_lang_code = lang_code if lang_code else voice[:1].lower()
             logger.info(
                 f"Using lang_code '{pipeline_lang_code}' for voice '{voice_name}' in audio stream"
             )
+            # Sentence cache entries are keyed on the voice tensor's contents
+            voice_key = (
+                voice_digest(voice_tensor) if get_sentence_cache() is not None else None
+            )
 
+            depth = settings.stream_lookahead_chunks
             # Process text in chunks with smart splitting, handling pause tags
-            async for chunk_text, tokens, pause_duration_s in smart_split(
-                text,
-                lang_code=pipeline_lang_code,
-                normalization_options=normalization_options,
-            ):
-                if pause_duration_s is not None and pause_duration_s > 0:
-                    # --- Handle Pause Chunk ---
-                    try:
-                        logger.debug(f"Generating {pause_duration_s}s silence chunk")
-                        silence_samples = int(pause_duration_s * 24000)  # 24kHz sample rate
-                        # Create proper silence as int16 zeros to avoid normalization artifacts
-                        silence_audio = np.zeros(silence_samples, dtype=np.int16)
-                        pause_chunk = AudioChunk(audio=silence_audio, word_timestamps=[])  # Empty timestamps for silence
-
-                        # Format and yield the silence chunk
-                        if output_format:
-                            formatted_pause_chunk = await AudioService.convert_audio(
-                                pause_chunk, output_format, writer, speed=speed, chunk_text="",
-                                is_last_chunk=False, trim_audio=False, normalizer=stream_normalizer,
-
-                            )
-                            if formatted_pause_chunk.output:
-                                yield formatted_pause_chunk
-                        else:  # Raw audio mode
-                            # For raw audio mode, silence is already in the correct format (int16)
-                            # Skip normalization to avoid any potential artifacts
-                            if len(pause_chunk.audio) > 0:
-                                yield pause_chunk
-
-                        # Update offset based on silence duration
-                        current_offset += pause_duration_s
-                        chunk_index += 1  # Count pause as a yielded chunk
-
-                    except Exception as e:
-                        logger.error(f"Failed to process pause chunk: {str(e)}")
-                        continue
+            chunks = lookahead(
+                smart_split(
+                    text,
+                    lang_code=pipeline_lang_code,
+                    normalization_options=normalization_options,
+                ),
+                depth,
+            )
+            audio = lookahead(
+                self._inference_stage(
+                    chunks,
+                    voice_name,
+                    voice_tensor,
+                    speed,
+                    volume_multiplier,
+                    pipeline_lang_code,
+                    return_timestamps,
+                    voice_key,
+                    stream,
+                    cancel,
+                    report,
+                ),
+                depth,
+            )
+            processed = lookahead(
+                self._postprocess_stage(
+                    audio, speed, output_format, stream_normalizer, report
+                ),
+                depth,
+            )
 
-                elif tokens or chunk_text.strip():  # Process if there are tokens OR non-whitespace text
-                    # --- Handle Text Chunk ---
+            async for chunk_text, chunk_data, is_pause in processed:
+                chunk_index += 1
+                if output_format:
                     try:
-                        # Process audio for chunk
-                        async for chunk_data in self._process_chunk(
-                            chunk_text,  # Pass text for Kokoro V1
-                            tokens,  # Pass tokens for legacy backends
-                            voice_name,  # Pass voice name
-                            voice_path,  # Pass voice path
-                            speed,
-                            writer,
-                            output_format,
-                            is_first=(chunk_index == 0),
-                            volume_multiplier=volume_multiplier,
-                            is_last=False,  # We'll update the last chunk later
-                            normalizer=stream_normalizer,
-                            lang_code=pipeline_lang_code,  # Pass lang_code
-                            return_timestamps=return_timestamps,
-                        ):
-                            if chunk_data.word_timestamps is not None:
-                                for timestamp in chunk_data.word_timestamps:
-                                    timestamp.start_time += current_offset
-                                    timestamp.end_time += current_offset
-
-                            # Update offset based on the actual duration of the generated audio chunk
-                            chunk_duration = 0
-                            if chunk_data.audio is not None and len(chunk_data.audio) > 0:
-                                # Use dynamic sample rate check instead of hardcoded 24000
-                                current_sr = 48000 if settings.enable_flashsr and output_format else 24000
-                                chunk_duration = len(chunk_data.audio) / current_sr
-                                current_offset += chunk_duration
-
-                            # Yield the processed chunk (either formatted or raw)
-                            if chunk_data.output is not None:
-                                yield chunk_data
-                            elif chunk_data.audio is not None and len(chunk_data.audio) > 0:
-                                yield chunk_data
-                            else:
-                                logger.warning(
-                                    f"No audio generated for chunk: '{chunk_text[:100]}...'"
-                                )
-
-                        chunk_index += 1  # Increment chunk index after processing text
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to process audio for chunk: '{chunk_text[:100]}...'. Error: {str(e)}"
+                        # Encode off the event loop; the writer is only used here
+                        chunk_data = await asyncio.to_thread(
+                            AudioService.encode_audio, chunk_data, writer
                         )
+                    except Exception as e:
+                        logger.error(f"Failed to convert audio: {str(e)}")
+                        if report is not None:
+                            report.dropped_chunks += 1
                         continue
 
+                if is_pause:
+                    # Update offset based on silence duration
+                    current_offset += len(chunk_data.audio) / 24000
+                    if chunk_data.output or (
+                        not output_format and len(chunk_data.audio) > 0
+                    ):
+                        yield chunk_data
+                    continue
+
+                if chunk_data.word_timestamps is not None:
+                    for timestamp in chunk_data.word_timestamps:
+                        timestamp.start_time += current_offset
+                        timestamp.end_time += current_offset
+
+                # Update offset based on the actual duration of the generated audio chunk
+                if chunk_data.audio is not None and len(chunk_data.audio) > 0:
+                    # Use dynamic sample rate check instead of hardcoded 24000
+                    current_sr = 48000 if settings.enable_flashsr and output_format else 24000
+                    current_offset += len(chunk_data.audio) / current_sr
+
+                # Yield the processed chunk (either formatted or raw)
+                if chunk_data.output is not None:
+                    yield chunk_data
+                elif chunk_data.audio is not None and len(chunk_data.audio) > 0:
+                    yield chunk_data
+                else:
+                    logger.warning(
+                        f"No audio generated for chunk: '{chunk_text[:100]}...'"
+                    )
+
             # Only finalize if we successfully processed at least one chunk
-            if chunk_index > 0:
+            if chunk_index > 0 and output_format:
                 try:
-                    # Empty tokens list to finalize audio
-                    async for chunk_data in self._process_chunk(
-                        "",  # Empty text
-                        [],  # Empty tokens
-                        voice_name,
-                        voice_path,
-                        speed,
+                    final_chunk = await asyncio.to_thread(
+                        AudioService.encode_audio,
+                        AudioChunk(np.array([], dtype=np.int16)),
                         writer,
-                        output_format,
-                        is_first=False,
-                        is_last=True,  # Signal this is the last chunk
-                        volume_multiplier=volume_multiplier,
-                        normalizer=stream_normalizer,
-                        lang_code=pipeline_lang_code,  # Pass lang_code
-                    ):
-                        if chunk_data.output is not None:
-                            yield chunk_data
+                        True,
+                    )
+                    if final_chunk.output is not None:
+                        yield final_chunk
                 except Exception as e:
                     logger.error(f"Failed to finalize audio stream: {str(e)}")
+                    if report is not None:
+                        report.dropped_chunks += 1
 
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in phoneme audio generation: {str(e)}")
             raise e
+        finally:
+            # Stop the stages downstream first, so a consumer leaving early
+            # releases the inference slot of the chunk being synthesized
+            for stage in (processed, audio, chunks):
+                if stage is not None:
+                    await stage.aclose()
 
     async def generate_audio(
         self,
@@ -411,9 +650,14 @@ class TTSService:
         volume_multiplier: Optional[float] = 1.0,
         normalization_options: Optional[NormalizationOptions] = NormalizationOptions(),
         lang_code: Optional[str] = None,
+        cancel: Optional[CancellationToken] = None,
     ) -> AudioChunk:
-        """Generate complete audio for text using streaming internally."""
-        audio_data_chunks = []
+        """Generate complete audio for text using streaming internally.
+
+        Chunks are copied into one buffer reserved from the estimated output
+        length, rather than concatenated pairwise.
+        """
+        accumulator = AudioAccumulator(int(len(text) * SAMPLES_PER_TOKEN / speed))
 
         try:
             async for audio_stream_data in self.generate_audio_stream(
@@ -426,12 +670,15 @@ class TTSService:
                 return_timestamps=return_timestamps,
                 lang_code=lang_code,
                 output_format=None,
+                playback=False,
+                cancel=cancel,
             ):
                 if len(audio_stream_data.audio) > 0:
-                    audio_data_chunks.append(audio_stream_data)
+                    accumulator.append(audio_stream_data)
 
-            combined_audio_data = AudioChunk.combine(audio_data_chunks)
-            return combined_audio_data
+            return accumulator.to_chunk()
+        except GenerationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in audio generation: {str(e)}")
             raise
@@ -471,9 +718,9 @@ class TTSService:
         try:
             # Get backend and voice path
             backend = self.model_manager.get_backend()
-            voice_name, voice_path = await self._get_voices_path(voice)
+            voice_name, voice_tensor = await self._get_voice(voice)
 
-            if isinstance(backend, KokoroV1):
+            if isinstance(backend, _PIPELINE_BACKENDS):
                 # For Kokoro V1, use generate_from_tokens with raw phonemes
                 result = None
                 # Use provided lang_code or determine from voice name
@@ -483,26 +730,24 @@ class TTSService:
                 )
 
                 try:
-                    # Use backend's pipeline management
-                    for r in backend._get_pipeline(
-                        pipeline_lang_code
-                    ).generate_from_tokens(
-                        tokens=phonemes,  # Pass raw phonemes string
-                        voice=voice_path,
+                    # Backend runs the pipeline on the inference executor
+                    async for audio in backend.generate_from_tokens(
+                        phonemes,  # Pass raw phonemes string
+                        (voice_name, voice_tensor),
                         speed=speed,
+                        lang_code=pipeline_lang_code,
                     ):
-                        if r.audio is not None:
-                            result = r
-                            break
+                        result = audio
+                        break
                 except Exception as e:
                     logger.error(f"Failed to generate from phonemes: {e}")
                     raise RuntimeError(f"Phoneme generation failed: {e}")
 
-                if result is None or result.audio is None:
+                if result is None:
                     raise ValueError("No audio generated")
 
                 processing_time = time.time() - start_time
-                return result.audio.numpy(), processing_time
+                return result, processing_time
             else:
                 raise ValueError(
                     "Phoneme generation only supported with Kokoro V1 backend"
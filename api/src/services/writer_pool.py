@@ -0,0 +1,150 @@
+"""Pool of pre-opened audio writers"""
+
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from .streaming_audio_writer import StreamingAudioWriter
+
+WriterKey = Tuple[str, int, int]
+
+
+class WriterPool:
+    """Keeps pre-opened StreamingAudioWriters ready per (format, rate, channels).
+
+    Opening a writer means ``av.open``, ``add_stream`` and opening the codec,
+    which is slow for the mp3, opus and aac encoders. A container can't be
+    reused once its trailer is written, and an encoder can't be restarted
+    after it was flushed, so writers are single use. The pool instead opens
+    them ahead of demand: ``acquire`` takes a spare if one is ready and a
+    background thread opens its replacement off the request path.
+    """
+
+    def __init__(self, spares: int):
+        self._spares = spares
+        self._lock = threading.Lock()
+        self._ready: Dict[WriterKey, List[StreamingAudioWriter]] = defaultdict(list)
+        self._refilling = set()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="writer-pool")
+        self._hits = 0
+        self._misses = 0
+
+    def acquire(
+        self, format: str, sample_rate: int, channels: int = 1
+    ) -> StreamingAudioWriter:
+        """Get a writer for a new stream.
+
+        Args:
+            format: Output format
+            sample_rate: Output sample rate
+            channels: Number of channels
+
+        Returns:
+            A fresh StreamingAudioWriter, owned by the caller
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        key = (format.lower(), sample_rate, channels)
+        # PCM writers have no container to open
+        if self._spares <= 0 or key[0] == "pcm":
+            return StreamingAudioWriter(*key)
+
+        with self._lock:
+            ready = self._ready.get(key)
+            writer = ready.pop() if ready else None
+            if writer is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if writer is None:
+            # Validates the format before any spares are opened for it
+            writer = StreamingAudioWriter(*key)
+        self._refill(key)
+        return writer
+
+    def warm(self, formats: Iterable[str], sample_rate: int, channels: int = 1) -> None:
+        """Open spares for formats expected to be requested.
+
+        Args:
+            formats: Output formats
+            sample_rate: Output sample rate
+            channels: Number of channels
+        """
+        for format in formats:
+            if format.lower() != "pcm" and self._spares > 0:
+                self._refill((format.lower(), sample_rate, channels))
+
+    def _refill(self, key: WriterKey) -> None:
+        with self._lock:
+            if key in self._refilling or len(self._ready[key]) >= self._spares:
+                return
+            self._refilling.add(key)
+        try:
+            self._pool.submit(self._open_spares, key)
+        except RuntimeError:
+            # Pool shut down
+            with self._lock:
+                self._refilling.discard(key)
+
+    def _open_spares(self, key: WriterKey) -> None:
+        try:
+            while True:
+                with self._lock:
+                    if len(self._ready[key]) >= self._spares:
+                        return
+                writer = StreamingAudioWriter(*key)
+                with self._lock:
+                    self._ready[key].append(writer)
+        except Exception as e:
+            logger.warning(f"Failed to open spare {key[0]} writer: {e}")
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def stats(self) -> dict:
+        """Get pool statistics.
+
+        Returns:
+            Dict with spare counts per format and hit counts
+        """
+        with self._lock:
+            ready = {
+                f"{format}/{rate}/{channels}": len(writers)
+                for (format, rate, channels), writers in self._ready.items()
+            }
+        return {
+            "spares_per_key": self._spares,
+            "ready": ready,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+    def shutdown(self) -> None:
+        """Stop refilling and close the spares."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            writers = [writer for ready in self._ready.values() for writer in ready]
+            self._ready.clear()
+        for writer in writers:
+            writer.close()
+
+
+_writer_pool: Optional[WriterPool] = None
+
+
+def get_writer_pool() -> WriterPool:
+    """Get the global writer pool.
+
+    Returns:
+        WriterPool instance
+    """
+    global _writer_pool
+    if _writer_pool is None:
+        _writer_pool = WriterPool(spares=settings.writer_pool_spares)
+    return _writer_pool
@@ -121,6 +121,15 @@ class OpenAISpeechRequest(BaseModel):
         default=NormalizationOptions(),
         description="Options for the normalization system",
     )
+    deadline_ms: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Optional time in milliseconds to wait for the first audio. Requests that cannot meet it are rejected with 429. Can also be set with the X-Deadline-Ms header.",
+    )
+    priority: Optional[Literal["interactive", "batch"]] = Field(
+        default=None,
+        description="Optional scheduling class. Interactive requests get a larger share of the model under load. If not provided, short inputs are interactive and long ones batch.",
+    )
 
 
 class CaptionedSpeechRequest(BaseModel):
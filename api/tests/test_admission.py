@@ -0,0 +1,90 @@
+"""Tests for admission control"""
+
+from unittest.mock import patch
+
+import pytest
+
+from api.src.services.admission import AdmissionController, AdmissionRejected
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the admission module's clock."""
+    fake = FakeClock()
+    with patch("api.src.services.admission.time", fake):
+        yield fake
+
+
+def _text(audio_seconds):
+    """Text estimated to take a given number of audio seconds."""
+    return "x" * int(audio_seconds * 15)
+
+
+def test_estimate_follows_length_and_speed():
+    """Test the audio estimate scales with text length and speed."""
+    assert AdmissionController.estimate_seconds(_text(4)) == pytest.approx(4)
+    assert AdmissionController.estimate_seconds(_text(4), speed=2.0) == pytest.approx(2)
+
+
+def test_rejects_when_backlog_would_finish_late(clock):
+    """Test requests are shed once the backlog can't drain in time."""
+    controller = AdmissionController(max_completion_s=10)
+    # Idle, so even a long request is admitted
+    ticket = controller.admit(_text(60))
+
+    # 4s of audio in 2s of wall time: 2 audio seconds per second
+    clock.now = 2.0
+    ticket.progress(4.0)
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        controller.admit(_text(1))
+    assert exc_info.value.reason == "overloaded"
+    # 57s left at 2x takes 28.5s, 18.5s over the limit
+    assert exc_info.value.retry_after == 19
+
+    ticket.release()
+    controller.admit(_text(60))
+    state = controller.state()
+    assert state["rejected"] == {"overloaded": 1, "deadline": 0}
+    assert state["admitted"] == 2
+
+
+def test_release_returns_remaining_work(clock):
+    """Test the backlog only keeps work of requests still in flight."""
+    controller = AdmissionController(max_completion_s=10)
+    first = controller.admit(_text(10))
+    second = controller.admit(_text(5))
+    clock.now = 1.0
+    first.progress(3.0)
+    assert controller.state()["in_flight_audio_seconds"] == pytest.approx(12)
+
+    first.release()
+    first.release()
+    state = controller.state()
+    assert state["in_flight_requests"] == 1
+    assert state["in_flight_audio_seconds"] == pytest.approx(5)
+    assert state["throughput"] == pytest.approx(3.0)
+    assert second.remaining == pytest.approx(5)
+
+
+def test_rejects_deadline_shorter_than_queue_wait(clock):
+    """Test deadlines below the recent wait for first audio are rejected early."""
+    controller = AdmissionController(max_completion_s=1000)
+    ticket = controller.admit(_text(10))
+    clock.now = 2.0
+    ticket.progress(1.0)
+    assert controller.state()["queue_wait_seconds"] == 2.0
+
+    with pytest.raises(AdmissionRejected) as exc_info:
+        controller.admit(_text(1), deadline_s=0.5)
+    assert exc_info.value.reason == "deadline"
+    assert exc_info.value.retry_after == 2
+    controller.admit(_text(1), deadline_s=5)
@@ -0,0 +1,69 @@
+"""Tests for AudioAccumulator"""
+
+import numpy as np
+
+from api.src.inference.base import AudioAccumulator, AudioChunk
+from api.src.structures.schemas import WordTimestamp
+
+
+def test_append_grows_past_estimate():
+    """Test appends beyond the reserved capacity keep all audio in order."""
+    accumulator = AudioAccumulator(capacity=4)
+
+    for value in range(5):
+        accumulator.append(
+            AudioChunk(np.full(3, value, dtype=np.int16), word_timestamps=None)
+        )
+
+    chunk = accumulator.to_chunk()
+    assert chunk.audio.tolist() == [v for v in range(5) for _ in range(3)]
+    assert accumulator.capacity >= 15
+    assert chunk.word_timestamps is None
+
+
+def test_reserved_capacity_is_not_reallocated():
+    """Test a sufficient estimate never reallocates the buffer."""
+    accumulator = AudioAccumulator(capacity=100)
+    buffer = accumulator._audio
+
+    for _ in range(10):
+        accumulator.append(AudioChunk(np.ones(10, dtype=np.int16)))
+
+    assert accumulator._audio is buffer
+    assert len(accumulator) == 100
+
+
+def test_word_timestamps_are_collected():
+    """Test timestamps from every chunk that has them are kept in order."""
+    accumulator = AudioAccumulator()
+    accumulator.append(
+        AudioChunk(
+            np.zeros(2, dtype=np.int16),
+            word_timestamps=[WordTimestamp(word="hi", start_time=0.0, end_time=0.5)],
+        )
+    )
+    accumulator.append(AudioChunk(np.zeros(2, dtype=np.int16), word_timestamps=None))
+    accumulator.append(
+        AudioChunk(
+            np.zeros(2, dtype=np.int16),
+            word_timestamps=[WordTimestamp(word="there", start_time=0.5, end_time=1.0)],
+        )
+    )
+
+    timestamps = accumulator.to_chunk().word_timestamps
+    assert [(t.word, t.start_time, t.end_time) for t in timestamps] == [
+        ("hi", 0.0, 0.5),
+        ("there", 0.5, 1.0),
+    ]
+
+
+def test_combine_concatenates_chunks():
+    """Test AudioChunk.combine joins audio and timestamps."""
+    combined = AudioChunk.combine(
+        [
+            AudioChunk(np.array([1, 2], dtype=np.int16), word_timestamps=[]),
+            AudioChunk(np.array([3], dtype=np.int16), word_timestamps=[]),
+        ]
+    )
+    assert combined.audio.tolist() == [1, 2, 3]
+    assert combined.word_timestamps == []
@@ -1,5 +1,6 @@
 """Tests for AudioService"""
 
+import math
 from unittest.mock import patch
 
 import numpy as np
@@ -7,7 +8,7 @@ import pytest
 
 from api.src.inference.base import AudioChunk
 from api.src.services.audio import AudioNormalizer, AudioService
-from api.src.services.streaming_audio_writer import StreamingAudioWriter
+from api.src.services.streaming_audio_writer import PacketSink, StreamingAudioWriter
 
 
 @pytest.fixture(autouse=True)
@@ -155,6 +156,37 @@ async def test_convert_to_pcm(sample_audio):
     # PCM is raw bytes, so no header to check
 
 
+def test_packet_sink_hands_out_written_buffers():
+    """Test the sink returns the written buffers themselves, once."""
+    sink = PacketSink()
+    first, second = b"RIFF0000", b"data"
+
+    sink.write(first)
+    sink.write(second)
+    drained = sink.drain()
+
+    assert drained == [first, second]
+    assert drained[0] is first
+    assert sink.drain() == []
+    assert sink.tell() == 12
+
+
+def test_packet_sink_patches_pending_data_only():
+    """Test header rewrites apply to pending bytes and skip sent ones."""
+    sink = PacketSink()
+    sink.write(b"RIFF0000")
+    sink.drain()
+    sink.write(b"WAVEdata")
+
+    # Rewrite spanning sent and pending bytes, then continue at the end
+    sink.seek(6)
+    sink.write(b"XXXX")
+    sink.seek(0, 2)
+    sink.write(b"!")
+
+    assert b"".join(sink.drain()) == b"XXVEdata!"
+
+
 @pytest.mark.asyncio
 async def test_convert_to_invalid_format_raises_error(sample_audio):
     """Test that converting to an invalid format raises an error"""
@@ -256,3 +288,102 @@ async def test_buffer_position_after_conversion(sample_audio):
     assert isinstance(audio_chunk2.output, bytes)
     assert isinstance(audio_chunk2, AudioChunk)
     assert len(audio_chunk1.output) == len(audio_chunk2.output)
+
+
+def _reference_find_first_last_non_silent(
+    normalizer,
+    settings,
+    audio_data,
+    chunk_text,
+    speed,
+    silence_threshold_db=-45,
+    is_last_chunk=False,
+):
+    """Per-sample loop implementation the vectorized scan must match"""
+    pad_multiplier = 1
+    split_character = chunk_text.strip()
+    if len(split_character) > 0:
+        split_character = split_character[-1]
+        multipliers = settings.dynamic_gap_trim_padding_char_multiplier
+        if split_character in multipliers:
+            pad_multiplier = multipliers[split_character]
+
+    if not is_last_chunk:
+        samples_to_pad_end = max(
+            int(
+                (
+                    settings.dynamic_gap_trim_padding_ms
+                    * normalizer.sample_rate
+                    * pad_multiplier
+                )
+                / 1000
+            )
+            - normalizer.samples_to_pad_start,
+            0,
+        )
+    else:
+        samples_to_pad_end = normalizer.samples_to_pad_start
+    amplitude_threshold = np.iinfo(audio_data.dtype).max * (
+        10 ** (silence_threshold_db / 20)
+    )
+    start, end = None, None
+    for X in range(0, len(audio_data)):
+        if abs(audio_data[X]) > amplitude_threshold:
+            start = X
+            break
+    for X in range(len(audio_data) - 1, -1, -1):
+        if abs(audio_data[X]) > amplitude_threshold:
+            end = X
+            break
+    if start is None or end is None:
+        return 0, len(audio_data)
+    return max(start - normalizer.samples_to_pad_start, 0), min(
+        end + math.ceil(samples_to_pad_end / speed), len(audio_data)
+    )
+
+
+def _speech_like_chunk(length, rng):
+    """int16 chunk with silent lead-in/tail around a noisy voiced region"""
+    audio = np.zeros(length, dtype=np.int16)
+    lead = length // 5
+    tail = length // 4
+    audio[:lead] = rng.integers(-50, 50, lead)
+    audio[lead : length - tail] = rng.integers(-20000, 20000, length - lead - tail)
+    audio[length - tail :] = rng.integers(-50, 50, tail)
+    return audio
+
+
+@pytest.fixture
+def trim_settings(mock_settings):
+    """Dynamic gap trim settings used by find_first_last_non_silent"""
+    mock_settings.dynamic_gap_trim_padding_ms = 410
+    mock_settings.dynamic_gap_trim_padding_char_multiplier = {
+        ".": 1,
+        "!": 0.9,
+        "?": 1,
+        ",": 0.8,
+    }
+    return mock_settings
+
+
+@pytest.mark.parametrize("length", [0, 1, 100, 2400, 24000, 240000])
+@pytest.mark.parametrize("chunk_text", ["Hello.", "Wait,", "Really?!", "word", ""])
+@pytest.mark.parametrize("is_last_chunk", [False, True])
+def test_find_first_last_non_silent_parity(
+    trim_settings, length, chunk_text, is_last_chunk
+):
+    """Test vectorized silence detection matches the per-sample loop"""
+    normalizer = AudioNormalizer()
+    rng = np.random.default_rng(length)
+    cases = [
+        _speech_like_chunk(length, rng),
+        np.zeros(length, dtype=np.int16),  # fully silent
+        np.full(length, -32768, dtype=np.int16),  # abs() wraps for int16 min
+    ]
+    for audio in cases:
+        for speed in (0.5, 1.0, 1.7):
+            assert normalizer.find_first_last_non_silent(
+                audio, chunk_text, speed, is_last_chunk=is_last_chunk
+            ) == _reference_find_first_last_non_silent(
+                normalizer, trim_settings, audio, chunk_text, speed, is_last_chunk=is_last_chunk
+            )
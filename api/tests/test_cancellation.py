@@ -0,0 +1,104 @@
+"""Tests for cancellation of in-flight synthesis"""
+
+import asyncio
+import threading
+
+import pytest
+
+from api.src.inference.cancellation import (
+    CancellationToken,
+    ComputeSavings,
+    GenerationCancelled,
+    cancellable,
+)
+from api.src.inference.executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create an executor and shut it down after the test."""
+    executor = InferenceExecutor(max_workers=1, queue_size=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_cancellable_stops_before_next_item():
+    """Test no further sub-segment starts once the token is cancelled."""
+    cancel = CancellationToken()
+    started = []
+
+    def segments():
+        for index in range(5):
+            started.append(index)
+            yield index
+
+    received = []
+    with pytest.raises(GenerationCancelled) as exc_info:
+        for item in cancellable(segments(), cancel):
+            received.append(item)
+            if item == 1:
+                cancel.cancel("client_disconnected")
+    assert received == [0, 1]
+    assert started == [0, 1]
+    assert exc_info.value.reason == "client_disconnected"
+
+
+def test_cancel_keeps_first_reason():
+    """Test a token remembers why it was first cancelled."""
+    cancel = CancellationToken()
+    assert not cancel.cancelled
+    cancel.raise_if_cancelled()
+    cancel.cancel("deadline")
+    cancel.cancel("client_disconnected")
+    assert cancel.cancelled
+    assert cancel.reason == "deadline"
+
+
+@pytest.mark.asyncio
+async def test_worker_aborts_between_sub_segments(executor):
+    """Test a cancelled token stops the worker thread after its current sub-segment."""
+    cancel = CancellationToken()
+    started = []
+    in_second = threading.Event()
+    release = threading.Event()
+
+    def segments():
+        for index in range(5):
+            started.append(index)
+            if index == 1:
+                # Still synthesizing this sub-segment when the client leaves
+                in_second.set()
+                release.wait(1)
+            yield index
+
+    received = []
+    with pytest.raises(GenerationCancelled):
+        async for item in executor.iterate(lambda: cancellable(segments(), cancel)):
+            received.append(item)
+            if item == 0:
+                await asyncio.to_thread(in_second.wait, 1)
+                cancel.cancel("client_disconnected")
+                release.set()
+    assert received == [0, 1]
+    assert started == [0, 1]
+
+
+def test_savings_use_learned_rate():
+    """Test saved compute is the remaining audio at the learned rate."""
+    savings = ComputeSavings(alpha=0.5)
+    savings.completed(compute_seconds=2.0, audio_seconds=10.0)
+    savings.completed(compute_seconds=4.0, audio_seconds=10.0)
+    assert savings.stats()["compute_seconds_per_audio_second"] == pytest.approx(0.3)
+
+    saved = savings.cancelled("client_disconnected", 1.0, 5.0, remaining_audio_seconds=20.0)
+    assert saved == pytest.approx(6.0)
+    assert savings.cancelled("closed", 0.0, 0.0, remaining_audio_seconds=-1.0) == 0.0
+    stats = savings.stats()
+    assert stats["cancelled"] == 2
+    assert stats["compute_seconds_saved"] == pytest.approx(6.0)
+
+
+def test_savings_fall_back_to_own_rate():
+    """Test a cancellation before any completed generation uses its own rate."""
+    savings = ComputeSavings()
+    assert savings.cancelled("client_disconnected", 1.0, 4.0, 8.0) == pytest.approx(2.0)
@@ -0,0 +1,165 @@
+"""Tests for the chunk scheduler"""
+
+import asyncio
+
+import pytest
+
+from api.src.core.config import settings
+from api.src.services import chunk_scheduler
+from api.src.services.chunk_scheduler import ChunkScheduler, get_chunk_scheduler
+
+WEIGHTS = {"interactive": 4.0, "batch": 1.0}
+
+
+async def _hold(scheduler, stream, order, name, cost=10):
+    async with scheduler.slot(stream, cost=cost):
+        order.append(name)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_slots_limit_concurrency():
+    """Test no more chunks than slots run at once."""
+    scheduler = ChunkScheduler(slots=2, weights=WEIGHTS, underrun_margin_s=0)
+    running = 0
+    peak = 0
+
+    async def chunk():
+        nonlocal running, peak
+        stream = scheduler.open_stream("batch", playback=False)
+        async with scheduler.slot(stream):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(chunk() for _ in range(6)))
+    assert peak == 2
+    assert scheduler.stats()["busy_slots"] == 0
+    assert scheduler.stats()["served"] == {"interactive": 0, "batch": 6}
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_share_across_streams():
+    """Test an interactive stream gets more slots than competing batch streams."""
+    scheduler = ChunkScheduler(slots=1, weights=WEIGHTS, underrun_margin_s=0)
+    order = []
+
+    async def request(name, priority):
+        stream = scheduler.open_stream(priority, playback=False)
+        for _ in range(8):
+            await _hold(scheduler, stream, order, name)
+
+    await asyncio.gather(
+        request("b1", "batch"),
+        request("b2", "batch"),
+        request("b3", "batch"),
+        request("i", "interactive"),
+    )
+
+    # While everything competes, the interactive stream finishes first
+    first = order[:16]
+    assert first.count("i") == 8
+    assert max(first.count(name) for name in ("b1", "b2", "b3")) < 8
+
+
+@pytest.mark.asyncio
+async def test_stream_about_to_stall_goes_first():
+    """Test played-back streams with little audio buffered are served earliest-deadline-first."""
+    scheduler = ChunkScheduler(slots=1, weights=WEIGHTS, underrun_margin_s=2.0)
+    buffered = scheduler.open_stream("interactive", playback=True)
+    buffered.delivered(20.0)
+    starving = scheduler.open_stream("batch", playback=True)
+    starving.delivered(0.5)
+    order = []
+
+    blocker = scheduler.open_stream("batch", playback=False)
+    async with scheduler.slot(blocker):
+        tasks = [
+            asyncio.create_task(_hold(scheduler, buffered, order, "buffered", cost=1)),
+            asyncio.create_task(_hold(scheduler, starving, order, "starving", cost=100)),
+        ]
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order == ["starving", "buffered"]
+    assert scheduler.stats()["served_urgent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_stream_outranks_buffered_stream():
+    """Test a stream still waiting for its first audio counts as stalling."""
+    scheduler = ChunkScheduler(slots=1, weights=WEIGHTS, underrun_margin_s=2.0)
+    buffered = scheduler.open_stream("interactive", playback=True)
+    buffered.delivered(1.0)
+    new = scheduler.open_stream("batch", playback=True)
+    order = []
+
+    blocker = scheduler.open_stream("batch", playback=False)
+    async with scheduler.slot(blocker):
+        tasks = [
+            asyncio.create_task(_hold(scheduler, buffered, order, "buffered")),
+            asyncio.create_task(_hold(scheduler, new, order, "new")),
+        ]
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*tasks)
+    assert order == ["new", "buffered"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_frees_its_place():
+    """Test a cancelled chunk neither holds nor leaks a slot."""
+    scheduler = ChunkScheduler(slots=1, weights=WEIGHTS, underrun_margin_s=0)
+    stream = scheduler.open_stream("batch", playback=False)
+
+    async with scheduler.slot(stream):
+        waiting = asyncio.create_task(_hold(scheduler, stream, [], "cancelled"))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["waiting"]["batch"] == 1
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    assert scheduler.stats()["waiting"]["batch"] == 0
+    assert scheduler.stats()["busy_slots"] == 0
+
+
+def test_priority_defaults_from_text_length():
+    """Test short requests are interactive and long ones batch."""
+    scheduler = ChunkScheduler(slots=1, weights=WEIGHTS, underrun_margin_s=0)
+    assert scheduler.open_stream(text_length=20).priority == "interactive"
+    assert scheduler.open_stream(text_length=100000).priority == "batch"
+    with pytest.raises(ValueError):
+        scheduler.open_stream("urgent")
+
+
+@pytest.mark.asyncio
+async def test_default_slots_schedule_every_chunk(monkeypatch):
+    """Test with default settings a chunk waits for the scheduler, not the executor."""
+    monkeypatch.setattr(chunk_scheduler, "_chunk_scheduler", None)
+    scheduler = get_chunk_scheduler()
+    assert scheduler.stats()["slots"] == settings.inference_workers
+
+    batch = scheduler.open_stream("batch", playback=False)
+    interactive = scheduler.open_stream("interactive", playback=False)
+    order = []
+
+    async def request(stream, name, chunks):
+        # Each request synthesizes one chunk at a time, as the pipeline does
+        for _ in range(chunks):
+            async with scheduler.slot(stream, cost=10):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+    long_form = asyncio.create_task(request(batch, "b", 3))
+    await asyncio.sleep(0)
+    prompt = asyncio.create_task(request(interactive, "i", 1))
+    await asyncio.sleep(0)
+    # Every worker is busy, so the prompt's chunk queues in the scheduler
+    assert scheduler.stats()["waiting"]["interactive"] == 1
+
+    await asyncio.gather(long_form, prompt)
+    # It goes ahead of the long-form request's next chunk
+    assert order == ["b", "i", "b", "b"]
+    assert scheduler.stats()["busy_slots"] == 0
@@ -0,0 +1,133 @@
+"""Tests for request coalescing"""
+
+import asyncio
+
+import pytest
+
+from api.src.inference.cancellation import CancellationToken
+from api.src.services.coalescer import Coalescer
+
+
+async def _source(chunks, gate=None, error=None):
+    for chunk in chunks:
+        if gate is not None:
+            await gate.get()
+        yield chunk
+    if error is not None:
+        raise error
+
+
+async def _collect(generator):
+    return [chunk async for chunk in generator]
+
+
+@pytest.mark.asyncio
+async def test_late_joiner_replays_then_follows():
+    """Test a request joining mid-generation still receives every byte."""
+    coalescer = Coalescer()
+    gate = asyncio.Queue()
+    flight, created = coalescer.start("key", _source([b"a", b"b", b"c"], gate))
+    assert created
+    leader = asyncio.create_task(_collect(flight.subscribe()))
+
+    gate.put_nowait(None)
+    await asyncio.sleep(0.01)
+    assert flight.chunks == [b"a"]
+
+    joined = coalescer.get("key")
+    assert joined is flight
+    follower = asyncio.create_task(_collect(joined.subscribe()))
+    gate.put_nowait(None)
+    gate.put_nowait(None)
+
+    assert await leader == [b"a", b"b", b"c"]
+    assert await follower == [b"a", b"b", b"c"]
+    assert coalescer.get("key") is None
+    stats = coalescer.stats()
+    assert stats["leaders"] == 1
+    assert stats["joins"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_generation_cancelled_when_last_subscriber_leaves():
+    """Test the shared generation stops only once nobody is listening."""
+    coalescer = Coalescer()
+    cancel = CancellationToken()
+    gate = asyncio.Queue()
+    flight, _ = coalescer.start("key", _source([b"a", b"b"], gate), cancel)
+    first = flight.subscribe()
+    second = flight.subscribe()
+
+    gate.put_nowait(None)
+    assert await first.__anext__() == b"a"
+    await first.aclose()
+    await asyncio.sleep(0)
+    assert not flight.done
+    assert not cancel.cancelled
+
+    assert await second.__anext__() == b"a"
+    await second.aclose()
+    # The inference worker is told to stop, not just the encoding task
+    assert cancel.reason == "abandoned"
+    await asyncio.sleep(0.01)
+    assert flight.done
+    assert coalescer.stats()["cancelled"] == 1
+    assert coalescer.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_error_reaches_every_subscriber():
+    """Test a failed generation fails every request attached to it."""
+    coalescer = Coalescer()
+    flight, _ = coalescer.start("key", _source([b"a"], error=ValueError("boom")))
+    subscriptions = [flight.subscribe(), flight.subscribe()]
+
+    for subscription in subscriptions:
+        with pytest.raises(ValueError):
+            await _collect(subscription)
+    assert coalescer.stats()["cancelled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_start_returns_running_flight():
+    """Test a request racing an identical one attaches instead of generating."""
+    coalescer = Coalescer()
+    gate = asyncio.Queue()
+    flight, created = coalescer.start("key", _source([b"a"], gate))
+    duplicate = _source([b"b"])
+    again, created_again = coalescer.start("key", duplicate)
+
+    assert created and not created_again
+    assert again is flight
+    await duplicate.aclose()
+    await _collect(coalescer.start("other", _source([b"c"]))[0].subscribe())
+    assert coalescer.stats()["leaders"] == 2
+
+    gate.put_nowait(None)
+    assert await _collect(flight.subscribe()) == [b"a"]
+
+
+@pytest.mark.asyncio
+async def test_join_after_last_subscriber_left_starts_afresh():
+    """Test a request arriving while an abandoned flight stops doesn't join it."""
+    coalescer = Coalescer()
+    gate = asyncio.Queue()
+    flight, _ = coalescer.start("key", _source([b"a", b"b"], gate))
+    subscription = flight.subscribe()
+    gate.put_nowait(None)
+    assert await subscription.__anext__() == b"a"
+    await subscription.aclose()
+
+    # The cancelled task has not stopped yet, but the flight is unregistered
+    assert not flight.done
+    assert coalescer.get("key") is None
+    fresh, created = coalescer.start("key", _source([b"c"]))
+    assert created and fresh is not flight
+    assert await _collect(fresh.subscribe()) == [b"c"]
+
+    await asyncio.sleep(0.01)
+    assert flight.done
+    stats = coalescer.stats()
+    assert stats["cancelled"] == 1
+    assert stats["in_flight"] == 0
@@ -146,3 +146,144 @@ async def test_flashsr_service_availability():
 
     # Should be available after initialization
     assert service.is_available() is True
+
+
+class _RepeatSession:
+    """Fake ONNX session: nearest-neighbour 16kHz -> 48kHz, records batch shapes."""
+
+    def __init__(self, batch_dim="batch"):
+        self.batch_dim = batch_dim
+        self.calls = []
+
+    def get_inputs(self):
+        return [MagicMock(shape=[self.batch_dim, "samples"])]
+
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+
+    def run(self, output_names, feeds):
+        batch = feeds["audio_values"]
+        self.calls.append(batch.shape)
+        return [np.repeat(batch, 3, axis=1)]
+
+
+def test_polyphase_resample_matches_resample_poly():
+    """Test the cached polyphase filter reproduces scipy's default design"""
+    from scipy.signal import resample_poly
+
+    from api.src.services.flashsr_service import polyphase_resample
+
+    audio = np.random.default_rng(0).standard_normal(24000).astype(np.float32)
+    resampled = polyphase_resample(audio, 24000, 16000)
+    assert len(resampled) == 16000
+    assert np.allclose(resampled, resample_poly(audio, 2, 3), atol=1e-5)
+
+
+def test_flashsr_segments_are_seamless(sample_audio_24k):
+    """Test overlap-added segments match a single-pass upsample"""
+    from api.src.services.flashsr_service import polyphase_resample
+
+    audio = np.tile(sample_audio_24k[0], 6)  # 3 seconds
+    with patch(
+        "api.src.services.flashsr_service.settings.flashsr_segment_seconds", 0.5
+    ):
+        service = FlashSRService()
+        session = _RepeatSession()
+        service._attach_session(session)
+        upsampled = service.upsample_audio(audio, 24000)
+
+    assert len(upsampled) == 2 * len(audio)
+    assert len(session.calls) > 1 or session.calls[0][0] > 1
+    reference = np.repeat(polyphase_resample(audio, 24000, 16000), 3)
+    assert np.allclose(upsampled, reference[: len(upsampled)], atol=1e-5)
+
+
+def test_flashsr_batches_concurrent_calls(sample_audio_24k):
+    """Test segments from concurrent callers share one ONNX call"""
+    import threading
+
+    audio, sample_rate = sample_audio_24k
+    with patch(
+        "api.src.services.flashsr_service.settings.flashsr_batch_wait_ms", 50.0
+    ):
+        service = FlashSRService()
+        session = _RepeatSession()
+        service._attach_session(session)
+
+        results = [None] * 4
+
+        def worker(i):
+            results[i] = service.upsample_audio(audio, sample_rate)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert all(len(result) == 2 * len(audio) for result in results)
+    assert sum(shape[0] for shape in session.calls) == 4
+    assert len(session.calls) < 4
+    assert service.stats()["batching"]["segments"] == 4
+
+
+def test_flashsr_fixed_batch_dim_disables_batching(sample_audio_24k):
+    """Test models exported with a fixed batch of one run segments singly"""
+    audio, sample_rate = sample_audio_24k
+    service = FlashSRService()
+    session = _RepeatSession(batch_dim=1)
+    service._attach_session(session)
+
+    service.upsample_audio(audio, sample_rate)
+    assert service.stats()["batching"] is None
+    assert all(shape[0] == 1 for shape in session.calls)
+
+
+@pytest.mark.asyncio
+async def test_flashsr_pool_falls_back_when_saturated():
+    """Test a saturated FlashSR pool degrades to polyphase instead of queueing"""
+    import asyncio
+    import threading
+
+    from api.src.services.flashsr_service import FlashSRPool
+
+    release = threading.Event()
+    service = MagicMock()
+    service.is_available.return_value = True
+
+    def slow_upsample(audio, input_sample_rate):
+        release.wait(5)
+        return np.repeat(audio, 2)
+
+    service.upsample_audio.side_effect = slow_upsample
+    pool = FlashSRPool(max_workers=1, queue_size=0)
+    audio = np.full(2400, 1000, dtype=np.int16)
+
+    with patch("api.src.services.flashsr_service.settings.flashsr_fallback", "polyphase"):
+        busy = asyncio.create_task(pool.upsample(service, audio, 24000))
+        await asyncio.sleep(0.05)
+        fallback = await pool.upsample(service, audio, 24000)
+        release.set()
+        upsampled = await busy
+
+    assert fallback.dtype == np.int16
+    assert len(fallback) == 4800
+    assert len(upsampled) == 4800
+    stats = pool.stats()
+    assert stats["fallbacks"] == 1
+    assert stats["completed"] == 1
+    assert service.upsample_audio.call_count == 1
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_flashsr_pool_unavailable_service_uses_polyphase():
+    """Test the stream stays at 48kHz when FlashSR is unavailable"""
+    from api.src.services.flashsr_service import FlashSRPool
+
+    pool = FlashSRPool(max_workers=1, queue_size=1)
+    audio = np.zeros(2400, dtype=np.int16)
+    upsampled = await pool.upsample(None, audio, 24000)
+    assert len(upsampled) == 4800
+    assert pool.stats()["fallbacks"] == 1
+    pool.shutdown()
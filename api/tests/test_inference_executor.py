@@ -0,0 +1,94 @@
+"""Tests for the inference executor"""
+
+import asyncio
+import threading
+
+import pytest
+
+from api.src.inference.executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    """Create an executor and shut it down after the test."""
+    executor = InferenceExecutor(max_workers=2, queue_size=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_iterate_yields_items_in_order(executor):
+    """Test items from the worker generator arrive in order."""
+    results = [item async for item in executor.iterate(lambda: iter(range(10)))]
+    assert results == list(range(10))
+    assert executor.stats()["active_jobs"] == 0
+    assert executor.stats()["total_jobs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iterate_runs_off_event_loop(executor):
+    """Test the generator runs in a worker thread, not on the loop thread."""
+    loop_thread = threading.get_ident()
+
+    def worker():
+        yield threading.get_ident()
+
+    results = [item async for item in executor.iterate(worker)]
+    assert results[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_iterate_propagates_errors(executor):
+    """Test exceptions raised in the worker reach the consumer."""
+
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    received = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for item in executor.iterate(failing):
+            received.append(item)
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_iterate_stops_producer_when_consumer_leaves(executor):
+    """Test an abandoned iteration stops the worker at its next yield."""
+    produced = []
+    finished = threading.Event()
+
+    def endless():
+        try:
+            i = 0
+            while True:
+                produced.append(i)
+                yield i
+                i += 1
+        finally:
+            finished.set()
+
+    gen = executor.iterate(endless)
+    assert await gen.__anext__() == 0
+    await gen.aclose()
+
+    assert await asyncio.to_thread(finished.wait, 2.0)
+    # Producer can only run queue_size items ahead of the consumer
+    assert len(produced) <= 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_streams_interleave(executor):
+    """Test two blocking generators make progress concurrently."""
+    barrier = threading.Barrier(2, timeout=2.0)
+
+    def waits_for_peer():
+        # Deadlocks unless both generators run at the same time
+        barrier.wait()
+        yield "done"
+
+    async def consume():
+        return [item async for item in executor.iterate(waits_for_peer)]
+
+    results = await asyncio.gather(consume(), consume())
+    assert results == [["done"], ["done"]]
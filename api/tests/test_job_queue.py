@@ -0,0 +1,133 @@
+"""Tests for the shortest-job-first inference queue"""
+
+import asyncio
+import threading
+
+import pytest
+
+from api.src.inference.executor import InferenceExecutor
+from api.src.inference.job_queue import JobQueue
+
+
+@pytest.fixture
+def executor():
+    """Create an executor and shut it down after the test."""
+    executor = InferenceExecutor(max_workers=2, queue_size=4)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_single_job_passthrough(executor):
+    """Test a lone job runs immediately and yields its items."""
+    queue = JobQueue(slots=1, executor=executor)
+    results = [item async for item in queue.iterate(lambda: iter("abc"), cost=3)]
+    assert results == ["a", "b", "c"]
+    stats = queue.stats()
+    assert stats["jobs"] == 1
+    assert stats["queued_jobs"] == 0
+    assert stats["busy_slots"] == 0
+
+
+@pytest.mark.asyncio
+async def test_free_slots_are_not_held(executor):
+    """Test jobs run side by side while workers are free instead of waiting."""
+    queue = JobQueue(slots=2, executor=executor)
+    both_running = threading.Barrier(2, timeout=1)
+
+    def job(name):
+        def factory():
+            # Fails with BrokenBarrierError unless both jobs run at once
+            both_running.wait()
+            yield name
+
+        return factory
+
+    async def consume(name):
+        return [item async for item in queue.iterate(job(name))]
+
+    assert await asyncio.gather(consume("a"), consume("b")) == [["a"], ["b"]]
+    assert queue.stats()["queued_jobs"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiting_jobs_run_shortest_first(executor):
+    """Test the cheapest waiting job runs next once the busy worker frees up."""
+    queue = JobQueue(slots=1, executor=executor)
+    release = threading.Event()
+    order = []
+
+    def job(name, gate=None):
+        def factory():
+            if gate is not None:
+                gate.wait(1)
+            order.append(name)
+            yield name
+
+        return factory
+
+    async def consume(name, cost, gate=None):
+        return [item async for item in queue.iterate(job(name, gate), cost=cost)]
+
+    first = asyncio.create_task(consume("first", 500, release))
+    await asyncio.sleep(0.01)
+    waiting = [
+        asyncio.create_task(consume("long", 300)),
+        asyncio.create_task(consume("short", 10)),
+        asyncio.create_task(consume("medium", 100)),
+    ]
+    await asyncio.sleep(0.01)
+    assert queue.stats()["waiting_jobs"] == 3
+
+    release.set()
+    await asyncio.gather(first, *waiting)
+    assert order == ["first", "short", "medium", "long"]
+    assert queue.stats()["queued_jobs"] == 3
+
+
+@pytest.mark.asyncio
+async def test_job_error_does_not_affect_others(executor):
+    """Test a failing job only fails its own request and frees its slot."""
+    queue = JobQueue(slots=1, executor=executor)
+
+    def failing():
+        raise ValueError("boom")
+        yield
+
+    async def consume(factory):
+        return [item async for item in queue.iterate(factory)]
+
+    results = await asyncio.gather(
+        consume(failing), consume(lambda: iter([1])), return_exceptions=True
+    )
+    assert isinstance(results[0], ValueError)
+    assert results[1] == [1]
+    assert queue.stats()["busy_slots"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue(executor):
+    """Test a request cancelled while waiting gives up its place."""
+    queue = JobQueue(slots=1, executor=executor)
+    release = threading.Event()
+
+    def blocking():
+        release.wait(1)
+        yield "done"
+
+    async def consume(factory, cost=0):
+        return [item async for item in queue.iterate(factory, cost=cost)]
+
+    running = asyncio.create_task(consume(blocking))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(consume(lambda: iter(["never"]), cost=1))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert queue.stats()["waiting_jobs"] == 0
+
+    release.set()
+    assert await running == ["done"]
+    assert await consume(lambda: iter(["next"])) == ["next"]
+    assert queue.stats()["busy_slots"] == 0
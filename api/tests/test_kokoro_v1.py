@@ -136,11 +136,10 @@ async def test_generate_uses_correct_pipeline(kokoro_backend):
     # Mock voice path handling
     with (
         patch("api.src.core.paths.load_voice_tensor") as mock_load_voice,
-        patch("api.src.core.paths.save_voice_tensor"),
-        patch("tempfile.gettempdir") as mock_tempdir,
+        patch("api.src.core.paths.save_voice_tensor") as mock_save_voice,
     ):
-        mock_load_voice.return_value = torch.ones(1)
-        mock_tempdir.return_value = "/tmp"
+        voice_tensor = torch.ones(1)
+        mock_load_voice.return_value = voice_tensor
 
         # Mock KPipeline
         mock_pipeline = MagicMock()
@@ -152,14 +151,33 @@ async def test_generate_uses_correct_pipeline(kokoro_backend):
 
             # Should create pipeline with Spanish lang_code
             assert "e" in kokoro_backend._pipelines
-            # Use ANY to match the temp file path since it's dynamic
             mock_pipeline.assert_called_with(
                 "test",
-                voice=ANY,  # Don't check exact path since it's dynamic
+                voice=ANY,
                 speed=1.0,
                 model=kokoro_backend._model,
             )
-            # Verify the voice path is a temp file path
+            # Voice is handed to the pipeline in memory, no temp file round-trip
             call_args = mock_pipeline.call_args
-            assert isinstance(call_args[1]["voice"], str)
-            assert call_args[1]["voice"].startswith("/tmp/temp_voice_")
+            assert call_args[1]["voice"] is voice_tensor
+            mock_load_voice.assert_called_once()
+            mock_save_voice.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_generate_uses_voice_tensor_directly(kokoro_backend):
+    """Test that a provided voice tensor is used without touching disk."""
+    kokoro_backend._model = MagicMock()
+    voice_tensor = torch.ones(1)
+
+    with patch("api.src.core.paths.load_voice_tensor") as mock_load_voice:
+        mock_pipeline = MagicMock()
+        mock_pipeline.return_value = iter([])
+        with patch("api.src.inference.kokoro_v1.KPipeline", return_value=mock_pipeline):
+            async for _ in kokoro_backend.generate(
+                "test", ("af_voice", voice_tensor), lang_code="a"
+            ):
+                pass
+
+        mock_load_voice.assert_not_called()
+        assert mock_pipeline.call_args[1]["voice"] is voice_tensor
@@ -0,0 +1,86 @@
+"""Tests for Prometheus-style metrics"""
+
+from api.src.core.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    cache_family,
+    timed_iter,
+)
+
+
+def test_counter_and_gauge_render():
+    """Test counters get a _total suffix and gauges render their value."""
+    registry = Registry()
+    requests = registry.register(Counter("requests", "Requests", ["status"]))
+    active = registry.register(Gauge("active", "Active streams"))
+
+    requests.labels(status="ok").inc()
+    requests.labels(status="ok").inc()
+    requests.labels(status="error").inc()
+    active.inc()
+    active.inc()
+    active.dec()
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{status="ok"} 2' in text
+    assert 'requests_total{status="error"} 1' in text
+    assert "# TYPE active gauge" in text
+    assert "active 1" in text.splitlines()
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test histogram buckets, count and sum."""
+    registry = Registry()
+    latency = registry.register(
+        Histogram("latency_seconds", "Latency", ["stage"], buckets=(0.1, 1.0))
+    )
+
+    stage = latency.labels(stage="encode")
+    for value in (0.05, 0.5, 0.5, 3.0):
+        stage.observe(value)
+
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{stage="encode",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{stage="encode",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{stage="encode",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{stage="encode"} 4' in lines
+    assert 'latency_seconds_sum{stage="encode"} 4.05' in lines
+
+
+def test_timed_iter_observes_each_item():
+    """Test timed_iter records one observation per produced item."""
+    histogram = Histogram("forward_seconds", "Forward")
+
+    assert list(timed_iter(iter([1, 2, 3]), histogram)) == [1, 2, 3]
+    assert sum(histogram._counts) == 3
+
+
+def test_cache_family_hit_ratio():
+    """Test cache stats become hit/miss counters and a hit ratio."""
+    registry = Registry()
+    registry.register_collector(
+        lambda: cache_family(
+            {"phoneme": {"hits": 3, "misses": 1}, "voice": {"hits": 0, "misses": 0}}
+        )
+    )
+
+    lines = registry.render().splitlines()
+    assert 'kokoro_cache_hits_total{cache="phoneme"} 3' in lines
+    assert 'kokoro_cache_misses_total{cache="phoneme"} 1' in lines
+    assert 'kokoro_cache_hit_ratio{cache="phoneme"} 0.75' in lines
+    assert 'kokoro_cache_hit_ratio{cache="voice"} 0' in lines
+
+
+def test_broken_collector_does_not_break_scrape():
+    """Test a failing collector is skipped."""
+    registry = Registry()
+    registry.register(Gauge("up", "Up")).set(1)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    registry.register_collector(broken)
+    assert "up 1" in registry.render().splitlines()
@@ -6,16 +6,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
+import torch
 from fastapi.testclient import TestClient
 
 from api.src.core.config import settings
 from api.src.inference.base import AudioChunk
+from api.src.inference.cancellation import CancellationToken, GenerationCancelled
 from api.src.main import app
 from api.src.routers.openai_compatible import (
+    await_first,
+    coalesced_response,
     get_tts_service,
+    join_flight,
     load_openai_mappings,
+    start_generation,
     stream_audio_chunks,
+    watch_disconnect,
 )
+from api.src.services.admission import AdmissionController, AdmissionRejected
+from api.src.services.coalescer import Coalescer
+from api.src.services.resumable_streams import ResumableStreams
 from api.src.services.streaming_audio_writer import StreamingAudioWriter
 from api.src.services.tts_service import TTSService
 from api.src.structures.schemas import OpenAISpeechRequest
@@ -170,6 +180,91 @@ async def test_stream_audio_chunks_client_disconnect():
     assert len(chunks) == 0  # Should stop immediately due to disconnect
 
 
+@pytest.mark.asyncio
+async def test_watch_disconnect_cancels_generation(monkeypatch):
+    """Test a disconnect is noticed between chunks, without waiting for the next one"""
+    monkeypatch.setattr(settings, "disconnect_poll_interval_s", 0.01)
+    mock_request = MagicMock()
+    mock_request.is_disconnected = AsyncMock(side_effect=[False, False, True])
+
+    cancel = CancellationToken()
+    async with watch_disconnect(mock_request, cancel):
+        # Stands in for a chunk that is still synthesizing
+        for _ in range(100):
+            if cancel.cancelled:
+                break
+            await asyncio.sleep(0.01)
+
+    assert cancel.cancelled
+    assert cancel.reason == "client_disconnected"
+    assert mock_request.is_disconnected.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_join_flight_leaves_on_disconnect(monkeypatch):
+    """Test a non-streaming coalesced request stops its generation on disconnect"""
+    monkeypatch.setattr(settings, "disconnect_poll_interval_s", 0.01)
+    mock_request = MagicMock()
+    mock_request.is_disconnected = AsyncMock(side_effect=[False, True])
+    finish = asyncio.Event()
+
+    async def source():
+        yield b"a"
+        # Stands in for a chunk that is still synthesizing
+        await finish.wait()
+        yield b"b"
+
+    cancel = CancellationToken()
+    flight, _ = Coalescer().start("key", source(), cancel)
+    with pytest.raises(GenerationCancelled):
+        await join_flight(flight, mock_request)
+    await asyncio.sleep(0.01)
+
+    assert flight.subscribers == 0
+    assert cancel.reason == "abandoned"
+    assert flight.done and flight.cancelled
+
+
+@pytest.mark.asyncio
+async def test_coalesced_stream_is_resumable(monkeypatch):
+    """Test a coalesced streaming request still gets a stream ID to resume by"""
+    monkeypatch.setattr(settings, "enable_resumable_streams", True)
+    streams = ResumableStreams(grace_s=0.01)
+    monkeypatch.setattr(
+        "api.src.routers.openai_compatible.get_resumable_streams", lambda: streams
+    )
+    gate = asyncio.Queue()
+
+    async def source():
+        for chunk in (b"a", b"b"):
+            await gate.get()
+            yield chunk
+
+    cancel = CancellationToken()
+    flight, _ = Coalescer().start("key", source(), cancel)
+    request = OpenAISpeechRequest(
+        model="kokoro",
+        input="Test text",
+        voice="test_voice",
+        response_format="mp3",
+        stream=True,
+    )
+    response = await coalesced_response(
+        flight, request, MagicMock(), "audio/mpeg", "leader"
+    )
+    assert streams.get(response.headers["X-Stream-Id"]) is not None
+
+    body = response.body_iterator
+    gate.put_nowait(None)
+    assert await body.__anext__() == b"a"
+    # The client drops and nobody resumes within the grace period
+    await body.aclose()
+    await asyncio.sleep(0.05)
+
+    assert flight.subscribers == 0
+    assert cancel.reason == "abandoned"
+
+
 def test_openai_voice_mapping(mock_tts_service, mock_openai_mappings):
     """Test OpenAI voice name mapping"""
     mock_tts_service.list_voices.return_value = ["am_adam", "bf_isabella"]
@@ -185,8 +280,8 @@ def test_openai_voice_mapping(mock_tts_service, mock_openai_mappings):
         },
     )
     assert response.status_code == 200
-    mock_tts_service.generate_audio.assert_called_once()
-    assert mock_tts_service.generate_audio.call_args[1]["voice"] == "am_adam"
+    mock_tts_service.generate_audio_stream.assert_called_once()
+    assert mock_tts_service.generate_audio_stream.call_args[1]["voice"] == "am_adam"
 
 
 def test_openai_voice_mapping_streaming(
@@ -212,6 +307,14 @@ def test_openai_voice_mapping_streaming(
     assert content == mock_audio_bytes
 
 
+def test_resume_unknown_stream():
+    """Test resuming a stream that doesn't exist is a 404"""
+    with patch.object(settings, "enable_resumable_streams", True):
+        response = client.get("/v1/audio/speech/streams/missing?offset=10")
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"] == "stream_not_found"
+
+
 def test_invalid_openai_model(mock_tts_service, mock_openai_mappings):
     """Test error handling for invalid OpenAI model"""
     response = client.post(
@@ -246,7 +349,7 @@ def mock_tts_service(mock_audio_bytes):
         async def mock_stream(*args, **kwargs) -> AsyncGenerator[AudioChunk, None]:
             yield AudioChunk(np.ndarray([], np.int16), output=mock_audio_bytes)
 
-        service.generate_audio_stream = mock_stream
+        service.generate_audio_stream = MagicMock(side_effect=mock_stream)
         service.list_voices.return_value = ["test_voice", "voice1", "voice2"]
         service.combine_voices.return_value = "voice1_voice2"
 
@@ -255,17 +358,8 @@ def mock_tts_service(mock_audio_bytes):
         yield service
 
 
-@patch("api.src.services.audio.AudioService.convert_audio")
-def test_openai_speech_endpoint(
-    mock_convert, mock_tts_service, test_voice, mock_audio_bytes
-):
+def test_openai_speech_endpoint(mock_tts_service, test_voice, mock_audio_bytes):
     """Test the OpenAI-compatible speech endpoint with basic MP3 generation"""
-    # Configure mocks
-    mock_tts_service.generate_audio.return_value = AudioChunk(np.zeros(1000, np.int16))
-    mock_convert.return_value = AudioChunk(
-        np.zeros(1000, np.int16), output=mock_audio_bytes
-    )
-
     response = client.post(
         "/v1/audio/speech",
         json={
@@ -278,11 +372,238 @@ def test_openai_speech_endpoint(
     )
     assert response.status_code == 200
     assert response.headers["content-type"] == "audio/mpeg"
-    assert len(response.content) > 0
-    assert response.content == mock_audio_bytes + mock_audio_bytes
+    assert response.headers["content-length"] == str(len(mock_audio_bytes))
+    assert response.content == mock_audio_bytes
+
+    # Chunks are encoded as they are generated
+    mock_tts_service.generate_audio_stream.assert_called_once()
+    assert (
+        mock_tts_service.generate_audio_stream.call_args[1]["output_format"] == "mp3"
+    )
+    mock_tts_service.generate_audio.assert_not_called()
+
+
+def test_openai_speech_response_cache(mock_tts_service, test_voice):
+    """Test repeated requests are served from the response cache"""
+    from api.src.services.response_cache import ResponseCache
+
+    body = {
+        "model": "kokoro",
+        "input": "Hello world",
+        "voice": test_voice,
+        "response_format": "mp3",
+        "stream": False,
+    }
+
+    with (
+        patch(
+            "api.src.routers.openai_compatible.settings.enable_response_cache", True
+        ),
+        patch(
+            "api.src.routers.openai_compatible.get_response_cache",
+            return_value=ResponseCache(memory_bytes=1024),
+        ),
+    ):
+        first = client.post("/v1/audio/speech", json=body)
+        second = client.post("/v1/audio/speech", json={**body, "stream": True})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["X-Cache-Tier"] == "memory"
+    assert second.content == first.content
+    mock_tts_service.generate_audio_stream.assert_called_once()
+
+
+def test_openai_speech_response_cache_skips_failed_chunks():
+    """Test output missing a chunk that failed to generate is not cached"""
+    from api.src.inference.kokoro_v1 import KokoroV1
+    from api.src.services.response_cache import ResponseCache
+
+    async def fake_split(*args, **kwargs):
+        yield "One.", [1], None
+        yield "Two.", [2], None
+
+    generated = []
+
+    async def fake_generate(text, *args, **kwargs):
+        generated.append(text)
+        if generated == ["One.", "Two."]:
+            raise RuntimeError("Synthesis failed")
+        yield AudioChunk(np.full(24000, 0.5, dtype=np.float32))
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1, device="cpu")
+    model_manager.generate = MagicMock(side_effect=fake_generate)
+    voice_manager = AsyncMock()
+    voice_manager.list_voices.return_value = ["af_heart"]
+    voice_manager.load_voice.return_value = torch.ones(10)
+
+    async def create_service():
+        return await TTSService.create("test_output")
+
+    body = {
+        "model": "kokoro",
+        "input": "One. Two.",
+        "voice": "af_heart",
+        "response_format": "pcm",
+        "stream": False,
+    }
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch("api.src.services.tts_service.smart_split", new=fake_split),
+        patch("api.src.services.tts_service.get_sentence_cache", return_value=None),
+        patch("api.src.routers.openai_compatible.get_tts_service", new=create_service),
+        patch(
+            "api.src.routers.openai_compatible.settings.enable_response_cache", True
+        ),
+        patch(
+            "api.src.routers.openai_compatible.get_response_cache",
+            return_value=ResponseCache(memory_bytes=1 << 20),
+        ),
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        first = client.post("/v1/audio/speech", json=body)
+        second = client.post("/v1/audio/speech", json=body)
+
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    # The failed chunk was skipped, so the first response was never cached
+    assert second.headers["X-Cache"] == "MISS"
+    assert len(second.content) > len(first.content)
+    assert generated == ["One.", "Two.", "One.", "Two."]
+
+
+def test_openai_speech_admission_rejected(mock_tts_service, test_voice):
+    """Test shed requests get 429 with Retry-After before any generation"""
+    controller = MagicMock()
+    controller.admit.side_effect = AdmissionRejected("overloaded", "Too busy", 7)
+
+    with (
+        patch(
+            "api.src.routers.openai_compatible.settings.enable_admission_control", True
+        ),
+        patch(
+            "api.src.routers.openai_compatible.get_admission_controller",
+            return_value=controller,
+        ),
+    ):
+        response = client.post(
+            "/v1/audio/speech",
+            json={
+                "model": "kokoro",
+                "input": "Hello world",
+                "voice": test_voice,
+                "deadline_ms": 5000,
+            },
+            headers={"x-deadline-ms": "2000"},
+        )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+    assert response.json()["detail"]["error"] == "overloaded"
+    # The stricter of the header and field deadlines is used
+    assert controller.admit.call_args[0][2] == 2.0
+    mock_tts_service.generate_audio_stream.assert_not_called()
+
+
+def test_openai_speech_failure_releases_ticket(mock_tts_service, test_voice):
+    """Test an admitted request that fails before generating releases its ticket"""
+    controller = AdmissionController(max_completion_s=10)
+    pool = MagicMock()
+    pool.acquire.side_effect = RuntimeError("No encoder")
+
+    with (
+        patch(
+            "api.src.routers.openai_compatible.settings.enable_admission_control", True
+        ),
+        patch(
+            "api.src.routers.openai_compatible.get_admission_controller",
+            return_value=controller,
+        ),
+        patch(
+            "api.src.routers.openai_compatible.get_writer_pool", return_value=pool
+        ),
+    ):
+        response = client.post(
+            "/v1/audio/speech",
+            json={"model": "kokoro", "input": "Hello world", "voice": test_voice},
+        )
+
+    assert response.status_code == 500
+    assert controller.state()["in_flight_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_start_generation_tracks_progress_and_deadline():
+    """Test audio is reported to the ticket and slow first audio is rejected"""
+
+    async def chunks(delay):
+        await asyncio.sleep(delay)
+        yield AudioChunk(np.zeros(24000, np.int16), output=b"chunk")
 
-    mock_tts_service.generate_audio.assert_called_once()
-    assert mock_convert.call_count == 2
+    controller = AdmissionController(max_completion_s=10)
+    ticket = controller.admit("x" * 30)
+    generated = await start_generation(chunks(0), ticket, 24000, 1.0)
+    assert [c.output async for c in generated] == [b"chunk"]
+    assert ticket.released
+    assert ticket.remaining == pytest.approx(1.0)
+
+    ticket = controller.admit("x" * 30)
+    with pytest.raises(AdmissionRejected):
+        await start_generation(chunks(1.0), ticket, 24000, 0.01)
+    assert ticket.released
+    assert controller.state()["in_flight_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_await_first_closes_generation_with_consumer():
+    """Test closing the response stops the generation behind its first chunk"""
+    closed = []
+
+    async def chunks():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    generator = await await_first(chunks(), 1.0)
+    assert await generator.__anext__() == 1
+    await generator.aclose()
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_deadline_applies_per_request(monkeypatch):
+    """Test a request missing its deadline leaves a generation others still follow"""
+    monkeypatch.setattr(settings, "disconnect_poll_interval_s", 0.01)
+    mock_request = MagicMock()
+    mock_request.is_disconnected = AsyncMock(return_value=False)
+    finish = asyncio.Event()
+
+    async def source():
+        await finish.wait()
+        yield b"a"
+
+    cancel = CancellationToken()
+    flight, _ = Coalescer().start("key", source(), cancel)
+    follower = asyncio.create_task(join_flight(flight, mock_request))
+    await asyncio.sleep(0)
+
+    request = OpenAISpeechRequest(
+        model="kokoro", input="Test text", voice="test_voice", stream=False
+    )
+    with pytest.raises(AdmissionRejected):
+        await coalesced_response(
+            flight, request, mock_request, "audio/mpeg", "joined", 0.01
+        )
+    assert not cancel.cancelled
+
+    finish.set()
+    assert await follower == b"a"
 
 
 def test_openai_speech_streaming(mock_tts_service, test_voice, mock_audio_bytes):
@@ -357,8 +678,9 @@ def test_openai_speech_empty_text(mock_tts_service, test_voice):
 
     async def mock_error_stream(*args, **kwargs):
         raise ValueError("Text is empty after preprocessing")
+        yield
 
-    mock_tts_service.generate_audio = mock_error_stream
+    mock_tts_service.generate_audio_stream = mock_error_stream
     mock_tts_service.list_voices.return_value = ["test_voice"]
 
     response = client.post(
@@ -424,8 +746,9 @@ def test_server_error(mock_tts_service, test_voice):
 
     async def mock_error_stream(*args, **kwargs):
         raise RuntimeError("Internal server error")
+        yield
 
-    mock_tts_service.generate_audio = mock_error_stream
+    mock_tts_service.generate_audio_stream = mock_error_stream
     mock_tts_service.list_voices.return_value = ["test_voice"]
 
     response = client.post(
@@ -0,0 +1,61 @@
+"""Tests for the speech response cache"""
+
+import pytest
+
+from api.src.services.response_cache import ResponseCache
+
+
+def test_make_key_is_order_independent_and_sensitive():
+    """Test keys depend on field values, not argument order."""
+    key = ResponseCache.make_key
+    assert key(input="Hi", voice="af_heart", speed=1.0) == key(
+        speed=1.0, voice="af_heart", input="Hi"
+    )
+    assert key(input="Hi", voice="af_heart", speed=1.0) != key(
+        input="Hi", voice="af_heart", speed=1.5
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_lru_by_bytes():
+    """Test the memory tier evicts least recently used entries by size."""
+    cache = ResponseCache(memory_bytes=10)
+
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    # Touch a so b becomes least recently used
+    assert await cache.get("a") == (b"aaaa", "memory")
+    await cache.put("c", b"cccc")
+
+    assert await cache.get("b") == (None, None)
+    assert await cache.get("a") == (b"aaaa", "memory")
+    info = cache.cache_info()
+    assert info["memory_bytes"] == 8
+    assert info["hits"] == 2
+    assert info["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    """Test responses are served from disk and promoted to memory."""
+    await ResponseCache(memory_bytes=0, disk_dir=str(tmp_path), disk_bytes=100).put(
+        "key", b"audio"
+    )
+
+    cache = ResponseCache(memory_bytes=100, disk_dir=str(tmp_path), disk_bytes=100)
+    assert await cache.get("key") == (b"audio", "disk")
+    assert await cache.get("key") == (b"audio", "memory")
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_size_cap(tmp_path):
+    """Test the disk tier evicts the oldest files past its size cap."""
+    cache = ResponseCache(memory_bytes=0, disk_dir=str(tmp_path), disk_bytes=10)
+
+    await cache.put("a", b"aaaa")
+    await cache.put("b", b"bbbb")
+    await cache.put("c", b"cccc")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.bin", "c.bin"]
+    assert cache.cache_info()["disk_bytes"] == 8
+    assert await cache.get("a") == (None, None)
@@ -0,0 +1,121 @@
+"""Tests for resumable streams"""
+
+import asyncio
+import os
+
+import pytest
+
+from api.src.inference.cancellation import CancellationToken
+from api.src.services.resumable_streams import ResumableStreams, StreamExpired
+
+
+async def _source(chunks, gate=None):
+    for chunk in chunks:
+        if gate is not None:
+            await gate.get()
+        yield chunk
+
+
+async def _collect(generator):
+    return b"".join([chunk async for chunk in generator])
+
+
+async def _settle():
+    """Let the stream's generation task catch up."""
+    for _ in range(5):
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_resume_from_offset_then_follow_live():
+    """Test a reconnecting client gets the output from its offset onwards."""
+    streams = ResumableStreams(grace_s=10)
+    gate = asyncio.Queue()
+    stream = streams.start(_source([b"abc", b"def", b"ghi"], gate), None, "audio/mpeg")
+
+    first = stream.read()
+    gate.put_nowait(None)
+    assert await first.__anext__() == b"abc"
+    # The client drops after two bytes reached it
+    await first.aclose()
+    assert stream.readers == 0
+
+    resumed = streams.get(stream.id)
+    assert resumed is stream
+    reader = asyncio.create_task(_collect(resumed.read(2)))
+    gate.put_nowait(None)
+    gate.put_nowait(None)
+    assert await reader == b"cdefghi"
+    assert streams.stats()["resumed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_old_output_spills_to_disk(tmp_path):
+    """Test output beyond the memory window is read back from the spill file."""
+    streams = ResumableStreams(
+        grace_s=10, memory_bytes=4, disk_dir=str(tmp_path), disk_bytes=1024
+    )
+    chunks = [bytes([65 + i]) * 3 for i in range(5)]
+    stream = streams.start(_source(chunks), None, "audio/wav")
+    assert await _collect(stream.read()) == b"".join(chunks)
+
+    stats = streams.stats()
+    assert stats["memory_bytes"] == 3
+    assert stats["disk_bytes"] == 12
+    assert os.path.getsize(tmp_path / f"{stream.id}.stream") == 12
+    assert await _collect(stream.read(4)) == b"".join(chunks)[4:]
+
+
+@pytest.mark.asyncio
+async def test_output_outside_the_buffer_expires(tmp_path):
+    """Test offsets before the kept output are refused once it is dropped."""
+    streams = ResumableStreams(
+        grace_s=10, memory_bytes=4, disk_dir=str(tmp_path), disk_bytes=6
+    )
+    stream = streams.start(_source([b"aaa", b"bbb", b"ccc", b"ddd"]), None, "audio/wav")
+    assert await _collect(stream.read()) == b"aaabbbcccddd"
+
+    # The third chunk didn't fit in the spill file, so everything before the
+    # memory window was dropped
+    assert stream.available_from == 9
+    assert not os.listdir(tmp_path)
+    with pytest.raises(StreamExpired):
+        stream.read(0)
+    with pytest.raises(StreamExpired):
+        stream.read(13)
+    assert await _collect(stream.read(10)) == b"dd"
+
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_is_cancelled_after_grace():
+    """Test generation stops once nobody resumes within the grace period."""
+    streams = ResumableStreams(grace_s=0.01)
+    cancel = CancellationToken()
+    gate = asyncio.Queue()
+    stream = streams.start(_source([b"a", b"b"], gate), cancel, "audio/mpeg")
+
+    reader = stream.read()
+    gate.put_nowait(None)
+    assert await reader.__anext__() == b"a"
+    await reader.aclose()
+    await asyncio.sleep(0.05)
+    assert cancel.reason == "abandoned"
+    assert stream.done
+    assert streams.get(stream.id) is None
+    assert streams.stats()["expired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reader_keeps_stream_alive():
+    """Test a stream is kept while read, and for the grace period after."""
+    streams = ResumableStreams(grace_s=0.02)
+    stream = streams.start(_source([b"a"]), None, "audio/mpeg")
+    reader = stream.read()
+    await asyncio.sleep(0.05)
+    assert streams.get(stream.id) is stream
+
+    assert await _collect(reader) == b"a"
+    await _settle()
+    assert streams.get(stream.id) is stream
+    await asyncio.sleep(0.05)
+    assert streams.get(stream.id) is None
@@ -0,0 +1,74 @@
+"""Tests for the sentence-level audio cache"""
+
+import numpy as np
+import pytest
+import torch
+
+from api.src.services.sentence_cache import SentenceCache, voice_digest
+
+
+def _key(tokens, text="Hello."):
+    return SentenceCache.make_key(tokens, "voice", 1.0, "a", 1.0, text)
+
+
+def test_make_key_uses_trailing_punctuation():
+    """Test keys depend on tokens and on the character that sets trim padding."""
+    assert _key([1, 2]) == _key([1, 2], "Other words.")
+    assert _key([1, 2]) != _key([1, 2], "Hello?")
+    assert _key([1, 2]) != _key([1, 3])
+
+
+def test_voice_digest_depends_on_contents():
+    """Test equal voice tensors share a digest."""
+    assert voice_digest(torch.ones(4)) == voice_digest(torch.ones(4))
+    assert voice_digest(torch.ones(4)) != voice_digest(torch.zeros(4))
+
+
+@pytest.mark.asyncio
+async def test_memory_lru_by_bytes():
+    """Test least recently used chunks are evicted once over budget."""
+    piece = np.ones(4, dtype=np.int16)  # 8 bytes
+    cache = SentenceCache(memory_bytes=20)
+
+    await cache.put("a", [piece])
+    await cache.put("b", [piece])
+    assert await cache.get("a") is not None
+    await cache.put("c", [piece])
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+    info = cache.cache_info()
+    assert info["memory_bytes"] == 16
+    assert info["hits"] == 2
+    assert info["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_pieces_are_frozen_copies():
+    """Test stored audio can't be changed through the caller's or a hit's array."""
+    audio = np.arange(8, dtype=np.int16)
+    cache = SentenceCache(memory_bytes=1024)
+
+    await cache.put("a", [audio[2:6]])
+    audio[:] = 0
+
+    (piece,) = await cache.get("a")
+    assert piece.tolist() == [2, 3, 4, 5]
+    with pytest.raises(ValueError):
+        piece[0] = 1
+
+
+@pytest.mark.asyncio
+async def test_evicted_chunks_spill_to_disk(tmp_path):
+    """Test evicted chunks are reloaded from disk and promoted to memory."""
+    cache = SentenceCache(memory_bytes=10, disk_dir=str(tmp_path), disk_bytes=1024)
+
+    await cache.put("a", [np.full(4, 1, np.int16)])
+    await cache.put("b", [np.full(4, 2, np.int16)])
+    assert [p.name for p in tmp_path.iterdir()] == ["a.npz"]
+
+    (piece,) = await cache.get("a")
+    assert piece.tolist() == [1, 1, 1, 1]
+    # Promoting a pushed b out to disk in turn
+    assert [p.name for p in tmp_path.iterdir()] == ["b.npz"]
+    assert cache.cache_info()["disk_entries"] == 1
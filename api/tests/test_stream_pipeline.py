@@ -0,0 +1,98 @@
+"""Tests for the streaming pipeline lookahead"""
+
+import asyncio
+
+import pytest
+
+from api.src.services.chunk_scheduler import ChunkScheduler
+from api.src.services.stream_pipeline import lookahead
+
+
+async def _numbers(n, produced=None):
+    for i in range(n):
+        if produced is not None:
+            produced.append(i)
+        yield i
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_lookahead_preserves_order():
+    """Test items pass through chained stages in order."""
+
+    async def double(source):
+        async for item in source:
+            yield item * 2
+
+    stage = lookahead(double(lookahead(_numbers(10), 2)), 2)
+    assert [item async for item in stage] == [i * 2 for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_lookahead_runs_ahead_up_to_depth():
+    """Test the producer works ahead of a slow consumer, but only up to depth."""
+    produced = []
+    stage = lookahead(_numbers(20, produced), 3)
+
+    first = await stage.__anext__()
+    assert first == 0
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # One item consumed, three buffered, one blocked on the full queue
+    assert len(produced) == 5
+    await stage.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lookahead_propagates_errors():
+    """Test an exception in a stage reaches the consumer after earlier items."""
+
+    async def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    results = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for item in lookahead(failing(), 2):
+            results.append(item)
+    assert results == [1]
+
+
+@pytest.mark.asyncio
+async def test_lookahead_close_stops_producer():
+    """Test closing the consumer cancels the producing stage."""
+    closed = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield 1
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    stage = lookahead(endless(), 2)
+    await stage.__anext__()
+    await stage.aclose()
+    await asyncio.wait_for(closed.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_lookahead_close_releases_source_slot():
+    """Test a slot held by the producing stage is free right after an early close."""
+    scheduler = ChunkScheduler(slots=1, weights={"batch": 1.0}, underrun_margin_s=0)
+    stream = scheduler.open_stream("batch", playback=False)
+
+    async def synthesize():
+        while True:
+            async with scheduler.slot(stream):
+                yield b"audio"
+
+    stage = lookahead(synthesize(), 1)
+    assert await stage.__anext__() == b"audio"
+    await asyncio.sleep(0)
+    assert scheduler.stats()["busy_slots"] == 1
+
+    await stage.aclose()
+    assert scheduler.stats()["busy_slots"] == 0
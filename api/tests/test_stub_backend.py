@@ -0,0 +1,107 @@
+"""Tests for the synthetic stub model backend"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from api.src.inference.model_manager import ModelManager
+from api.src.inference.stub_backend import (
+    EDGE_SILENCE_SAMPLES,
+    SAMPLES_PER_PHONEME,
+    StubBackend,
+)
+
+
+@pytest_asyncio.fixture
+async def stub_backend():
+    """Create a loaded StubBackend."""
+    backend = StubBackend()
+    await backend.load_model("unused.pth")
+    return backend
+
+
+async def _generate(backend, text, speed=1.0, return_timestamps=False):
+    return [
+        chunk
+        async for chunk in backend.generate(
+            text, ("af_heart", None), speed=speed, return_timestamps=return_timestamps
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_requires_load():
+    """Test generating before load_model raises."""
+    with pytest.raises(RuntimeError, match="Model not loaded"):
+        await _generate(StubBackend(), "Hello world.")
+
+
+@pytest.mark.asyncio
+async def test_length_follows_phonemes_and_speed(stub_backend):
+    """Test audio length scales with phoneme count and inversely with speed."""
+    (chunk,) = await _generate(stub_backend, "Hello world.")
+    assert len(chunk.audio) == 10 * SAMPLES_PER_PHONEME + 2 * EDGE_SILENCE_SAMPLES
+
+    (fast,) = await _generate(stub_backend, "Hello world.", speed=2.0)
+    assert len(fast.audio) == 5 * SAMPLES_PER_PHONEME + 2 * EDGE_SILENCE_SAMPLES
+
+    audio = [a async for a in stub_backend.generate_from_tokens("həlˈO", "af_heart")]
+    assert len(audio[0]) == 5 * SAMPLES_PER_PHONEME + 2 * EDGE_SILENCE_SAMPLES
+
+
+@pytest.mark.asyncio
+async def test_output_is_deterministic(stub_backend):
+    """Test equal requests give identical audio, and voices differ."""
+    (first,) = await _generate(stub_backend, "Hello world.")
+    (second,) = await _generate(stub_backend, "Hello world.")
+    other = [
+        chunk async for chunk in stub_backend.generate("Hello world.", ("am_adam", None))
+    ]
+
+    np.testing.assert_array_equal(first.audio, second.audio)
+    assert not np.array_equal(first.audio, other[0].audio)
+    assert first.audio.dtype == np.float32
+    assert not first.audio[:EDGE_SILENCE_SAMPLES].any()
+
+
+@pytest.mark.asyncio
+async def test_word_timestamps(stub_backend):
+    """Test timestamps cover each word in order."""
+    (chunk,) = await _generate(stub_backend, "Hello big world.", return_timestamps=True)
+
+    assert [ts.word for ts in chunk.word_timestamps] == ["Hello", "big", "world."]
+    assert chunk.word_timestamps[0].start_time == EDGE_SILENCE_SAMPLES / 24000
+    for earlier, later in zip(chunk.word_timestamps, chunk.word_timestamps[1:]):
+        assert earlier.start_time < earlier.end_time <= later.start_time
+    assert chunk.word_timestamps[-1].end_time <= len(chunk.audio) / 24000
+
+
+def test_busy_delay_per_phoneme():
+    """Test the configured delay is spent for every phoneme."""
+    with patch("api.src.inference.stub_backend.settings") as mock_settings, patch(
+        "api.src.inference.stub_backend.time.perf_counter",
+        side_effect=[0.0, 0.0, 0.05, 0.1],
+    ) as mock_clock:
+        mock_settings.stub_token_delay_ms = 10.0
+        mock_settings.stub_delay_mode = "busy"
+        StubBackend._spend(10)
+
+    # Spun until 10 phonemes x 10ms had passed
+    assert mock_clock.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_model_manager_selects_stub():
+    """Test the model_backend setting picks the stub backend."""
+    with patch("api.src.inference.model_manager.settings") as mock_settings:
+        mock_settings.model_backend = "stub"
+        manager = ModelManager()
+        await manager.initialize()
+        assert isinstance(manager.get_backend(), StubBackend)
+        assert manager.current_backend == "stub"
+
+        mock_settings.model_backend = "nonexistent"
+        with pytest.raises(RuntimeError, match="Unknown model backend"):
+            await manager.initialize()
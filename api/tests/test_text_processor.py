@@ -1,10 +1,16 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from api.src.services.text_processing import phonemizer, text_processor
+from api.src.services.text_processing.phonemizer import phoneme_cache_info, phonemize
 from api.src.services.text_processing.text_processor import (
+    SPACE_TOKEN,
     get_sentence_info,
     process_text_chunk,
     smart_split,
 )
+from api.src.services.text_processing.vocabulary import tokenize
 
 
 def test_process_text_chunk_basic():
@@ -230,4 +236,116 @@ async def test_smart_split_with_two_pause():
     # Third chunk: text
     assert chunks[2][2] is None  # No pause
     assert "zero point five" in chunks[2][0]
-    assert len(chunks[2][1]) > 0
\ No newline at end of file
+    assert len(chunks[2][1]) > 0
+
+
+@pytest.fixture
+def counting_phonemizer():
+    """Replace the espeak backend with one that counts calls."""
+    backend = MagicMock()
+    backend.phonemize.side_effect = lambda text: f"ph({text})"
+    phonemizer.clear_phoneme_cache()
+    with patch.dict(phonemizer.phonemizers, {"a": backend}):
+        yield backend
+    phonemizer.clear_phoneme_cache()
+
+
+def test_phonemize_cache_skips_repeat_text(counting_phonemizer):
+    """Test repeated text is served from the phoneme cache."""
+    assert phonemize("Press one for sales.") == "ph(Press one for sales.)"
+    assert phonemize("  Press one for sales. ") == "ph(Press one for sales.)"
+    assert counting_phonemizer.phonemize.call_count == 1
+    info = phoneme_cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+
+
+def test_phonemize_cache_is_bounded(counting_phonemizer):
+    """Test the phoneme cache evicts least recently used entries."""
+    with patch(
+        "api.src.services.text_processing.phonemizer.settings.phoneme_cache_size", 2
+    ):
+        phonemize("one")
+        phonemize("two")
+        phonemize("one")
+        phonemize("three")
+        assert phoneme_cache_info()["size"] == 2
+        # "two" was least recently used and must be phonemized again
+        phonemize("two")
+    assert counting_phonemizer.phonemize.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_smart_split_repeated_sentences_phonemized_once(counting_phonemizer):
+    """Test boilerplate repeated within a request hits espeak once."""
+    text = "Thanks for calling. " * 5
+    chunks = [chunk async for chunk in smart_split(text)]
+    assert chunks
+    assert counting_phonemizer.phonemize.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_smart_split_separates_sentence_tokens(counting_phonemizer):
+    """Test sentences joined into one chunk keep a word boundary token."""
+    chunks = [chunk async for chunk in smart_split("First one. Second one.")]
+
+    assert len(chunks) == 1
+    _, tokens, _ = chunks[0]
+    first = tokenize("ph(First one.)")
+    second = tokenize("ph(Second one.)")
+    assert tokens == first + [SPACE_TOKEN] + second
+
+
+_DOCUMENT = (
+    "Dr. Smith arrived at 5 p.m. and paid $12.50 for the tickets. "
+    "The U.S. team won! Did J. Tolkien write it, etc. or not? "
+    "Call (555) 123-4567 today; the meeting is at 10:30. "
+    "This is a longer sentence with many words, some commas, and a few clauses "
+    "that keep going so the chunker has to pack several of them together. "
+)
+
+
+@pytest.mark.asyncio
+async def test_smart_split_windowed_matches_whole_text(counting_phonemizer):
+    """Test windowed normalization packs exactly like whole-text normalization."""
+    text = _DOCUMENT * 20 + "[pause:1s] " + _DOCUMENT * 5
+
+    async def split(window):
+        with patch(
+            "api.src.services.text_processing.text_processor.settings.smart_split_window_chars",
+            window,
+        ):
+            return [chunk async for chunk in smart_split(text)]
+
+    assert await split(200) == await split(0)
+
+
+@pytest.mark.parametrize("size_kb", [1, 10, 100, 1000])
+@pytest.mark.asyncio
+async def test_smart_split_time_to_first_chunk_is_flat(counting_phonemizer, size_kb):
+    """Test work before the first chunk does not grow with document size."""
+    text = (_DOCUMENT * (size_kb * 1024 // len(_DOCUMENT) + 1))[: size_kb * 1024]
+    normalized_chars = []
+    sentences = []
+    original_normalize = text_processor.normalize_text
+    original_process = text_processor.process_text_chunk
+
+    def recording_normalize(part, options):
+        normalized_chars.append(len(part))
+        return original_normalize(part, options)
+
+    def recording_process(part, *args, **kwargs):
+        sentences.append(part)
+        return original_process(part, *args, **kwargs)
+
+    with (
+        patch.object(text_processor, "normalize_text", recording_normalize),
+        patch.object(text_processor, "process_text_chunk", recording_process),
+    ):
+        stream = smart_split(text)
+        await stream.__anext__()
+        await stream.aclose()
+
+    window = text_processor.settings.smart_split_window_chars
+    assert sum(normalized_chars) <= 2 * window + len(_DOCUMENT)
+    assert len(sentences) <= 40
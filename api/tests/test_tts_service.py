@@ -61,11 +61,13 @@ async def test_service_creation():
 
 
 @pytest.mark.asyncio
-async def test_get_voice_path_single():
-    """Test getting path for single voice."""
+async def test_get_voice_single():
+    """Test getting tensor for single voice."""
     model_manager = AsyncMock()
+    model_manager.get_backend = MagicMock(return_value=MagicMock(device="cpu"))
     voice_manager = AsyncMock()
-    voice_manager.get_voice_path.return_value = "/path/to/voice1.pt"
+    voice_tensor = torch.ones(10)
+    voice_manager.load_voice.return_value = voice_tensor
 
     with (
         patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
@@ -75,39 +77,38 @@ async def test_get_voice_path_single():
         mock_get_voice.return_value = voice_manager
 
         service = await TTSService.create("test_output")
-        name, path = await service._get_voices_path("voice1")
+        name, tensor = await service._get_voice("voice1")
         assert name == "voice1"
-        assert path == "/path/to/voice1.pt"
-        voice_manager.get_voice_path.assert_called_once_with("voice1")
+        assert tensor is voice_tensor
+        voice_manager.load_voice.assert_called_once_with("voice1", device="cpu")
+        voice_manager.blend_voices.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_get_voice_path_combined():
-    """Test getting path for combined voices."""
+async def test_get_voice_combined():
+    """Test getting tensor for combined voices."""
     model_manager = AsyncMock()
+    model_manager.get_backend = MagicMock(return_value=MagicMock(device="cpu"))
     voice_manager = AsyncMock()
-    voice_manager.get_voice_path.return_value = "/path/to/voice.pt"
+    voice_manager.blend_voices.return_value = torch.ones(10)
 
     with (
         patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
         patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
-        patch("torch.load") as mock_load,
         patch("torch.save") as mock_save,
-        patch("tempfile.gettempdir") as mock_temp,
     ):
         mock_get_model.return_value = model_manager
         mock_get_voice.return_value = voice_manager
-        mock_temp.return_value = "/tmp"
-        mock_load.return_value = torch.ones(10)
 
         service = await TTSService.create("test_output")
-        name, path = await service._get_voices_path("voice1+voice2")
-        assert name == "voice1+voice2"
-        # Verify the path points to a temporary file with expected format
-        assert path.startswith("/tmp/")
-        assert "voice1+voice2" in path
-        assert path.endswith(".pt")
-        mock_save.assert_called_once()
+        name, tensor = await service._get_voice("voice1(2)+voice2-voice3(0.5)")
+        assert name == "voice1(2)+voice2-voice3(0.5)"
+        assert torch.equal(tensor, torch.ones(10))
+        voice_manager.blend_voices.assert_called_once()
+        components = voice_manager.blend_voices.call_args[0][0]
+        assert components == [("voice1", 2.0), ("voice2", 1.0), ("voice3", -0.5)]
+        # Blends stay in memory, no shared temp file is written
+        mock_save.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -128,3 +129,155 @@ async def test_list_voices():
         voices = await service.list_voices()
         assert voices == ["voice1", "voice2"]
         voice_manager.list_voices.assert_called_once()
+
+
+def test_use_phoneme_path():
+    """Test which chunks may skip KPipeline's G2P."""
+    use = TTSService._use_phoneme_path
+    with patch(
+        "api.src.services.tts_service.settings.phoneme_native_generation", True
+    ):
+        assert use("Hello.", [1, 2, 3], "a", False)
+        # Timestamps and non-English chunks need KPipeline's own G2P
+        assert not use("Hello.", [1, 2, 3], "a", True)
+        assert not use("Hola.", [1, 2, 3], "e", False)
+        # Custom phoneme markup and over-long chunks fall back to text
+        assert not use("[Kokoro](/kˈOkəɹO/)", [1, 2, 3], "a", False)
+        assert not use("Hello.", [1] * 511, "a", False)
+        assert not use("Hello.", [], "a", False)
+    with patch(
+        "api.src.services.tts_service.settings.phoneme_native_generation", False
+    ):
+        assert not use("Hello.", [1, 2, 3], "a", False)
+
+
+@pytest.mark.asyncio
+async def test_generate_chunk_audio_uses_smart_split_tokens():
+    """Test phoneme-native chunks go through generate_from_tokens."""
+    from api.src.inference.base import AudioChunk
+    from api.src.inference.kokoro_v1 import KokoroV1
+    from api.src.services.text_processing.vocabulary import tokenize
+
+    async def fake_generate_from_tokens(*args, **kwargs):
+        yield AudioChunk(np.ones(10, dtype=np.float32))
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1)
+    model_manager.generate_from_tokens = MagicMock(
+        side_effect=fake_generate_from_tokens
+    )
+    voice_manager = AsyncMock()
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch(
+            "api.src.services.tts_service.settings.phoneme_native_generation", True
+        ),
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        service = await TTSService.create("test_output")
+
+        tokens = tokenize("həlˈoʊ")
+        chunks = [
+            chunk
+            async for chunk in service._generate_chunk_audio(
+                "Hello", tokens, "af_heart", torch.ones(10), 1.0, lang_code="a"
+            )
+        ]
+
+    assert len(chunks) == 1
+    model_manager.generate.assert_not_called()
+    assert model_manager.generate_from_tokens.call_args[0][0] == "həlˈoʊ"
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_stream_pipeline_keeps_order():
+    """Test staged streaming yields text and pause chunks in input order."""
+    from api.src.inference.base import AudioChunk
+    from api.src.inference.kokoro_v1 import KokoroV1
+
+    async def fake_split(*args, **kwargs):
+        yield "One.", [1], None
+        yield "", [], 0.5
+        yield "Two.", [2], None
+
+    async def fake_generate(text, *args, **kwargs):
+        # Distinguishable loud chunks that survive trimming
+        value = 0.5 if text == "One." else -0.5
+        yield AudioChunk(np.full(24000, value, dtype=np.float32))
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1, device="cpu")
+    model_manager.generate = MagicMock(side_effect=fake_generate)
+    voice_manager = AsyncMock()
+    voice_manager.load_voice.return_value = torch.ones(10)
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch("api.src.services.tts_service.smart_split", new=fake_split),
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        service = await TTSService.create("test_output")
+
+        chunks = [
+            chunk
+            async for chunk in service.generate_audio_stream(
+                "One. [pause:0.5s] Two.", "af_heart", None, output_format=None
+            )
+        ]
+
+    assert len(chunks) == 3
+    assert chunks[0].audio.max() > 0
+    assert not chunks[1].audio.any()
+    assert len(chunks[1].audio) == 12000
+    assert chunks[2].audio.min() < 0
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_stream_reuses_cached_sentences():
+    """Test chunks synthesized for one request are replayed for the next."""
+    from api.src.inference.base import AudioChunk
+    from api.src.inference.kokoro_v1 import KokoroV1
+    from api.src.services.sentence_cache import SentenceCache
+
+    async def fake_split(*args, **kwargs):
+        yield "One.", [1], None
+
+    async def fake_generate(*args, **kwargs):
+        yield AudioChunk(np.full(24000, 0.5, dtype=np.float32))
+
+    model_manager = MagicMock()
+    model_manager.get_backend.return_value = MagicMock(spec=KokoroV1, device="cpu")
+    model_manager.generate = MagicMock(side_effect=fake_generate)
+    voice_manager = AsyncMock()
+    voice_manager.load_voice.return_value = torch.ones(10)
+    cache = SentenceCache(memory_bytes=1 << 20)
+
+    with (
+        patch("api.src.services.tts_service.get_model_manager") as mock_get_model,
+        patch("api.src.services.tts_service.get_voice_manager") as mock_get_voice,
+        patch("api.src.services.tts_service.smart_split", new=fake_split),
+        patch("api.src.services.tts_service.get_sentence_cache", return_value=cache),
+    ):
+        mock_get_model.return_value = model_manager
+        mock_get_voice.return_value = voice_manager
+        service = await TTSService.create("test_output")
+
+        runs = []
+        for _ in range(2):
+            runs.append(
+                [
+                    chunk
+                    async for chunk in service.generate_audio_stream(
+                        "One.", "af_heart", None, output_format=None
+                    )
+                ]
+            )
+
+    assert model_manager.generate.call_count == 1
+    assert np.array_equal(runs[0][0].audio, runs[1][0].audio)
+    assert cache.cache_info()["hits"] == 1
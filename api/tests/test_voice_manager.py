@@ -0,0 +1,159 @@
+"""Tests for VoiceManager caching"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import torch
+
+from api.src.core.model_config import ModelConfig
+from api.src.inference.voice_manager import VoiceManager
+
+
+@pytest.fixture
+def mock_load_voice_tensor():
+    """Mock voice tensor loading from disk."""
+
+    async def _load(path, device="cpu"):
+        return torch.full((1,), float(len(path)))
+
+    with patch(
+        "api.src.inference.voice_manager.paths.load_voice_tensor",
+        new=AsyncMock(side_effect=_load),
+    ) as mock_load:
+        yield mock_load
+
+
+@pytest.mark.asyncio
+async def test_repeat_loads_hit_cache(mock_load_voice_tensor):
+    """Test repeat loads of the same voice are served from memory."""
+    manager = VoiceManager(ModelConfig(voice_cache_size=2))
+
+    first = await manager.load_voice_from_path("/voices/af_bella.pt")
+    second = await manager.load_voice_from_path("/voices/af_bella.pt")
+
+    assert first is second
+    assert mock_load_voice_tensor.await_count == 1
+    info = manager.cache_info()
+    assert info["hits"] == 1
+    assert info["misses"] == 1
+    assert info["loaded_voices"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(mock_load_voice_tensor):
+    """Test least recently used voices are evicted at capacity."""
+    manager = VoiceManager(ModelConfig(voice_cache_size=2))
+
+    await manager.load_voice_from_path("/voices/a.pt")
+    await manager.load_voice_from_path("/voices/b.pt")
+    # Touch a so b becomes least recently used
+    await manager.load_voice_from_path("/voices/a.pt")
+    await manager.load_voice_from_path("/voices/c.pt")
+
+    assert manager.cache_info()["loaded_voices"] == 2
+    await manager.load_voice_from_path("/voices/a.pt")
+    assert mock_load_voice_tensor.await_count == 3
+
+    # b was evicted and must be reloaded
+    await manager.load_voice_from_path("/voices/b.pt")
+    assert mock_load_voice_tensor.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled(mock_load_voice_tensor):
+    """Test cache_voices=False always loads from disk."""
+    manager = VoiceManager(ModelConfig(cache_voices=False))
+
+    await manager.load_voice_from_path("/voices/a.pt")
+    await manager.load_voice_from_path("/voices/a.pt")
+
+    assert mock_load_voice_tensor.await_count == 2
+    assert manager.cache_info()["loaded_voices"] == 0
+
+
+@pytest.mark.asyncio
+async def test_load_voice_resolves_name(mock_load_voice_tensor):
+    """Test load_voice resolves the voice path and uses the cache."""
+    manager = VoiceManager(ModelConfig())
+
+    with patch.object(
+        manager, "get_voice_path", new=AsyncMock(return_value="/voices/af_heart.pt")
+    ):
+        await manager.load_voice("af_heart")
+        await manager.load_voice("af_heart")
+
+    assert mock_load_voice_tensor.await_count == 1
+
+
+def test_canonical_blend_key_equivalence():
+    """Test equivalent blend expressions share a canonical key."""
+    key = VoiceManager.canonical_blend_key
+    assert key([("a", 2), ("b", 1)]) == key([("b", 2), ("a", 4)])
+    assert key([("a", 2), ("b", 1)]) != key([("a", 2), ("b", -1)])
+    # Without normalization the absolute weights matter
+    assert key([("a", 2), ("b", 1)], normalize=False) != key(
+        [("a", 4), ("b", 2)], normalize=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_blend_voices_memoized(mock_load_voice_tensor):
+    """Test repeat blends are served from memory."""
+    manager = VoiceManager(ModelConfig())
+
+    with patch.object(
+        manager,
+        "get_voice_path",
+        new=AsyncMock(side_effect=lambda name: f"/voices/{name}.pt"),
+    ):
+        first = await manager.blend_voices([("a", 2.0), ("bb", 1.0)])
+        second = await manager.blend_voices([("bb", 1.0), ("a", 2.0)])
+
+    assert first is second
+    # Tensors are filled with len(path): a -> 12, bb -> 13
+    assert torch.allclose(first, torch.tensor([12 * 2 / 3 + 13 / 3]))
+    info = manager.cache_info()
+    assert info["blend_hits"] == 1
+    assert info["blend_misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_blend_voices_does_not_mutate_cached_voices(mock_load_voice_tensor):
+    """Test blending leaves the cached component tensors untouched."""
+    manager = VoiceManager(ModelConfig())
+
+    with patch.object(
+        manager,
+        "get_voice_path",
+        new=AsyncMock(side_effect=lambda name: f"/voices/{name}.pt"),
+    ):
+        original = (await manager.load_voice("a")).clone()
+        await manager.blend_voices([("a", 1.0), ("bb", -1.0)], normalize=False)
+        assert torch.equal(await manager.load_voice("a"), original)
+
+
+@pytest.mark.asyncio
+async def test_blend_voices_persisted_store(mock_load_voice_tensor, tmp_path):
+    """Test blends are persisted to and reloaded from the content-addressed store."""
+    manager = VoiceManager(ModelConfig())
+
+    with (
+        patch(
+            "api.src.inference.voice_manager.settings.voice_blend_cache_dir",
+            str(tmp_path),
+        ),
+        patch(
+            "api.src.inference.voice_manager.paths.save_voice_tensor",
+            new=AsyncMock(side_effect=lambda t, p: torch.save(t, p)),
+        ),
+        patch.object(
+            manager,
+            "get_voice_path",
+            new=AsyncMock(side_effect=lambda name: f"/voices/{name}.pt"),
+        ),
+    ):
+        await manager.blend_voices([("a", 1.0), ("bb", 1.0)])
+
+    stored = list(tmp_path.glob("*.pt"))
+    assert len(stored) == 1
+    assert len(stored[0].stem) == 64  # sha256 hex digest
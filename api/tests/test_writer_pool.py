@@ -0,0 +1,58 @@
+"""Tests for the pre-opened audio writer pool"""
+
+from unittest.mock import patch
+
+import pytest
+
+from api.src.services.writer_pool import WriterPool
+
+
+@pytest.fixture
+def writer_pool():
+    pool = WriterPool(spares=2)
+    yield pool
+    pool.shutdown()
+
+
+def _drain_refills(pool):
+    """Wait for queued background refills to finish."""
+    pool._pool.submit(lambda: None).result()
+
+
+def test_acquire_uses_spares_after_warm(writer_pool):
+    """Test warmed formats are served from spares and refilled."""
+    writer_pool.warm(["mp3"], 24000)
+    _drain_refills(writer_pool)
+    assert writer_pool.stats()["ready"] == {"mp3/24000/1": 2}
+
+    first = writer_pool.acquire("mp3", 24000)
+    _drain_refills(writer_pool)
+    second = writer_pool.acquire("MP3", 24000)
+
+    assert first is not second
+    stats = writer_pool.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 0
+    first.close()
+    second.close()
+
+
+def test_acquire_miss_opens_writer_and_refills(writer_pool):
+    """Test a cold format opens a writer inline, then gets spares."""
+    writer = writer_pool.acquire("wav", 48000)
+    _drain_refills(writer_pool)
+
+    assert writer.format == "wav"
+    assert writer_pool.stats()["misses"] == 1
+    assert writer_pool.stats()["ready"]["wav/48000/1"] == 2
+    writer.close()
+
+
+def test_pcm_and_invalid_formats_are_not_pooled(writer_pool):
+    """Test PCM writers skip the pool and bad formats still raise."""
+    writer = writer_pool.acquire("pcm", 24000)
+    assert writer.format == "pcm"
+    assert writer_pool.stats()["ready"] == {}
+
+    with pytest.raises(ValueError, match="Unsupported format"):
+        writer_pool.acquire("invalid", 24000)
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""In-process micro-benchmarks for each stage of the synthesis pipeline.
+
+The other benchmarks here drive a live server end to end. This one runs each
+stage directly on a fixed corpus, so a regression can be pinned to a stage.
+Results are compared against a saved baseline JSON.
+
+Run from the repository root:
+    python examples/assorted_checks/benchmarks/benchmark_stages.py
+    python examples/assorted_checks/benchmarks/benchmark_stages.py --save-baseline
+    python examples/assorted_checks/benchmarks/benchmark_stages.py --stages trim_audio smart_split
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..", "..")))
+
+from api.src.inference.base import AudioChunk
+from api.src.services.audio import AudioNormalizer, AudioService
+from api.src.services.streaming_audio_writer import StreamingAudioWriter
+from api.src.services.text_processing import (
+    normalize_text,
+    phonemize,
+    smart_split,
+    tokenize,
+)
+from api.src.services.text_processing.phonemizer import clear_phoneme_cache
+from api.src.structures.schemas import NormalizationOptions
+
+DEFAULT_BASELINE = os.path.join(SCRIPT_DIR, "output_data", "stage_benchmark_baseline.json")
+SAMPLE_RATE = 24000
+WRITER_FORMATS = ["wav", "mp3", "opus", "flac", "aac", "pcm"]
+
+
+class Stage:
+    """One benchmarked stage.
+
+    ``setup`` builds fresh inputs outside the timed region for every run and
+    ``run`` is timed on them. ``amount`` is the work done per run, in ``unit``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        unit: str,
+        amount: int,
+        run: Callable[[Any], Any],
+        setup: Optional[Callable[[], Any]] = None,
+    ):
+        self.name = name
+        self.unit = unit
+        self.amount = amount
+        self.run = run
+        self.setup = setup or (lambda: None)
+
+
+def load_corpus(chars: int) -> str:
+    """Load the first ``chars`` characters of the benchmark text."""
+    with open(
+        os.path.join(SCRIPT_DIR, "the_time_machine_hg_wells.txt"), "r", encoding="utf-8"
+    ) as f:
+        return f.read()[:chars]
+
+
+def make_speech_like_audio(seconds: float, seed: int = 0) -> np.ndarray:
+    """Deterministic int16 signal with silent edges and voiced bursts."""
+    rng = np.random.default_rng(seed)
+    samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(samples) / SAMPLE_RATE
+    envelope = (np.sin(2 * np.pi * 3 * t) > 0).astype(np.float32)
+    voiced = np.sin(2 * np.pi * 180 * t) * 0.4 + rng.normal(0, 0.05, samples)
+    audio = (voiced * envelope).astype(np.float32)
+    # 300ms of silence at each end for the trimming stages to find
+    edge = int(0.3 * SAMPLE_RATE)
+    audio[:edge] = 0
+    audio[-edge:] = 0
+    return (audio * 32767).astype(np.int16)
+
+
+def build_stages(corpus_chars: int) -> List[Stage]:
+    """Build every stage on fixed inputs."""
+    text = load_corpus(corpus_chars)
+    g2p_text = text[:2000]
+    options = NormalizationOptions()
+    normalized = normalize_text(text, options)
+    phonemes = phonemize(normalized[:5000])
+    audio = make_speech_like_audio(10.0)
+    normalizer = AudioNormalizer()
+
+    async def split_all():
+        async for _ in smart_split(text, normalization_options=options):
+            pass
+
+    def fresh_phonemize():
+        # Measure espeak itself, not the phoneme cache
+        clear_phoneme_cache()
+
+    stages = [
+        Stage("normalize_text", "chars", len(text), lambda _: normalize_text(text, options)),
+        Stage("smart_split", "chars", len(text), lambda _: asyncio.run(split_all())),
+        Stage("phonemize", "chars", len(g2p_text), lambda _: phonemize(g2p_text), fresh_phonemize),
+        Stage("tokenize", "chars", len(phonemes), lambda _: tokenize(phonemes)),
+        Stage(
+            "find_first_last_non_silent",
+            "samples",
+            len(audio),
+            lambda _: normalizer.find_first_last_non_silent(audio, "Hello.", 1.0),
+        ),
+        Stage(
+            "trim_audio",
+            "samples",
+            len(audio),
+            lambda chunk: AudioService.trim_audio(chunk, "Hello.", 1.0, False, normalizer),
+            lambda: AudioChunk(audio.copy()),
+        ),
+    ]
+
+    # Ten one-second chunks per stream, finalized like a real response
+    writer_chunks = np.array_split(audio, 10)
+    for format in WRITER_FORMATS:
+
+        def write_stream(writer):
+            for chunk in writer_chunks:
+                writer.write_chunk(chunk)
+            writer.write_chunk(finalize=True)
+            writer.close()
+
+        stages.append(
+            Stage(
+                f"write_chunk[{format}]",
+                "samples",
+                len(audio),
+                write_stream,
+                lambda format=format: StreamingAudioWriter(format, sample_rate=SAMPLE_RATE),
+            )
+        )
+
+    # Half-second chunks, as a long non-streamed request produces
+    combine_chunks = [AudioChunk(chunk) for chunk in np.array_split(np.tile(audio, 12), 240)]
+    stages.append(
+        Stage(
+            "AudioChunk.combine",
+            "samples",
+            sum(len(chunk.audio) for chunk in combine_chunks),
+            lambda _: AudioChunk.combine(combine_chunks),
+        )
+    )
+
+    flashsr = load_flashsr()
+    if flashsr is not None:
+        stages.append(
+            Stage(
+                "flashsr_upsample",
+                "samples",
+                len(audio),
+                lambda _: flashsr.upsample_audio(audio, SAMPLE_RATE),
+            )
+        )
+    return stages
+
+
+def load_flashsr():
+    """Load the FlashSR model if it is available locally."""
+    try:
+        from api.src.services.flashsr_service import get_flashsr_service
+
+        service = asyncio.run(get_flashsr_service())
+    except Exception as e:
+        print(f"Skipping flashsr_upsample: {e}")
+        return None
+    if service is None or not service.is_available():
+        print("Skipping flashsr_upsample: FlashSR model not available")
+        return None
+    return service
+
+
+def measure(stage: Stage, repeat: int) -> Dict[str, Any]:
+    """Time a stage, returning its median time and throughput."""
+    # Warm up caches, lazy imports and codec initialization
+    stage.run(stage.setup())
+
+    times = []
+    for _ in range(repeat):
+        args = stage.setup()
+        start = time.perf_counter()
+        stage.run(args)
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {
+        "unit": stage.unit,
+        "amount": stage.amount,
+        "median_s": median,
+        "min_s": min(times),
+        "throughput": stage.amount / median if median > 0 else float("inf"),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Print results against the baseline and return the regressed stages."""
+    regressions = []
+    print(f"\n{'stage':<28} {'throughput':>16} {'baseline':>16} {'change':>9}")
+    for name, result in results.items():
+        unit = f"{result['unit']}/s"
+        current = f"{result['throughput']:,.0f} {unit}"
+        previous = baseline.get("stages", {}).get(name)
+        if previous is None:
+            print(f"{name:<28} {current:>16} {'-':>16} {'':>9}")
+            continue
+
+        change = result["throughput"] / previous["throughput"] - 1
+        flag = ""
+        if change < -tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(
+            f"{name:<28} {current:>16} {previous['throughput']:>12,.0f} {unit:<3}"
+            f" {change:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stages", nargs="*", help="Only run stages with these names")
+    parser.add_argument("--repeat", type=int, default=7, help="Timed runs per stage")
+    parser.add_argument("--corpus-chars", type=int, default=20000, help="Text corpus size")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Write results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Throughput drop vs. baseline reported as a regression",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any stage regressed",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for stage in build_stages(args.corpus_chars):
+        if args.stages and stage.name not in args.stages:
+            continue
+        print(f"Running {stage.name}...")
+        results[stage.name] = measure(stage, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(),
+                    "machine": platform.platform(),
+                    "python": platform.python_version(),
+                    "stages": {**baseline.get("stages", {}), **results},
+                },
+                f,
+                indent=2,
+            )
+        print(f"\nSaved baseline to {args.baseline}")
+    elif not baseline:
+        print("\nNo baseline found; run with --save-baseline to record one")
+
+    if regressions:
+        print(f"\nRegressed stages: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()